@@ -0,0 +1,157 @@
+"""Read the files of a zip or tar archive, without extracting the archive."""
+
+import os
+import posixpath
+import tarfile
+import zipfile
+
+from gator import constants
+from gator import walk
+
+# create the empty table of the opened archives, one for each archive and version
+archives = {}
+
+
+class ArchivePath:
+    """A file or directory in an archive that acts like a Path."""
+
+    def __init__(self, tree, path, member):
+        """Create the path for a member of an archive, which is None for a directory."""
+        self.tree = tree
+        self.path = path
+        self.member = member
+
+    def __str__(self):
+        """Return the path of the member, including the path to the archive."""
+        return posixpath.join(self.tree.archive_path, self.path)
+
+    def __repr__(self):
+        """Return a representation of the path that includes its archive."""
+        return "ArchivePath(" + str(self) + ")"
+
+    def __lt__(self, other):
+        """Order the paths by their names, just like a Path."""
+        return str(self) < str(other)
+
+    @property
+    def name(self):
+        """Return the name of the file or directory."""
+        return posixpath.basename(self.path)
+
+    @property
+    def version(self):
+        """Return the member in its tree, which is opened again when the archive changes."""
+        return self.tree, self.path
+
+    def is_file(self):
+        """Return True if the path is a file in the archive."""
+        return self.member is not None
+
+    def is_dir(self):
+        """Return True if the path is a directory in the archive."""
+        return self.member is None
+
+    def read_text(self):
+        """Return the contents of the file in the archive."""
+        return self.read_bytes().decode()
+
+    def read_bytes(self):
+        """Return the contents of the file in the archive as bytes."""
+        return self.tree.read_bytes(self.member)
+
+
+class ArchiveTree:
+    """The tree of files and directories in a zip or tar archive."""
+
+    def __init__(self, archive_path):
+        """Create the tree for the archive, listing all of its members at once."""
+        self.archive_path = archive_path
+        self.paths = {}
+        # only the list of members is read when the archive is opened, so a
+        # member is only decompressed when a check reads its contents
+        if is_zip(archive_path):
+            self.archive = zipfile.ZipFile(archive_path)
+            members = [
+                (member.filename, member)
+                for member in self.archive.infolist()
+                if not member.is_dir()
+            ]
+        else:
+            self.archive = tarfile.open(archive_path)
+            members = [
+                (member.name, member)
+                for member in self.archive.getmembers()
+                if member.isfile()
+            ]
+        for name, member in members:
+            path = posixpath.normpath(name.lstrip(posixpath.sep))
+            self.paths[path] = ArchivePath(self, path, member)
+            # an archive does not always store its directories, so create
+            # a directory for every directory that contains a member
+            directory = posixpath.dirname(path)
+            while directory and directory not in self.paths:
+                self.paths[directory] = ArchivePath(self, directory, None)
+                directory = posixpath.dirname(directory)
+
+    def read_bytes(self, member):
+        """Return the contents of a member, decompressing only that member."""
+        if isinstance(self.archive, zipfile.ZipFile):
+            return self.archive.read(member)
+        return self.archive.extractfile(member).read()
+
+    def glob(self, pattern_parts, excludes=None):
+        """Return the paths in the archive that match the parts of a glob, just like a walk."""
+        return walk.match_paths(self.paths, pattern_parts, excludes)
+
+
+def is_zip(name):
+    """Return True if the name is the name of a zip archive."""
+    return name.lower().endswith(constants.archives.Zip)
+
+
+def is_archive(name):
+    """Return True if the name is the name of a zip or tar archive."""
+    return is_zip(name) or name.lower().endswith(constants.archives.Tar)
+
+
+def find_archive(file_or_glob_path):
+    """Return the archive that contains the path and the parts inside of it, or None."""
+    parts = os.path.normpath(str(file_or_glob_path)).split(os.sep)
+    for index, part in enumerate(parts):
+        # only stat the parts of the path that are named like an archive
+        if is_archive(part):
+            archive_path = os.sep.join(parts[: index + 1]) or os.sep
+            if os.path.isfile(archive_path):
+                return archive_path, parts[index + 1 :]
+    return None
+
+
+def get_tree(archive_path):
+    """Return the tree of the archive, opening each version of the archive only once."""
+    archive_status = os.stat(archive_path)
+    # the archive is opened again when it is replaced or changed
+    archive_key = (
+        os.path.realpath(archive_path),
+        archive_status.st_mtime_ns,
+        archive_status.st_size,
+    )
+    if archive_key not in archives:
+        archives[archive_key] = ArchiveTree(archive_path)
+    return archives[archive_key]
+
+
+def create_paths(file_or_glob_path, excludes=None):
+    """Return the paths in an archive that match the path, or None if it is not in one."""
+    found_archive = find_archive(file_or_glob_path)
+    if found_archive is None:
+        return None
+    archive_path, pattern_parts = found_archive
+    # the path is the archive itself, not one of its members
+    if not pattern_parts:
+        return None
+    try:
+        tree = get_tree(archive_path)
+    # the file is named like an archive, but it is not one
+    except (zipfile.BadZipFile, tarfile.TarError):
+        return None
+    return tree.glob(pattern_parts, excludes)
@@ -5,6 +5,8 @@ from gator import constants
 from gator import description
 from gator import display
 from gator import files
+from gator import revision
+from gator import util
 
 import argparse
 
@@ -81,6 +83,45 @@ def parse(args):
         type=str,
     )
 
+    # REVISION: the commit whose files are checked instead of the working tree
+    # REQUIRED? No
+    # CORRECT WHEN: it names a commit in the repository containing the project
+    parser.add_argument(
+        constants.commandlines.Revision,
+        metavar=constants.metavars.Revision,
+        help=constants.help.Revision,
+        type=str,
+    )
+
+    # EXCLUDE: a directory that a "**" does not descend into
+    # REQUIRED? No
+    # CORRECT WHEN: always, only changes the files that globs match
+    parser.add_argument(
+        constants.commandlines.Exclude,
+        metavar=constants.metavars.Pattern,
+        help=constants.help.Exclude,
+        action="append",
+    )
+
+    # GITIGNORE: do not match the files that a .gitignore ignores?
+    # REQUIRED? No
+    # CORRECT WHEN: always, only changes the files that globs match
+    parser.add_argument(
+        constants.commandlines.Gitignore,
+        help=constants.help.Gitignore,
+        action="store_true",
+    )
+
+    # HISTORY: perform the check at every STEP-th commit in the repository's history
+    # REQUIRED? No
+    # CORRECT WHEN: the step is a positive number of commits
+    parser.add_argument(
+        constants.commandlines.History,
+        metavar=constants.metavars.Step,
+        help=constants.help.History,
+        type=int,
+    )
+
     # }}}
 
     # Required Positional Argument {{{
@@ -123,4 +164,16 @@ def verify(args):
         verified_arguments = verified_arguments and description.is_valid_description(
             args.description
         )
+    # REVISION: a commit whose files are checked instead of the working tree
+    # ENSURE: the revision names a commit in the repository containing the project
+    if args.revision is not None:
+        verified_arguments = (
+            verified_arguments
+            and revision.resolve_revision(args.revision, util.get_project_home())
+            is not None
+        )
+    # HISTORY: perform the check at every STEP-th commit in the repository's history
+    # ENSURE: the step is a positive number of commits
+    if args.history is not None:
+        verified_arguments = verified_arguments and args.history > 0
     return verified_arguments
@@ -0,0 +1,137 @@
+"""Cache the results of commands across the runs of GatorGrader."""
+
+import base64
+import hashlib
+import json
+import os
+
+from pathlib import Path
+
+from gator import constants
+from gator import files
+
+# define the names of the fields in a stored command result
+COMMAND = "command"
+OUTPUT = "output"
+ERROR = "error"
+CODE = "code"
+
+
+def get_cache_directory():
+    """Return the directory that stores the cached command results."""
+    # the environment variable for the cache is set, so use it as the cache home
+    cache_home = os.environ.get(constants.environmentvariables.Cache)
+    # the environment variable is not set, so use a directory inside of user's home
+    if not cache_home:
+        cache_home = str(files.create_path(constants.caches.Home, home=Path.home()))
+    return files.create_path(constants.caches.Directory, home=cache_home)
+
+
+def hash_inputs(inputs, home):
+    """Return a digest of the names and contents of all files matched by the inputs."""
+    digest = hashlib.sha256()
+    # iterate through the inputs in sorted order so that the digest does
+    # not depend on the order in which the globs were declared
+    for input_glob in sorted(inputs):
+        digest.update(input_glob.encode())
+        # a matched directory stands for all of the files inside of it, so
+        # also match everything below the directories that the glob matches
+        input_paths = {}
+        for file_or_glob in [
+            input_glob,
+            os.path.join(input_glob, constants.globs.Recursive),
+        ]:
+            for input_path in files.iterate_paths(file=file_or_glob, home=home):
+                # directories have no contents, so only the files influence the digest
+                if input_path.is_file():
+                    input_paths[str(input_path)] = input_path
+        # sort the matched files since glob does not guarantee an order
+        for name, input_path in sorted(input_paths.items()):
+            digest.update(name.encode())
+            digest.update(input_path.read_bytes())
+    return digest.hexdigest()
+
+
+def create_key(command, inputs, home):
+    """Return the key for a command that depends on the declared inputs."""
+    digest = hashlib.sha256()
+    digest.update(command.encode())
+    digest.update(hash_inputs(inputs, home).encode())
+    return digest.hexdigest()
+
+
+def get_entry_path(key):
+    """Return the path to the file that stores the result for the key."""
+    return files.create_path(
+        file=key + constants.caches.Suffix, home=get_cache_directory()
+    )
+
+
+def lookup(key):
+    """Return the cached (output, error, code) for the key or None if not cached."""
+    entry_path = get_entry_path(key)
+    # attempt to read the stored result for this key
+    try:
+        entry = json.loads(entry_path.read_text())
+        output = base64.b64decode(entry[OUTPUT])
+        error = base64.b64decode(entry[ERROR])
+        code = entry[CODE]
+    # the result was never stored or it was damaged, so it is not cached
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    # mark the entry as recently used so that eviction keeps it the longest,
+    # unless the cache cannot be written, which does not stop using the entry
+    try:
+        os.utime(entry_path)
+    except OSError:
+        pass
+    return output, error, code
+
+
+def store(key, command, output, error, code):
+    """Store the result of a command and then evict the least recently used results."""
+    # the output and error are bytes, so encode them to store them in JSON
+    entry = {
+        COMMAND: command,
+        OUTPUT: base64.b64encode(output).decode(),
+        ERROR: base64.b64encode(error).decode(),
+        CODE: code,
+    }
+    # the cache only saves time, so a cache that cannot be written does not
+    # stop a check; the result is then computed again by the next run
+    try:
+        get_cache_directory().mkdir(parents=True, exist_ok=True)
+        get_entry_path(key).write_text(json.dumps(entry))
+        evict()
+    except OSError:
+        return False
+    return True
+
+
+def evict(maximum_entries=constants.caches.Maximum_Entries):
+    """Delete the least recently used results so at most maximum_entries remain."""
+    cache_directory = get_cache_directory()
+    # there is no cache yet, so there is nothing to evict
+    if not cache_directory.is_dir():
+        return 0
+    entries = list(cache_directory.glob("*" + constants.caches.Suffix))
+    # order the entries so that the most recently used entries are first
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    evicted_entries = entries[maximum_entries:]
+    for entry in evicted_entries:
+        entry.unlink()
+    return len(evicted_entries)
+
+
+def invalidate(key):
+    """Delete the result for the key, returning True if a result was deleted."""
+    entry_path = get_entry_path(key)
+    if entry_path.is_file():
+        entry_path.unlink()
+        return True
+    return False
+
+
+def clear():
+    """Delete all of the cached command results."""
+    return evict(0)
@@ -0,0 +1,129 @@
+"""Check that a command runs within thresholds on its time and memory."""
+
+import argparse
+
+from gator import checkers
+from gator import constants
+from gator import invoke
+from gator import performance
+
+
+def get_parser():
+    """Get a parser for the arguments provided on the command-line."""
+    # create the parser with the default help formatter
+    # use a new description since this is a stand-alone check
+    parser = argparse.ArgumentParser(
+        prog="CommandPerformance",
+        description="Check Provided by GatorGrader: CommandPerformance",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+
+    # Required Named Checker Arguments {{{
+
+    required_group = parser.add_argument_group("required checker arguments")
+
+    # COMMAND: the command to execute
+    # REQUIRED? Yes
+    required_group.add_argument(
+        "--command", type=str, help="command to execute", required=True
+    )
+
+    # }}}
+
+    # Optional Named Checker Arguments {{{
+
+    optional_group = parser.add_argument_group("optional check arguments")
+
+    # RUNS: the number of measured runs of the command
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--runs",
+        type=int,
+        default=constants.performance.Runs,
+        help="how many measured runs of the command",
+    )
+
+    # WARMUP: the number of runs before the measured runs
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--warmup",
+        type=int,
+        default=constants.performance.Warmup,
+        help="how many runs of the command before measuring",
+    )
+
+    # PERCENTILE: the percentile of the measurements compared to the thresholds
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--percentile",
+        type=int,
+        default=constants.performance.Percentile,
+        help="percentile of the measurements (50 is the median)",
+    )
+
+    # WALL: the maximum number of seconds of wall time
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--wall", type=float, metavar="SECONDS", help="threshold on the wall time"
+    )
+
+    # CPU: the maximum number of seconds of CPU time
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--cpu", type=float, metavar="SECONDS", help="threshold on the CPU time"
+    )
+
+    # MEMORY: the maximum number of megabytes of peak memory
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--memory",
+        type=float,
+        metavar="MEGABYTES",
+        help="threshold on the peak memory",
+    )
+
+    # }}}
+    return parser
+
+
+def parse(args, parser=None):
+    """Use the parser on the provided arguments."""
+    if parser is None:
+        parser = get_parser()
+    check_parsed_arguments = checkers.parse(get_parser, args, parser)
+    # the command must be measured at least once and the percentile must
+    # pick one of the measurements, so reject the values that cannot work
+    if not 0 <= check_parsed_arguments.percentile <= 100:
+        parser.error("--percentile must be between 0 and 100")
+    if check_parsed_arguments.runs < 1:
+        parser.error("--runs must be at least 1")
+    if check_parsed_arguments.warmup < 0:
+        parser.error("--warmup must be at least 0")
+    return check_parsed_arguments
+
+
+# pylint: disable=unused-argument
+def act(main_parsed_arguments, check_remaining_arguments):
+    """Perform the action for this check."""
+    # extract the arguments for this check:
+    # --> command is required to specify the command to measure
+    # --> runs, warmup, and percentile are optional and have defaults
+    # --> wall, cpu, and memory are the optional thresholds on the measurements
+    check_parsed_arguments = parse(check_remaining_arguments)
+    # Directly run the check since at least one of the argument's for it is mandatory.
+    # This means that the use of check_CommandPerformance would have already failed by this
+    # point since argparse will exit the program if a command-line argument is not provided
+    thresholds = performance.create_thresholds(
+        check_parsed_arguments.wall,
+        check_parsed_arguments.cpu,
+        check_parsed_arguments.memory,
+    )
+    return [
+        invoke.invoke_all_command_performance_checks(
+            check_parsed_arguments.command,
+            check_parsed_arguments.runs,
+            check_parsed_arguments.warmup,
+            check_parsed_arguments.percentile,
+            thresholds,
+        )
+    ]
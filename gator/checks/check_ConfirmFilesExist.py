@@ -0,0 +1,82 @@
+"""Confirm that all of the required files exist in a directory."""
+
+import argparse
+
+from gator import checkers
+from gator import invoke
+
+
+def get_parser():
+    """Get a parser for the arguments provided on the command-line."""
+    # create the parser with the default help formatter
+    # use a new description since this is a stand-alone check
+    parser = argparse.ArgumentParser(
+        prog="ConfirmFilesExist",
+        description="Check Provided by GatorGrader: ConfirmFilesExist",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+
+    # Required Named Checker Arguments {{{
+
+    required_group = parser.add_argument_group("required checker arguments")
+
+    # DIRECTORY: the directory containing the files
+    # REQUIRED? Yes
+    required_group.add_argument(
+        "--directory",
+        type=str,
+        metavar="DIR",
+        help="directory with files for checking",
+        required=True,
+    )
+
+    # FILES or MANIFEST: the required files or a file that lists them
+    # REQUIRED? Yes, exactly one of them
+    files_group = required_group.add_mutually_exclusive_group(required=True)
+
+    files_group.add_argument(
+        "--files",
+        type=str,
+        nargs="+",
+        metavar="FILE",
+        help="files for checking",
+    )
+
+    files_group.add_argument(
+        "--manifest",
+        type=str,
+        help="file listing the files for checking, one on each line",
+    )
+
+    # }}}
+
+    # Optional Named Checker Arguments {{{
+
+    # None required for this checker
+
+    # }}}
+    return parser
+
+
+def parse(args, parser=None):
+    """Use the parser on the provided arguments."""
+    return checkers.parse(get_parser, args, parser)
+
+
+# pylint: disable=unused-argument
+def act(main_parsed_arguments, check_remaining_arguments):
+    """Perform the action for this check."""
+    # extract the arguments for this check:
+    # --> directory is the name of the directory that should contain the files
+    # --> files or manifest names the files for which the search is conducted
+    check_parsed_arguments = parse(check_remaining_arguments)
+    # Directly run the check since at least one of the argument's for it is mandatory.
+    # This means that the use of check_ConfirmFilesExist would have already failed by this
+    # point since argparse will exit the program if a command-line argument is not provided
+    return [
+        invoke.invoke_files_in_directory_check(
+            check_parsed_arguments.files,
+            check_parsed_arguments.directory,
+            check_parsed_arguments.manifest,
+        )
+    ]
@@ -50,6 +50,25 @@ def get_parser():
         action="store_true",
     )
 
+    # INPUTS: the files that the command reads, enabling the caching of its result
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--inputs",
+        type=str,
+        nargs="+",
+        metavar="GLOB",
+        help="files read by the command, caching its result until they change",
+    )
+
+    # REFRESH: run the command even when its result is cached
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--refresh",
+        help="invalidate the cached result of the command",
+        default=False,
+        action="store_true",
+    )
+
     # }}}
     return parser
 
@@ -73,4 +92,8 @@ def act(main_parsed_arguments, check_remaining_arguments):
     command = check_parsed_arguments.command
     count = check_parsed_arguments.count
     exact = check_parsed_arguments.exact
-    return [invoke.invoke_all_command_count_checks(command, count, exact)]
+    inputs = check_parsed_arguments.inputs
+    refresh = check_parsed_arguments.refresh
+    return [
+        invoke.invoke_all_command_count_checks(command, count, exact, inputs, refresh)
+    ]
@@ -0,0 +1,56 @@
+"""Check that every commit message in a repository has the required length."""
+
+import argparse
+
+from gator import checkers
+from gator import constants
+from gator import invoke
+
+
+def get_parser():
+    """Get a parser for the arguments provided on the command-line."""
+    # create the parser with the default help formatter
+    # use a new description since this is a stand-alone check
+    parser = argparse.ArgumentParser(
+        prog="CountCommitMessageLength",
+        description="Check Provided by GatorGrader: CountCommitMessageLength",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+
+    # Required Named Checker Arguments {{{
+
+    required_group = parser.add_argument_group("required check arguments")
+
+    # COUNT: the number of characters in every commit message
+    # REQUIRED? Yes
+    required_group.add_argument(
+        "--count",
+        type=int,
+        help="minimum number of characters in every commit message",
+        required=True,
+    )
+
+    # }}}
+    return parser
+
+
+def parse(args, parser=None):
+    """Use the parser on the provided arguments."""
+    return checkers.parse(get_parser, args, parser)
+
+
+# pylint: disable=unused-argument
+def act(main_parsed_arguments, check_remaining_arguments):
+    """Perform the action for this check."""
+    # extract the argument for this check:
+    # --> count is required to specify the message length threshold
+    check_parsed_arguments = parse(check_remaining_arguments)
+    # Directly run the check since the argument for it is mandatory.
+    # This means that the use of check_CountCommitMessageLength would have already failed by
+    # this point since argparse will exit the program if the command-line argument is not provided
+    count = check_parsed_arguments.count
+    return [
+        invoke.invoke_commit_message_length_check(
+            constants.paths.Current_Directory, count
+        )
+    ]
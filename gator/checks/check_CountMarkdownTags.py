@@ -22,11 +22,15 @@ def get_parser():
 
     required_group = parser.add_argument_group("required checker arguments")
 
-    # TAG: the markdown tag that must exist in the file
+    # TAG: the markdown tag that must exist in the file, given once for each tag
     # REQUIRED? Yes
     # https://github.com/readthedocs/commonmark.py
     required_group.add_argument(
-        "--tag", type=str, help="markdown tag that exists in a file", required=True
+        "--tag",
+        type=str,
+        action="append",
+        help="markdown tag that exists in a file, paired with a count",
+        required=True,
     )
 
     # FILE: the file
@@ -45,10 +49,14 @@ def get_parser():
         required=True,
     )
 
-    # COUNT: the number of lines of output
+    # COUNT: the number of instances of the tag, given once for each tag
     # REQUIRED? Yes
     required_group.add_argument(
-        "--count", type=int, help="how many tag instances should exist", required=True
+        "--count",
+        type=int,
+        action="append",
+        help="how many tag instances should exist, paired with a tag",
+        required=True,
     )
 
     # }}}
@@ -66,6 +74,15 @@ def get_parser():
         action="store_true",
     )
 
+    # STOP_EARLY: stop counting once the minimum number is found (i.e., not with "--exact")
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--stop-early",
+        help="stop counting at the minimum number, unless it is exact",
+        default=False,
+        action="store_true",
+    )
+
     # }}}
 
     # add an epilog to list some of the available tags
@@ -81,25 +98,38 @@ def get_parser():
 
 def parse(args, parser=None):
     """Use the parser on the provided arguments."""
-    return checkers.parse(get_parser, args, parser)
+    if parser is None:
+        parser = get_parser()
+    check_parsed_arguments = checkers.parse(get_parser, args, parser)
+    # each tag must be paired with the count of its instances
+    if len(check_parsed_arguments.tag) != len(check_parsed_arguments.count):
+        parser.error("each --tag must be paired with a --count")
+    return check_parsed_arguments
 
 
 # pylint: disable=unused-argument
 def act(main_parsed_arguments, check_remaining_arguments):
     """Perform the action for this check."""
-    # extract the two arguments for this check:
+    # extract the arguments for this check:
     # --> tag is the Markdown tag for which the search is perform (e.g., "code" tag)
-    # --> count is required to specify the expected number of lines in the file
+    # --> count is required to specify the expected number of instances of the tag
+    # --> tag and count can be given many times, pairing them in their order
     # --> file is the name of the file for which the search is conducted
     # --> directory is the name of the directory that should contain the specified file
     # --> exact is optional, but will either be True or False and False by default
+    # --> stop_early is optional, stopping the count at the minimum when not exact
     check_parsed_arguments = parse(check_remaining_arguments)
     # Directly run the check since at least one of the argument's for it is mandatory.
     # This means that the use of check_CountMarkdownTags would have already failed by this
     # point since argparse will exit the program if a command-line argument is not provided.
-    tag = check_parsed_arguments.tag
-    count = check_parsed_arguments.count
+    tags = check_parsed_arguments.tag
+    counts = check_parsed_arguments.count
     file = check_parsed_arguments.file
     directory = check_parsed_arguments.directory
     exact = check_parsed_arguments.exact
-    return [invoke.invoke_all_markdown_checks(tag, count, file, directory, exact)]
+    stop_early = check_parsed_arguments.stop_early
+    return [
+        invoke.invoke_all_markdown_tags_checks(
+            tags, counts, file, directory, exact, stop_early
+        )
+    ]
@@ -46,13 +46,13 @@ def get_parser():
         required=True,
     )
 
-    # LANGUAGE: whether the check is for multiple-line comments in Java or Python
+    # LANGUAGE: the programming language of the multiple-line comments
     # REQUIRED? Yes
     required_group.add_argument(
         "--language",
         type=str,
         metavar="LANG",
-        choices=[constants.languages.Java, constants.languages.Python],
+        choices=list(constants.languages),
         help="language for the multiple-line comments",
     )
 
@@ -46,12 +46,13 @@ def get_parser():
         required=True,
     )
 
-    # LANGUAGE: whether the check is for single-line comments in Java or Python
+    # LANGUAGE: the programming language of the single-line comments
     # REQUIRED? Yes
     required_group.add_argument(
         "--language",
         type=str,
-        choices=[constants.languages.Java, constants.languages.Python],
+        metavar="LANG",
+        choices=list(constants.languages),
         help="language for the single-line comments",
     )
 
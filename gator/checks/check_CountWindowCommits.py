@@ -0,0 +1,99 @@
+"""Check that a repository has the required number of commits between two dates."""
+
+import argparse
+
+from gator import checkers
+from gator import constants
+from gator import history
+from gator import invoke
+
+
+def get_parser():
+    """Get a parser for the arguments provided on the command-line."""
+    # create the parser with the default help formatter
+    # use a new description since this is a stand-alone check
+    parser = argparse.ArgumentParser(
+        prog="CountWindowCommits",
+        description="Check Provided by GatorGrader: CountWindowCommits",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+
+    # Required Named Checker Arguments {{{
+
+    required_group = parser.add_argument_group("required check arguments")
+
+    # COUNT: the number of commits
+    # REQUIRED? Yes
+    required_group.add_argument(
+        "--count", type=int, help="minimum number of git commits", required=True
+    )
+
+    # }}}
+
+    # Optional Named Checker Arguments {{{
+
+    optional_group = parser.add_argument_group("optional check arguments")
+
+    # SINCE: the earliest date of a commit (e.g., "2019-09-01")
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--since", type=str, metavar="DATE", help="earliest date of the commits"
+    )
+
+    # UNTIL: the latest date of a commit (e.g., "2019-09-30")
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--until", type=str, metavar="DATE", help="latest date of the commits"
+    )
+
+    # EXACT: perform exact checking for commit counts (i.e,. "==" instead of ">=")
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--exact",
+        help="equals instead of a minimum number",
+        default=False,
+        action="store_true",
+    )
+
+    # }}}
+    return parser
+
+
+def parse(args, parser=None):
+    """Use the parser on the provided arguments."""
+    if parser is None:
+        parser = get_parser()
+    check_parsed_arguments = checkers.parse(get_parser, args, parser)
+    # the dates of the window must be dates like "2019-09-01" or "2019-09-01T09:00"
+    for option, date in (
+        ("--since", check_parsed_arguments.since),
+        ("--until", check_parsed_arguments.until),
+    ):
+        if date is not None:
+            try:
+                history.get_timestamp(date)
+            except ValueError:
+                parser.error(option + " must be a date like 2019-09-01, not " + date)
+    return check_parsed_arguments
+
+
+# pylint: disable=unused-argument
+def act(main_parsed_arguments, check_remaining_arguments):
+    """Perform the action for this check."""
+    # extract the four arguments for this check:
+    # --> count is required to specify the commit count threshold
+    # --> since and until are optional and specify the dates of the window
+    # --> exact is optional, but will either be True or False and False by default
+    check_parsed_arguments = parse(check_remaining_arguments)
+    # Directly run the check since at least one of the argument's for it is mandatory.
+    # This means that the use of check_CountWindowCommits would have already failed by this
+    # point since argparse will exit the program if the command-line argument is not provided
+    count = check_parsed_arguments.count
+    since = check_parsed_arguments.since
+    until = check_parsed_arguments.until
+    exact = check_parsed_arguments.exact
+    return [
+        invoke.invoke_window_commits_check(
+            constants.paths.Current_Directory, count, since, until, exact
+        )
+    ]
@@ -3,7 +3,9 @@
 import argparse
 
 from gator import checkers
+from gator import constants
 from gator import invoke
+from gator import run
 
 
 def get_parser():
@@ -30,7 +32,50 @@ def get_parser():
 
     # Optional Named Checker Arguments {{{
 
-    # None required for this checker
+    optional_group = parser.add_argument_group("optional check arguments")
+
+    # INPUTS: the files that the command reads, enabling the caching of its result
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--inputs",
+        type=str,
+        nargs="+",
+        metavar="GLOB",
+        help="files read by the command, caching its result until they change",
+    )
+
+    # REFRESH: run the command even when its result is cached
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--refresh",
+        help="invalidate the cached result of the command",
+        default=False,
+        action="store_true",
+    )
+
+    # CPU: the maximum number of seconds of CPU time for the command
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--cpu", type=int, metavar="SECONDS", help="limit on the CPU time of command"
+    )
+
+    # MEMORY: the maximum number of megabytes of memory for the command
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--memory", type=int, metavar="MEGABYTES", help="limit on memory of command"
+    )
+
+    # FILES: the maximum number of files that the command can open
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--files", type=int, help="limit on the open files of command"
+    )
+
+    # PROCESSES: the maximum number of processes that the command can create
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--processes", type=int, help="limit on the processes of command's user"
+    )
 
     # }}}
     return parser
@@ -38,7 +83,20 @@ def get_parser():
 
 def parse(args, parser=None):
     """Use the parser on the provided arguments."""
-    return checkers.parse(get_parser, args, parser)
+    if parser is None:
+        parser = get_parser()
+    check_parsed_arguments = checkers.parse(get_parser, args, parser)
+    # a limit of zero or less would stop the command before it could do anything
+    for limit in [
+        constants.limits.Cpu,
+        constants.limits.Memory,
+        constants.limits.Files,
+        constants.limits.Processes,
+    ]:
+        limit_value = getattr(check_parsed_arguments, limit)
+        if limit_value is not None and limit_value < 1:
+            parser.error("--" + limit + " must be at least 1")
+    return check_parsed_arguments
 
 
 # pylint: disable=unused-argument
@@ -51,4 +109,13 @@ def act(main_parsed_arguments, check_remaining_arguments):
     # This means that the use of check_ExecuteCommand would have already failed by this
     # point since argparse will exit the program if a command-line argument is not provided
     command = check_parsed_arguments.command
-    return [invoke.invoke_all_command_executes_checks(command)]
+    inputs = check_parsed_arguments.inputs
+    refresh = check_parsed_arguments.refresh
+    # the limits protect the grader from a command that uses too many resources
+    limits = run.create_limits(
+        check_parsed_arguments.cpu,
+        check_parsed_arguments.memory,
+        check_parsed_arguments.files,
+        check_parsed_arguments.processes,
+    )
+    return [invoke.invoke_all_command_executes_checks(command, inputs, refresh, limits)]
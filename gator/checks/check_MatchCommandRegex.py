@@ -56,6 +56,34 @@ def get_parser():
         action="store_true",
     )
 
+    # STOP_EARLY: stop counting once the minimum number is found (i.e., not with "--exact")
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--stop-early",
+        help="stop counting at the minimum number, unless it is exact",
+        default=False,
+        action="store_true",
+    )
+
+    # INPUTS: the files that the command reads, enabling the caching of its result
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--inputs",
+        type=str,
+        nargs="+",
+        metavar="GLOB",
+        help="files read by the command, caching its result until they change",
+    )
+
+    # REFRESH: run the command even when its result is cached
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--refresh",
+        help="invalidate the cached result of the command",
+        default=False,
+        action="store_true",
+    )
+
     # }}}
     return parser
 
@@ -73,6 +101,7 @@ def act(main_parsed_arguments, check_remaining_arguments):
     # --> regex is the regular expression that should match the command's output
     # --> count is required to specify the number of matches in regular expressions
     # --> exact is optional, but will either be True or False and False by default
+    # --> stop_early is optional, stopping the count at the minimum when not exact
     check_parsed_arguments = parse(check_remaining_arguments)
     # Directly run the check since at least one of the argument's for it is mandatory.
     # This means that the use of check_MatchCommandRegex would have already failed by this
@@ -81,4 +110,11 @@ def act(main_parsed_arguments, check_remaining_arguments):
     regex = check_parsed_arguments.regex
     count = check_parsed_arguments.count
     exact = check_parsed_arguments.exact
-    return [invoke.invoke_all_command_regex_checks(command, regex, count, exact)]
+    stop_early = check_parsed_arguments.stop_early
+    inputs = check_parsed_arguments.inputs
+    refresh = check_parsed_arguments.refresh
+    return [
+        invoke.invoke_all_command_regex_checks(
+            command, regex, count, exact, inputs, refresh, stop_early
+        )
+    ]
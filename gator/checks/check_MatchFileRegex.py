@@ -67,6 +67,15 @@ def get_parser():
         action="store_true",
     )
 
+    # STOP_EARLY: stop counting once the minimum number is found (i.e., not with "--exact")
+    # REQUIRED? No
+    optional_group.add_argument(
+        "--stop-early",
+        help="stop counting at the minimum number, unless it is exact",
+        default=False,
+        action="store_true",
+    )
+
     # }}}
     return parser
 
@@ -85,6 +94,7 @@ def act(main_parsed_arguments, check_remaining_arguments):
     # --> directory is the name of the directory that should contain the specified file
     # --> count is required to specify the number of fragments to appear in the output
     # --> exact is optional, but will either be True or False and False by default
+    # --> stop_early is optional, stopping the count at the minimum when not exact
     check_parsed_arguments = parse(check_remaining_arguments)
     # Directly run the check since at least one of the argument's for it is mandatory.
     # This means that the use of check_MatchFileRegex would have already failed by this
@@ -94,8 +104,15 @@ def act(main_parsed_arguments, check_remaining_arguments):
     file = check_parsed_arguments.file
     directory = check_parsed_arguments.directory
     exact = check_parsed_arguments.exact
+    stop_early = check_parsed_arguments.stop_early
     return [
         invoke.invoke_all_regex_checks(
-            regex, count, file, directory, constants.markers.Nothing, exact
+            regex,
+            count,
+            file,
+            directory,
+            constants.markers.Nothing,
+            exact,
+            stop_early,
         )
     ]
@@ -1,6 +1,10 @@
 """Utility functions that check the comments of a file."""
 
+import collections
+import hashlib
+import io
 import re
+import tokenize
 
 from gator import constants
 
@@ -16,34 +20,374 @@ SINGLELINECOMMENT_RE_PYTHON = r"""^(?:[^"#\\]|\"(?:[^\"\\]|\\.)*\"|
 /(?:[^#"\\]|\\.)|/\"(?:[^\"\\]|\\.)*\"|\\.)*#(.*)$"""
 MULTILINECOMMENT_RE_PYTHON = r'^[ \t]*"""(.*?)"""[ \t]*$'
 
+# define the tokens that can come before a string that stands on its own line
+PYTHON_LINE_START_TOKENS = {
+    tokenize.DEDENT,
+    tokenize.ENCODING,
+    tokenize.INDENT,
+    tokenize.NEWLINE,
+    tokenize.NL,
+}
+
+# define the tokens that can come after a string that stands on its own line
+PYTHON_LINE_END_TOKENS = {tokenize.ENDMARKER, tokenize.NEWLINE}
+
+# define the quotes that start a triple-quoted Python string and its prefixes
+PYTHON_TRIPLE_QUOTES = ('"""', "'''")
+PYTHON_STRING_PREFIXES = "bBfFrRuU"
+
+# create the empty table of the counts of Python comments, one for each digest of code
+python_comment_counts = {}
+
+# define the syntax of the comments and the literals of a programming language:
+# --> token: the expression that finds the next comment or literal
+# --> singleline: the expression for the start of a singleline comment
+# --> multiline: the expression for the start of a multiline comment
+# --> multiline_ends: the end of the multiline comment for each of its starts
+# --> nested: whether or not the multiline comments nest
+# --> overlapping: whether or not each kind of comment can start inside of the other
+# --> scanner: the function that counts the comments instead of the table
+CommentSyntax = collections.namedtuple(
+    "CommentSyntax",
+    [
+        "token",
+        "singleline",
+        "multiline",
+        "multiline_ends",
+        "nested",
+        "overlapping",
+        "scanner",
+    ],
+)
+
+# define the names of the groups in the expression that finds the next token
+SINGLELINE = "singleline"
+MULTILINE = "multiline"
+LITERAL = "literal"
+
+# define the expression that never matches, for a language without a kind of comment
+NEVER_RE = r"(?!)"
+
+# define the characters before a singleline comment that must start a word
+WORD_START_RE = r"(?:^|(?<=[\s;&|()<>]))"
+
+
+def create_syntax(
+    singleline=(),
+    multiline=(),
+    literals=(),
+    nested=False,
+    overlapping=False,
+    word_start=False,
+    scanner=None,
+):
+    """Create the syntax of a language from its delimiters and the expressions for its literals."""
+    # longer delimiters come first so that, for instance, "///" is not "//"
+    singleline_re = (
+        "|".join(
+            re.escape(start) for start in sorted(singleline, key=len, reverse=True)
+        )
+        or NEVER_RE
+    )
+    if word_start:
+        singleline_re = WORD_START_RE + "(?:" + singleline_re + ")"
+    multiline_re = (
+        "|".join(
+            re.escape(start)
+            for start, _ in sorted(
+                multiline, key=lambda pair: len(pair[0]), reverse=True
+            )
+        )
+        or NEVER_RE
+    )
+    literal_re = "|".join(literals) or NEVER_RE
+    # the first group that matches at the earliest index is the next token
+    token_re = (
+        "(?P<" + SINGLELINE + ">" + singleline_re + ")"
+        "|(?P<" + MULTILINE + ">" + multiline_re + ")"
+        "|(?P<" + LITERAL + ">" + literal_re + ")"
+    )
+    return CommentSyntax(
+        re.compile(token_re, re.MULTILINE),
+        re.compile(singleline_re, re.MULTILINE),
+        re.compile(multiline_re),
+        dict(multiline),
+        nested,
+        overlapping,
+        scanner,
+    )
+
+
+def get_line_end(contents, index):
+    """Return the index of the newline that ends the line containing the index."""
+    line_end = contents.find(constants.markers.Newline, index)
+    return len(contents) if line_end == -1 else line_end
+
+
+def find_multiline_end(contents, syntax, start, delimiter):
+    """Return the index after the multiline comment that starts at the index, or -1."""
+    end_delimiter = syntax.multiline_ends[delimiter]
+    index = start + len(delimiter)
+    if not syntax.nested:
+        end = contents.find(end_delimiter, index)
+        return -1 if end == -1 else end + len(end_delimiter)
+    # each start inside of a nested comment must have its own end
+    delimiters_re = re.compile(re.escape(delimiter) + "|" + re.escape(end_delimiter))
+    depth = 1
+    while depth:
+        found = delimiters_re.search(contents, index)
+        if found is None:
+            return -1
+        depth = depth + 1 if found.group() == delimiter else depth - 1
+        index = found.end()
+    return index
+
+
+def count_comment_lines(contents, syntax, start, end, counted_line_end):
+    """Count the lines between the indices with a singleline comment not yet counted."""
+    count = 0
+    found = syntax.singleline.search(contents, start, end)
+    while found is not None:
+        line_end = get_line_end(contents, found.start())
+        # a line has at most one singleline comment
+        if line_end != counted_line_end:
+            count = count + 1
+            counted_line_end = line_end
+        found = syntax.singleline.search(contents, line_end, end)
+    return count, counted_line_end
+
+
+def scan_comments(contents, syntax):
+    """Count the singleline and multiline comments in the code in one pass."""
+    # the language has its own way to count its comments
+    if syntax.scanner is not None:
+        return syntax.scanner(contents)
+    # The scanner jumps from one token that could start a comment or a literal to
+    # the next and it never backtracks; each literal has only one way to match its
+    # text, so the scanner examines each character a bounded number of times. A
+    # comment never starts inside of a literal and, unless the syntax says that
+    # comments overlap, a comment does not start inside of another comment.
+    singleline_count = 0
+    multiline_count = 0
+    # the end of the last line with a counted singleline comment
+    counted_line_end = -1
+    index = 0
+    while True:
+        token = syntax.token.search(contents, index)
+        if token is None:
+            break
+        if token.lastgroup == LITERAL:
+            index = max(token.end(), token.start() + 1)
+            continue
+        start = token.start()
+        delimiter = token.group()
+        line_comment_end = None
+        if token.lastgroup == SINGLELINE:
+            line_comment_end = get_line_end(contents, start)
+            if line_comment_end != counted_line_end:
+                singleline_count = singleline_count + 1
+                counted_line_end = line_comment_end
+            index = line_comment_end
+            if not syntax.overlapping:
+                continue
+            # a multiline comment can start inside of the singleline comment
+            found = syntax.multiline.search(contents, start, line_comment_end)
+            if found is None:
+                continue
+            start = found.start()
+            delimiter = found.group()
+        # a multiline comment starts at the index, perhaps in a singleline comment
+        while start != -1:
+            end = find_multiline_end(contents, syntax, start, delimiter)
+            if syntax.overlapping:
+                count, counted_line_end = count_comment_lines(
+                    contents,
+                    syntax,
+                    start,
+                    len(contents) if end == -1 else end,
+                    counted_line_end,
+                )
+                singleline_count = singleline_count + count
+            # an unterminated multiline comment is not a comment,
+            # but the rest of the file is still inside of it
+            if end == -1:
+                return singleline_count, multiline_count
+            multiline_count = multiline_count + 1
+            index = end
+            start = -1
+            # the multiline comment ended before the singleline comment that
+            # contains it, so the rest of the line is still a comment
+            if line_comment_end is not None and index < line_comment_end:
+                found = syntax.multiline.search(contents, index, line_comment_end)
+                if found is None:
+                    index = line_comment_end
+                else:
+                    start = found.start()
+                    delimiter = found.group()
+    return singleline_count, multiline_count
+
+
+def scan_java_comments(contents):
+    """Count the singleline and multiline Java comments in the code in one pass."""
+    return scan_comments(contents, LANGUAGES[constants.languages.Java])
+
 
 def count_singleline_java_comment(contents):
     """Count the number of singleline Java comments in the code."""
-    pattern = re.compile(SINGLELINECOMMENT_RE_JAVA, re.MULTILINE | re.VERBOSE)
-    matches = pattern.findall(contents)
-    matches_count = len(matches)
+    matches_count, _ = scan_java_comments(contents)
     return matches_count, {constants.markers.First: matches_count}
 
 
 def count_singleline_python_comment(contents):
     """Count the number of singleline Python comments in the code."""
-    pattern = re.compile(SINGLELINECOMMENT_RE_PYTHON, re.MULTILINE)
-    matches = pattern.findall(contents)
-    matches_count = len(matches)
+    matches_count, _ = get_python_comment_counts(contents)
     return matches_count, {constants.markers.First: matches_count}
 
 
 def count_multiline_java_comment(contents):
     """Count the number of multiline Java comments in the code."""
-    pattern = re.compile(MULTILINECOMMENT_RE_JAVA, re.MULTILINE)
-    matches = pattern.findall(contents)
-    matches_count = len(matches)
+    _, matches_count = scan_java_comments(contents)
     return matches_count, {constants.markers.First: matches_count}
 
 
 def count_multiline_python_comment(contents):
     """Count the number of multiline Python comments in the code."""
-    pattern = re.compile(MULTILINECOMMENT_RE_PYTHON, re.MULTILINE | re.DOTALL)
-    matches = pattern.findall(contents)
-    matches_count = len(matches)
+    _, matches_count = get_python_comment_counts(contents)
     return matches_count, {constants.markers.First: matches_count}
+
+
+def scan_python_comments(contents):
+    """Count the singleline and multiline Python comments in the tokens of the code."""
+    singleline_count = 0
+    multiline_count = 0
+    previous_type = None
+    standalone_string = False
+    for token in tokenize.generate_tokens(io.StringIO(contents).readline):
+        # the tokenizer could not understand the code, so it has a syntax error
+        if token.type == tokenize.ERRORTOKEN:
+            raise tokenize.TokenError("invalid token", token.start)
+        # each comment token is the remainder of a line after a "#"
+        if token.type == tokenize.COMMENT:
+            singleline_count = singleline_count + 1
+            continue
+        # a triple-quoted string that is alone on its line, like a docstring,
+        # is a multiline comment, while one in an expression is not
+        if standalone_string and token.type in PYTHON_LINE_END_TOKENS:
+            multiline_count = multiline_count + 1
+        standalone_string = (
+            token.type == tokenize.STRING
+            and (previous_type is None or previous_type in PYTHON_LINE_START_TOKENS)
+            and token.string.lstrip(PYTHON_STRING_PREFIXES).startswith(
+                PYTHON_TRIPLE_QUOTES
+            )
+        )
+        previous_type = token.type
+    return singleline_count, multiline_count
+
+
+def count_python_comments_with_regexes(contents):
+    """Count the singleline and multiline Python comments in the code with regexes."""
+    singleline_pattern = re.compile(SINGLELINECOMMENT_RE_PYTHON, re.MULTILINE)
+    multiline_pattern = re.compile(MULTILINECOMMENT_RE_PYTHON, re.MULTILINE | re.DOTALL)
+    return (
+        len(singleline_pattern.findall(contents)),
+        len(multiline_pattern.findall(contents)),
+    )
+
+
+def get_python_comment_counts(contents):
+    """Return the counts of the Python comments, counting each version of the code once."""
+    digest = hashlib.sha256(contents.encode(errors="surrogatepass")).hexdigest()
+    if digest not in python_comment_counts:
+        # the code has a syntax error that stops the tokenizer,
+        # so count its comments with the regular expressions instead
+        try:
+            python_comment_counts[digest] = scan_python_comments(contents)
+        except (tokenize.TokenError, SyntaxError):
+            python_comment_counts[digest] = count_python_comments_with_regexes(contents)
+    return python_comment_counts[digest]
+
+
+def count_comments(contents, language):
+    """Count the singleline and multiline comments in the code in the language."""
+    return scan_comments(contents, LANGUAGES[language])
+
+
+# define the expressions for the literals, where each has only one way to match its
+# text so that it never backtracks and an unterminated literal runs to the end of
+# the file or, when the literal cannot contain a newline, to the end of its line
+DOUBLE_QUOTED_RE = r'"[^"\\\n]*(?:\\[\s\S][^"\\\n]*)*"?'
+DOUBLE_QUOTED_LINES_RE = r'"[^"\\]*(?:\\[\s\S][^"\\]*)*"?'
+SINGLE_QUOTED_RE = r"'[^'\\\n]*(?:\\[\s\S][^'\\\n]*)*'?"
+SINGLE_QUOTED_RAW_RE = r"'[^']*'?"
+BACKQUOTED_RE = r"`[^`\\]*(?:\\[\s\S][^`\\]*)*`?"
+BACKQUOTED_RAW_RE = r"`[^`]*`?"
+JAVA_TEXT_BLOCK_RE = r'"""[^"\\]*(?:(?:\\[\s\S]|"(?!""))[^"\\]*)*(?:""")?'
+CPP_RAW_STRING_RE = r'R"(?P<delimiter>[^()\\\s]{0,16})\([\s\S]*?\)(?P=delimiter)"'
+RUST_RAW_STRING_RE = r'(?<!\w)b?r(?P<hashes>#*)"[\s\S]*?"(?P=hashes)'
+# a quote that does not start a character, like in Rust's 'a lifetime, is skipped
+RUST_CHARACTER_RE = r"b?'(?:[^'\\\n]|\\(?:u\{[0-9a-fA-F]{1,6}\}|x[0-9a-fA-F]{2}|.))'"
+
+# define the table of the syntax of the comments in each programming language
+LANGUAGES = {
+    constants.languages.C: create_syntax(
+        singleline=["//"],
+        multiline=[("/*", "*/")],
+        literals=[DOUBLE_QUOTED_RE, SINGLE_QUOTED_RE],
+    ),
+    constants.languages.Cpp: create_syntax(
+        singleline=["//"],
+        multiline=[("/*", "*/")],
+        literals=[CPP_RAW_STRING_RE, DOUBLE_QUOTED_RE, SINGLE_QUOTED_RE],
+    ),
+    constants.languages.Go: create_syntax(
+        singleline=["//"],
+        multiline=[("/*", "*/")],
+        literals=[DOUBLE_QUOTED_RE, SINGLE_QUOTED_RE, BACKQUOTED_RAW_RE],
+    ),
+    # like the regular expressions that the table replaced, a Java string may
+    # continue onto the next line and the two kinds of comments overlap
+    constants.languages.Java: create_syntax(
+        singleline=["//"],
+        multiline=[("/*", "*/")],
+        literals=[JAVA_TEXT_BLOCK_RE, DOUBLE_QUOTED_LINES_RE, SINGLE_QUOTED_RE],
+        overlapping=True,
+    ),
+    constants.languages.JavaScript: create_syntax(
+        singleline=["//"],
+        multiline=[("/*", "*/")],
+        literals=[DOUBLE_QUOTED_RE, SINGLE_QUOTED_RE, BACKQUOTED_RE],
+    ),
+    # Python's comments are counted in the tokens of the code
+    constants.languages.Python: create_syntax(scanner=get_python_comment_counts),
+    constants.languages.Rust: create_syntax(
+        singleline=["//"],
+        multiline=[("/*", "*/")],
+        literals=[RUST_RAW_STRING_RE, DOUBLE_QUOTED_LINES_RE, RUST_CHARACTER_RE],
+        nested=True,
+    ),
+    # a "#" only starts a comment at the start of a word in the shell
+    constants.languages.Shell: create_syntax(
+        singleline=["#"],
+        literals=[DOUBLE_QUOTED_LINES_RE, SINGLE_QUOTED_RAW_RE],
+        word_start=True,
+    ),
+}
+
+
+def create_comment_metrics(language):
+    """Create the function that computes the record of comment counts in the language."""
+
+    def compute_comment_metrics(contents):
+        """Compute the counts of each type of comment in the code with one scan."""
+        singleline_count, multiline_count = count_comments(contents, language)
+        return {
+            constants.comments.Single_Line: singleline_count,
+            constants.comments.Multiple_Line: multiline_count,
+        }
+
+    return compute_comment_metrics
+
+
+# define the functions that compute the record of comment counts in each language
+METRICS = {language: create_comment_metrics(language) for language in LANGUAGES}
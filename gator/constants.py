@@ -15,11 +15,20 @@ def create_constants(name, *args, **kwargs):
     return new_constants(*itertools.chain(args, kwargs.values()))
 
 
+# define the archives whose members can be checked without extracting them:
+# --> Tar: the file extensions of a tar archive, which may be compressed
+# --> Zip: the file extensions of a zip archive
+archives = create_constants(
+    "archives",
+    Tar=(".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz"),
+    Zip=(".zip",),
+)
+
 # define the arguments
 arguments = create_constants("arguments", Incorrect=2, Void=[])
 
 # define the codes for return values
-codes = create_constants("codes", Error=1, Success=0, No_Words=0)
+codes = create_constants("codes", Error=1, Success=0, No_Words=0, Timeout=124)
 
 # define details about the checkers
 checkers = create_constants(
@@ -43,19 +52,62 @@ commandlines = create_constants(
     List_Checks="--listchecks",
     No_Welcome="--nowelcome",
     Description="--description",
+    Exclude="--exclude",
+    Gitignore="--gitignore",
+    History="--history",
+    Revision="--revision",
+)
+
+# define the backends that can run a command:
+# --> Process: start a new process (and a shell, only if needed) for each command
+# --> Shell: send each command to a long-lived shell for its working directory
+backends = create_constants("backends", Process="process", Shell="shell")
+
+# define the details about the cache of command results:
+# --> Directory: the sub-directory of the cache home that stores command results
+# --> Home: the directory, inside of the user's home, that is the default cache home
+# --> Maximum_Entries: the number of results kept before the least recently used are evicted
+# --> Suffix: the file extension for each of the stored command results
+caches = create_constants(
+    "caches",
+    Directory="commands",
+    Home=".cache/gatorgrader",
+    Maximum_Entries=256,
+    Suffix=".json",
 )
 
+# define the limits on the work that GatorGrader performs at the same time:
+# --> Repositories: the number of repositories whose commits may be counted concurrently
+concurrency = create_constants("concurrency", Repositories=16)
+
 # define the types of comments
 comments = create_constants(
     "comments", Multiple_Line="multiple-line", Single_Line="single-line"
 )
 
 # define the environment variables for the program
-environmentvariables = create_constants("environmentvariables", Home="GATORGRADER_HOME")
+environmentvariables = create_constants(
+    "environmentvariables",
+    Backend="GATORGRADER_BACKEND",
+    Cache="GATORGRADER_CACHE",
+    Git_Backend="GATORGRADER_GIT_BACKEND",
+    Home="GATORGRADER_HOME",
+)
 
 # define reference function names in the program
 functions = create_constants("functions", Count_Total_Words="count_total_words")
 
+# define the details about matching globs:
+# --> Excludes: the directories that a "**" does not descend into by default
+# --> Gitignore: the file that lists the files and directories that Git ignores
+# --> Recursive: the part of a glob that matches zero or more directories
+globs = create_constants(
+    "globs",
+    Excludes=("node_modules", "build", "__pycache__"),
+    Gitignore=".gitignore",
+    Recursive="**",
+)
+
 # define the help messages for command-line arguments
 help = create_constants(
     "help",
@@ -65,10 +117,39 @@ help = create_constants(
     List_Checks="list the internal and user-provided checks",
     No_Welcome="do not display the welcome message",
     Description="string to use as description of check",
+    Exclude='name of a directory that a "**" does not descend into',
+    Gitignore="do not match the files that a .gitignore ignores",
+    History="perform the check at every STEP-th commit in the history",
+    Revision="commit whose files are checked instead of the working tree",
 )
 
 # define the programming languages for comment checks
-languages = create_constants("languages", "Java", "Python")
+languages = create_constants(
+    "languages",
+    "Java",
+    "Python",
+    C="C",
+    Cpp="C++",
+    Go="Go",
+    JavaScript="JavaScript",
+    Rust="Rust",
+    Shell="Shell",
+)
+
+# define the defaults for measuring the performance of a command:
+# --> Runs: the number of measured runs of the command
+# --> Warmup: the number of runs before the measured runs that are ignored
+# --> Percentile: the percentile of the measurements compared to the thresholds
+performance = create_constants("performance", Runs=5, Warmup=1, Percentile=50)
+
+# define the names of the limits on the resources of a command:
+# --> Cpu: the number of seconds of CPU time
+# --> Memory: the number of megabytes of address space
+# --> Files: the number of open files
+# --> Processes: the number of processes for the user running the command
+limits = create_constants(
+    "limits", Cpu="cpu", Memory="memory", Files="files", Processes="processes"
+)
 
 # define the markdown indicators
 markdown = create_constants("markdown", Paragraph="paragraph", Softbreak="softbreak")
@@ -79,9 +160,11 @@ markers = create_constants(
     Arrow="➔",
     Checkmark="✔",
     Command_Error="Command_No_Output",
+    Comma=", ",
     Empty=b"",
     File="file",
     First=1,
+    Hash="#",
     Indent="  ",
     In_A_File="in a file",
     Invalid=-1,
@@ -98,7 +181,14 @@ markers = create_constants(
 )
 
 # define the metavars
-metavars = create_constants("metavars", Check="CHECK", Dir="DIR")
+metavars = create_constants(
+    "metavars",
+    Check="CHECK",
+    Dir="DIR",
+    Pattern="PATTERN",
+    Revision="REVISION",
+    Step="STEP",
+)
 
 # define the names of modules in the system
 # note that this only defines those modules
@@ -107,8 +197,10 @@ modules = create_constants(
     "modules",
     Checks="gator.checks",
     Display="gator.display",
+    Files="gator.files",
     Invoke="gator.invoke",
     Report="gator.report",
+    Revision="gator.revision",
     Run="gator.run",
 )
 
@@ -127,6 +219,11 @@ paths = create_constants(
     "paths", Current_Directory=".", Current_Directory_Glob="*", Home="gatorgrader"
 )
 
+# define the details about the long-lived shells:
+# --> Program: the shell that runs the commands sent to it
+# --> Timeout: the number of seconds before a command is hung and its shell restarts
+shells = create_constants("shells", Program="/bin/sh", Timeout=600)
+
 # define the details about the program:
 # --> Name: the name of the program that is run
 program = create_constants("program", Name="gatorgrader.py")
@@ -137,17 +234,65 @@ program = create_constants("program", Name="gatorgrader.py")
 # capitalized because the JSON report that is transmitted
 # between Python and Java expects that the keys are lowercase
 results = create_constants(
-    "results", Description="check", Outcome="outcome", Diagnostic="diagnostic"
+    "results",
+    Description="check",
+    Outcome="outcome",
+    Diagnostic="diagnostic",
+    Summary="summary",
+    Usage="usage",
+)
+
+# define the names of the fields that describe the resources used by commands
+# note that the contents of these constants are lowercase because they are
+# keys in the JSON report, just like the names of the fields in the result table
+usages = create_constants(
+    "usages",
+    Cached="cached",
+    Command="command",
+    Commands="commands",
+    Cpu="cpu",
+    Memory="maxrss",
+    Slowest="slowest",
+    System="system",
+    User="user",
+    Wall="wall",
 )
 
 # define the version control repository details
-versioncontrol = create_constants("versioncontrol", Master="master", No_Commits=[])
+versioncontrol = create_constants(
+    "versioncontrol",
+    Count="--count",
+    Git_Directory="--git-dir",
+    Head="HEAD",
+    Log="log",
+    Log_Format="--format=%H%x1f%an%x1f%at%x1f%B",
+    Master="master",
+    No_Commits=[],
+    Rev_List="rev-list",
+    Ls_Tree="ls-tree",
+    Rev_Parse="rev-parse",
+    Short_Hash=7,
+    Zero_Terminated="-z",
+)
+
+# define the backends that inspect Git repositories:
+# --> Cli: run the git program
+# --> GitPython: use the GitPython library, imported as the Library module
+gitbackends = create_constants(
+    "gitbackends",
+    Ceiling="GIT_CEILING_DIRECTORIES",
+    Cli="cli",
+    GitPython="gitpython",
+    Library="git",
+    Program="git",
+)
 
 # define the words diagnostic messages
 words = create_constants(
     "words",
     Minimum="word(s) in every paragraph",
     Total="word(s) in total",
+    At_Least="at least",
     In_A="in a",
     In_Every="in every",
     In_The="in the",
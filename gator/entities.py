@@ -4,6 +4,9 @@ from gator import constants
 from gator import files
 from gator import util
 
+# create the empty table of the records of metrics, one for each version of a file
+metrics = {}
+
 
 def entity_greater_than_count_total(
     given_file, containing_directory, expected_count, checking_function, exact=False
@@ -35,7 +38,47 @@ def entity_greater_than_count(
     return final_check_result, file_entity_count, file_entity_count_dictionary
 
 
-def count_entities(given_file, containing_directory, checking_function):
+def metric_greater_than_count(
+    given_file,
+    containing_directory,
+    expected_count,
+    computing_function,
+    metric,
+    exact=False,
+):
+    """Return a count and determination if a metric is greater than expected."""
+    # call the count_entities function in this module, picking the metric
+    # from the record that the computing_function creates for each file
+    file_entity_count, file_entity_count_dictionary = count_entities(
+        given_file, containing_directory, computing_function, metric
+    )
+    final_check_result_list = util.greater_than_equal_exacted(
+        file_entity_count, expected_count, exact
+    )
+    final_check_result = final_check_result_list[0]
+    return final_check_result, file_entity_count, file_entity_count_dictionary
+
+
+def reset_metrics():
+    """Forget the records of metrics computed for the files of a previous check."""
+    metrics.clear()
+
+
+def get_metrics(file_for_checking, computing_function):
+    """Return the record of metrics for the file, reading and scanning it only once."""
+    version = files.get_version(file_for_checking)
+    # the file cannot be identified, so the record cannot be reused
+    if version is None:
+        return computing_function(file_for_checking.read_text())
+    # the record of each version of the file is computed for the first check
+    # that needs it, and every other check picks its own metric from it
+    metrics_key = (computing_function, version)
+    if metrics_key not in metrics:
+        metrics[metrics_key] = computing_function(file_for_checking.read_text())
+    return metrics[metrics_key]
+
+
+def count_entities(given_file, containing_directory, checking_function, metric=None):
     """Count the number of entities for the file(s) in the directory."""
     # create an empty dictionary of filenames and an internal dictionary
     file_counts_dictionary = {}
@@ -44,7 +87,7 @@ def count_entities(given_file, containing_directory, checking_function):
     # create a path for the given file and its containing directory
     # note that this call does not specify any *args and thus there
     # are no directories between the home directory and the file
-    for file_for_checking in files.create_paths(
+    for file_for_checking in files.iterate_paths(
         file=given_file, home=containing_directory
     ):
         # start the count of the number of entities at zero, assuming none found yet
@@ -52,13 +95,19 @@ def count_entities(given_file, containing_directory, checking_function):
         # create an empty dictionary of the counts
         file_contents_count_dictionary = {}
         # a valid file exists and thus it is acceptable to perform the checking
-        # extract the text from the file_for_checking
-        file_contents = file_for_checking.read_text()
-        # use the provided checking_function to check the contents of the file
-        # note this works since Python supports passing a function to a function
-        file_contents_count, file_contents_count_dictionary = checking_function(
-            file_contents
-        )
+        if metric is None:
+            # extract the text from the file_for_checking
+            file_contents = file_for_checking.read_text()
+            # use the provided checking_function to check the contents of the file
+            # note this works since Python supports passing a function to a function
+            file_contents_count, file_contents_count_dictionary = checking_function(
+                file_contents
+            )
+        # the checking_function computes a record of metrics for the file,
+        # so pick the requested metric from the record for this file
+        else:
+            file_metrics = get_metrics(file_for_checking, checking_function)
+            file_contents_count = file_metrics[metric]
         # the checking_function returned a dictionary of form {entity: count}
         # so we should store this dictionary insider the containing dictionary
         # this case would occur for checks like number of words in paragraphs
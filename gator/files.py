@@ -1,12 +1,25 @@
 """Utility functions that check the contents of the file system."""
 
+from gator import archive
 from gator import constants
+from gator import walk
 
-from glob import glob
 from pathlib import Path
 
+import os
 import sys
 
+# define the tree of a commit whose files are checked instead of the working tree
+revision_tree = None
+
+# define the directories that a "**" does not descend into and
+# whether or not the files that a .gitignore ignores are matched
+excludes = constants.globs.Excludes
+gitignore = False
+
+# create the empty table of the listings of directories, one for each directory
+listings = {}
+
 
 def create_cwd_path():
     """Create a Path object for the current working directory."""
@@ -22,17 +35,106 @@ def create_program_path():
     return create_path(home=program_path)
 
 
-def create_paths(*args, file="", home):
-    """Create a generator of Path objects for a glob with varying sub-path count."""
+def set_revision_tree(tree):
+    """Set the tree of the commit whose files are checked, returning the previous tree."""
+    # pylint: disable=global-statement
+    global revision_tree
+    previous_revision_tree = revision_tree
+    revision_tree = tree
+    return previous_revision_tree
+
+
+def set_glob_options(more_excludes=None, use_gitignore=False):
+    """Set the directories that a "**" does not descend into and the use of .gitignore."""
+    # pylint: disable=global-statement
+    global excludes, gitignore
+    excludes = constants.globs.Excludes + tuple(more_excludes or ())
+    gitignore = use_gitignore
+
+
+def iterate_paths(*args, file="", home):
+    """Yield a Path object for each file matched by a glob with varying sub-path count."""
     # attempt to create the path that could contain:
-    # --> a glob (e.g., *.py) or
+    # --> a glob (e.g., *.py or **/*.py) or
     # --> a single file (e.g., hello.py)
-    # Pathlib does not support globs of absolute directories, so use glob
-    # to create a list of all files matched by the glob
     file_or_glob_path = create_path(*args, file=file, home=home)
-    home_directory_globbed = [Path(p) for p in glob(str(file_or_glob_path))]
-    # return this list of Path objects resulting from glob application
-    return home_directory_globbed
+    # the files of a commit are checked, so match the glob against its tree
+    if revision_tree is not None:
+        yield from revision_tree.glob(file_or_glob_path, excludes)
+        return
+    # the path is inside of a zip or tar archive, so match the glob against
+    # its members instead of extracting the archive to the file system
+    archive_paths = archive.create_paths(file_or_glob_path, excludes)
+    if archive_paths is not None:
+        yield from archive_paths
+        return
+    # walk the file system, yielding each path as soon as it is matched and
+    # pruning the directories that are excluded before descending into them
+    yield from walk.iterate_glob(file_or_glob_path, excludes, gitignore)
+
+
+def reset_listings():
+    """Forget the listings of the directories checked by a previous check."""
+    listings.clear()
+
+
+def list_directory(directory):
+    """Return the names and the file names in the directory, listing it only when it changes."""
+    directory = os.path.abspath(str(directory))
+    # the directory does not exist, so it does not contain any files
+    try:
+        modification_time = os.stat(directory).st_mtime_ns
+    except OSError:
+        return frozenset(), frozenset()
+    # adding, removing, or renaming a file in a directory changes its
+    # modification time, so the cached listing is only used until then
+    cached_listing = listings.get(directory)
+    if cached_listing is not None and cached_listing[0] == modification_time:
+        return cached_listing[1:]
+    # like the glob "*", the listing includes directories but not hidden files
+    entries = [
+        entry
+        for entry in walk.scan_directory(directory)
+        if not walk.is_hidden(entry.name, constants.paths.Current_Directory_Glob)
+    ]
+    names = frozenset(entry.name for entry in entries)
+    # scandir already knows the type of each entry, so there is no need to
+    # call stat to find out which of the names are files
+    file_names = frozenset(entry.name for entry in entries if entry.is_file())
+    listings[directory] = (modification_time, names, file_names)
+    return names, file_names
+
+
+def get_version(path):
+    """Return a key that changes whenever the contents of the file change, or None."""
+    # a file in a commit or in an archive knows its own version
+    if not isinstance(path, Path):
+        return path.version
+    # writing to or replacing a file changes its modification time or its size
+    try:
+        file_status = os.stat(str(path))
+    except OSError:
+        return None
+    return (
+        os.path.abspath(str(path)),
+        file_status.st_mtime_ns,
+        file_status.st_size,
+    )
+
+
+def get_listing(directory):
+    """Return the set of names in the directory, listing it again only when it changes."""
+    return list_directory(directory)[0]
+
+
+def get_file_listing(directory):
+    """Return the set of names of the files in the directory."""
+    return list_directory(directory)[1]
+
+
+def create_paths(*args, file="", home):
+    """Create a list of Path objects for a glob with varying sub-path count."""
+    return list(iterate_paths(*args, file=file, home=home))
 
 
 def create_path(*args, file="", home):
@@ -70,12 +172,17 @@ def case_sensitive_check_file_in_directory(*args, file, home):
     file_for_checking_path = create_path(*args, file=file, home=home)
     # get parent, i.e., the containing directory for the specified file
     file_parent = file_for_checking_path.parent
+    # the file is on the file system, so look for exactly its name in the
+    # cached set of names in the parent directory, which is only listed
+    # once for all of the files that are checked in the same directory
+    if revision_tree is None and archive.find_archive(file_parent) is None:
+        return file_for_checking_path.name in get_listing(file_parent)
     # create a generator of all of the files in the parent directory
     # note that this glob looks for all files in the parent directory
-    # of the specified file, including "dotfiles"
+    # of the specified file, excluding "dotfiles"
     # note that this glob will not capture directories and files that
     # are in sub-directories of the parent directory
-    file_parent_glob = create_paths(
+    file_parent_glob = iterate_paths(
         file=constants.paths.Current_Directory_Glob, home=file_parent
     )
     # assume that the file with the correct name has not been found
@@ -83,13 +190,19 @@ def case_sensitive_check_file_in_directory(*args, file, home):
     file_found = False
     for current_file in file_parent_glob:
         # the case-sensitive file name has been found
-        if str(current_file.name) == file:
+        if str(current_file.name) == file_for_checking_path.name:
             file_found = True
     return file_found
 
 
 def check_file_in_directory(*args, file, home):
     """Return True if the specified file is in the directory."""
+    # the files of a commit are checked, so only its tree can contain the file
+    if revision_tree is not None:
+        return case_sensitive_check_file_in_directory(*args, file=file, home=home)
+    # the directory is inside of an archive, so only the archive can contain the file
+    if archive.find_archive(create_path(*args, file=file, home=home)) is not None:
+        return case_sensitive_check_file_in_directory(*args, file=file, home=home)
     # perform the standard check that relies on the operating system
     # to determine whether or not the file exists on the file system
     no_case_file_exists = case_native_check_file_in_directory(
@@ -102,3 +215,55 @@ def check_file_in_directory(*args, file, home):
     )
     # both of the checks have passed and thus the file does exist
     return no_case_file_exists and case_file_exists
+
+
+def get_checked_file_names(directory):
+    """Return the set of names of the files in the directory, in a commit or an archive."""
+    # the files on the file system are only listed again when the directory changes
+    if revision_tree is None and archive.find_archive(directory) is None:
+        return get_file_listing(directory)
+    # the tree of a commit or an archive is already listed, so match its files
+    return frozenset(
+        path.name
+        for path in iterate_paths(
+            file=constants.paths.Current_Directory_Glob, home=directory
+        )
+        if path.is_file()
+    )
+
+
+def read_manifest(manifest):
+    """Return the files named in a manifest, one on each line, or None if it is missing."""
+    try:
+        manifest_text = Path(manifest).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    # skip the blank lines and the comments in the manifest
+    return [
+        line.strip()
+        for line in manifest_text.splitlines()
+        if line.strip() and not line.strip().startswith(constants.markers.Hash)
+    ]
+
+
+def find_missing_files(*args, required_files, home):
+    """Return the required files that are not in the directory, in the given order."""
+    # group the required files by the directory that contains them so that
+    # each of the directories is only listed once for all of its files
+    required_files_by_directory = {}
+    for required_file in required_files:
+        required_path = create_path(*args, file=required_file, home=home)
+        required_files_by_directory.setdefault(str(required_path.parent), []).append(
+            (required_file, required_path.name)
+        )
+    missing_files = set()
+    for directory, directory_files in required_files_by_directory.items():
+        file_names = get_checked_file_names(directory)
+        for required_file, name in directory_files:
+            if name not in file_names:
+                missing_files.add(required_file)
+    return [
+        required_file
+        for required_file in required_files
+        if required_file in missing_files
+    ]
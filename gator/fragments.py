@@ -1,20 +1,44 @@
 """Retrieve and count the contents of a file."""
 
+import itertools
 import re
+
 import commonmark
 
 from gator import constants
 from gator import files
+from gator import paragraphs
 from gator import util
 
 # define regular expression for blank space matching
 WHITESPACE_RE = r"[!\"#$%&()*+,\./:;\<=\>\?\@\[\]\^`\{\|\}]"
 
+# define the compiled regular expression and the equivalent table for translating
+# the punctuation that WHITESPACE_RE matches to spaces, where the table is faster
+# for ASCII writing and the compiled regular expression is faster otherwise
+PUNCTUATION = '!"#$%&()*+,./:;<=>?@[]^`{|}'
+PUNCTUATION_TABLE = str.maketrans(
+    PUNCTUATION, constants.markers.Space * len(PUNCTUATION)
+)
+WHITESPACE_PATTERN = re.compile(WHITESPACE_RE)
+
 
 def get_paragraphs(contents):
     """Retrieve the paragraphs in the writing in the contents parameter."""
+    # most writing only uses the common blocks of Markdown, so first try to
+    # extract the paragraphs without parsing all of the blocks with commonmark
+    paragraph_list = paragraphs.extract_paragraphs(contents)
+    if paragraph_list is not None:
+        return paragraph_list
+    return get_paragraphs_with_commonmark(contents)
+
+
+def get_paragraphs_with_commonmark(contents):
+    """Retrieve the paragraphs in the writing by parsing all of it with commonmark."""
     ast = commonmark.Parser().parse(contents)
-    paragraph_content = constants.markers.Nothing
+    # collect the parts of a paragraph and join them once it ends, instead
+    # of copying the paragraph each time that a part is added to it
+    paragraph_content = []
     mode_looking = True
     paragraph_list = []
     counter = 0
@@ -24,7 +48,7 @@ def get_paragraphs(contents):
             # check to see if the current subnode is an open paragraph node
             if counter == 1 and subnode.t == constants.markdown.Paragraph and enter:
                 # initialize paragraph_content
-                paragraph_content = constants.markers.Nothing
+                paragraph_content = []
                 # stop search for paragraph nodes, as one has been found
                 # instead, start adding content to paragraph_content
                 mode_looking = False
@@ -32,16 +56,18 @@ def get_paragraphs(contents):
             # check to see if the current subnode is a closing paragraph node
             if counter == 2 and subnode.t == constants.markdown.Paragraph and not enter:
                 # add the content of the paragraph to paragraph_list
-                paragraph_list.append(paragraph_content.strip())
+                paragraph_list.append(
+                    constants.markers.Nothing.join(paragraph_content).strip()
+                )
                 # stop saving paragraph contents, as the paragraph had ended
                 # start a search for a new paragraph
                 mode_looking = True
             # if the subnode literal has contents,
             # or it is a softbreak, add them to paragraph_content
             if subnode.t == constants.markdown.Softbreak:
-                paragraph_content += constants.markers.Newline
+                paragraph_content.append(constants.markers.Newline)
             elif subnode.literal is not None:
-                paragraph_content += subnode.literal
+                paragraph_content.append(subnode.literal)
         # track the how deep into the tree the search currently is
         if subnode.is_container():
             if enter:
@@ -92,6 +118,15 @@ def count_paragraphs(contents):
     return len(matching_paragraphs), {}
 
 
+def count_paragraph_words(paragraph):
+    """Count the words in a paragraph, split by whitespace and punctuation."""
+    # both ways of replacing the punctuation with spaces produce the same words
+    # as substituting WHITESPACE_RE, without compiling it for each paragraph
+    if paragraph.isascii():
+        return len(paragraph.translate(PUNCTUATION_TABLE).split())
+    return len(WHITESPACE_PATTERN.sub(constants.markers.Space, paragraph).split())
+
+
 def count_words(contents, summarizer=min):
     """Count the total number of words in writing using a summarization function."""
     # create a list for a count of the words in each paragraph
@@ -101,17 +136,15 @@ def count_words(contents, summarizer=min):
     paragraph_word_counts = {}
     # retrieve all of the paragraphs in the contents
     # word counting only works for technical writing in Markdown
-    paragraphs = get_paragraphs(contents)
+    matching_paragraphs = get_paragraphs(contents)
     # iterate through each paragraph and count its words
     # note that using start=1 means that enumerate will
     # index the first paragraph with the value of 1
-    for index, para in enumerate(paragraphs, start=1):
+    for index, para in enumerate(matching_paragraphs, start=1):
         # for para in paragraphs:
-        # split the string by whitespace (e.g., newlines or spaces) and punctuation
-        words = re.sub(WHITESPACE_RE, constants.markers.Space, para).split()
-        # count the number of words and keep track
-        # of the count for this paragraph in the list and dictionary
-        word_count = len(words)
+        # count the words in the paragraph, split by whitespace and punctuation,
+        # and keep track of the count for this paragraph in the list and dictionary
+        word_count = count_paragraph_words(para)
         word_counts.append(word_count)
         paragraph_word_counts[index] = word_count
     # word counts exist in the list and thus we can use the provided
@@ -135,20 +168,35 @@ def count_total_words(contents):
     return count_words(contents, sum)
 
 
-def count_specified_fragment(contents, fragment):
-    """Count the specified string fragment in the string contents."""
-    fragment_count = contents.count(fragment)
+def count_specified_fragment(contents, fragment, limit=None):
+    """Count the specified string fragment in the string contents, up to the limit."""
+    if limit is None:
+        fragment_count = contents.count(fragment)
+        return fragment_count
+    # find the fragments one at a time, just like count does, so that
+    # the search can stop at the limit instead of at the end of the contents;
+    # an empty fragment is found at every position of the contents
+    fragment_count = 0
+    fragment_length = len(fragment) or 1
+    position = contents.find(fragment)
+    while position != -1 and fragment_count < limit:
+        fragment_count += 1
+        position = contents.find(fragment, position + fragment_length)
     return fragment_count
 
 
-def count_specified_regex(contents, regex):
-    """Count all the specified regex for a given file."""
+def count_specified_regex(contents, regex, limit=None):
+    """Count all the specified regex for a given file, up to the limit."""
     # not a valid regular expression, so return an valid response
     if not is_valid_regex(regex):
         return constants.markers.Invalid
     # the regular expression was valid, return the number of matches
-    matches = re.findall(regex, contents, re.DOTALL)
-    return len(matches)
+    if limit is None:
+        matches = re.findall(regex, contents, re.DOTALL)
+        return len(matches)
+    # find the matches one at a time so that the search stops at the limit
+    matches = re.finditer(regex, contents, re.DOTALL)
+    return sum(1 for _ in itertools.islice(matches, limit))
 
 
 def specified_entity_greater_than_count(
@@ -159,11 +207,19 @@ def specified_entity_greater_than_count(
     containing_directory=constants.markers.Nothing,
     contents=constants.markers.Nothing,
     exact=False,
+    stop_early=False,
 ):
     """Determine if the entity count is greater than expected."""
-    # count the fragments/regex in either a file in a directory or String contents
+    # count the fragments/regex in either a file in a directory or String contents,
+    # stopping at the expected count when a larger count is not needed
+    limit = util.get_count_limit(expected_count, exact, stop_early)
     file_entity_count, file_entity_count_dictionary = count_entities(
-        chosen_fragment, checking_function, given_file, containing_directory, contents
+        chosen_fragment,
+        checking_function,
+        given_file,
+        containing_directory,
+        contents,
+        limit,
     )
     # check the condition and also return file_entity_count
     condition_truth, value = util.greater_than_equal_exacted(
@@ -180,6 +236,7 @@ def count_entities(
     given_file=constants.markers.Nothing,
     containing_directory=constants.markers.Nothing,
     contents=constants.markers.Nothing,
+    limit=None,
 ):
     """Count fragments for the file in the directory (or contents) and a fragment."""
     # Use these two variables to keep track of entity counts for multiple files.
@@ -200,16 +257,16 @@ def count_entities(
         if contents is constants.markers.Command_Error:
             contents = constants.markers.Nothing
         # run the checking_function to look for fragments in the contents
-        file_contents_count = checking_function(contents, chosen_fragment)
+        file_contents_count = checking_function(contents, chosen_fragment, limit)
         return file_contents_count, file_contents_count_dictionary
-    for file_for_checking in files.create_paths(
+    for file_for_checking in files.iterate_paths(
         file=given_file, home=containing_directory
     ):
         # an actual file is available and command contents are not provided
         # the context for this condition is when the function checks file contents
         # read the text from the file and then check for the chosen fragment
         file_contents = file_for_checking.read_text()
-        file_contents_count = checking_function(file_contents, chosen_fragment)
+        file_contents_count = checking_function(file_contents, chosen_fragment, limit)
         file_contents_count_dictionary[file_for_checking.name] = file_contents_count
     # return the minimum value and the entire dictionary of counts
     minimum_pair = util.get_first_minimum_value(file_contents_count_dictionary)
@@ -268,8 +325,8 @@ def count_lines(
     ):
         # Create a Path object to the chosen file in the containing directory, accounting
         # for the fact that a wildcard like "*.md" will create multiple paths. Note that
-        # the create_paths function can only return valid paths, regardless of input.
-        for file_for_checking in files.create_paths(
+        # the iterate_paths function can only yield valid paths, regardless of input.
+        for file_for_checking in files.iterate_paths(
             file=given_file, home=containing_directory
         ):
             file_contents_count = 0
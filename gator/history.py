@@ -0,0 +1,147 @@
+"""Index the commit history of a Git repository in a single pass."""
+
+import collections
+import datetime
+import os
+import subprocess
+
+from gator import constants
+from gator import repository
+
+# define the compact record of a commit in the history
+Commit = collections.namedtuple(
+    "Commit", ["hash", "author", "timestamp", "message_length"]
+)
+
+# create the empty table of the histories, one for each repository and HEAD
+histories = {}
+
+# define the size of each read from the output of git log
+READ_SIZE = 65536
+
+# define the character that separates the fields of a commit in the output of git log
+FIELD_SEPARATOR = "\x1f"
+
+# define the character that separates the commits in the output of git log
+COMMIT_SEPARATOR = b"\0"
+
+# define the length of a date without a time (e.g., "2019-09-01")
+DATE_LENGTH = len("YYYY-MM-DD")
+
+
+def get_head(repository_path):
+    """Return the hash of the commit at HEAD, or None if there is not one."""
+    if repository.BACKEND == constants.gitbackends.Cli:
+        output = repository.run_git(
+            repository_path,
+            constants.versioncontrol.Rev_Parse,
+            constants.versioncontrol.Head,
+        )
+        if output is None:
+            return None
+        return output.strip()
+    student_repository = repository.get_repository(repository_path)
+    if student_repository is None:
+        return None
+    # a Git repository with no commits does not have a HEAD commit
+    try:
+        return student_repository.head.commit.hexsha
+    except ValueError:
+        return None
+
+
+def create_commit(record):
+    """Create the compact record of a commit from a commit in the output of git log."""
+    commit_hash, author, timestamp, message = record.decode(errors="replace").split(
+        FIELD_SEPARATOR, 3
+    )
+    return Commit(commit_hash, author, int(timestamp), len(message.strip()))
+
+
+def stream_commits(repository_path):
+    """Yield the compact record of each commit while git log walks the history."""
+    process = subprocess.Popen(
+        [
+            constants.gitbackends.Program,
+            constants.versioncontrol.Log,
+            constants.versioncontrol.Zero_Terminated,
+            constants.versioncontrol.Log_Format,
+            constants.versioncontrol.Head,
+        ],
+        cwd=repository_path,
+        env=repository.get_git_environment(repository_path),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    # the commits are separated by a zero byte, so each chunk of output
+    # may end with the beginning of a commit that the next chunk finishes
+    remainder = b""
+    with process.stdout:
+        for chunk in iter(lambda: process.stdout.read(READ_SIZE), b""):
+            records = (remainder + chunk).split(COMMIT_SEPARATOR)
+            remainder = records.pop()
+            for record in records:
+                yield create_commit(record)
+    if remainder.strip():
+        yield create_commit(remainder)
+    process.wait()
+
+
+def create_history(repository_path):
+    """Create the history of the commits reachable from HEAD, newest first."""
+    if repository.BACKEND == constants.gitbackends.Cli:
+        return list(stream_commits(repository_path))
+    student_repository = repository.get_repository(repository_path)
+    return [
+        Commit(
+            commit.hexsha,
+            commit.author.name,
+            commit.authored_date,
+            len(commit.message.strip()),
+        )
+        for commit in student_repository.iter_commits()
+    ]
+
+
+def get_history(repository_path):
+    """Return the history of the repository, using a cached history for its HEAD."""
+    head = get_head(repository_path)
+    # the path is not a Git repository or it has no commits
+    if head is None:
+        return []
+    # the history only changes when HEAD changes, so remember it for each HEAD;
+    # it stays in memory instead of the cache of commands so that it does not
+    # push the results of the commands out of the cache
+    history_key = (os.path.realpath(repository_path), head)
+    if history_key not in histories:
+        histories[history_key] = create_history(repository_path)
+    return histories[history_key]
+
+
+def get_timestamp(date, end=False):
+    """Return the timestamp of a date, which is the end of the day if requested."""
+    moment = datetime.datetime.fromisoformat(date)
+    # a date without a time includes the entire day when it ends a window,
+    # which is the final second of the day since a commit's time is in seconds
+    if end and len(date) == DATE_LENGTH:
+        moment = moment + datetime.timedelta(days=1, seconds=-1)
+    return moment.timestamp()
+
+
+def count_author_commits(history, author):
+    """Return the number of commits by the author."""
+    return sum(1 for commit in history if commit.author == author)
+
+
+def count_window_commits(history, since=None, until=None):
+    """Return the number of commits that were authored between the two dates."""
+    earliest = float("-inf") if since is None else get_timestamp(since)
+    latest = float("inf") if until is None else get_timestamp(until, end=True)
+    return sum(1 for commit in history if earliest <= commit.timestamp <= latest)
+
+
+def get_shortest_message_commit(history):
+    """Return the commit with the shortest message, or None if there are no commits."""
+    if not history:
+        return None
+    return min(history, key=lambda commit: commit.message_length)
@@ -5,7 +5,9 @@ from gator import constants
 from gator import entities
 from gator import files
 from gator import fragments
+from gator import history
 from gator import markdown
+from gator import performance
 from gator import report
 from gator import repository
 from gator import run
@@ -43,6 +45,98 @@ def invoke_commits_check(student_repository, expected_count, exact=False):
     return did_check_pass
 
 
+def get_count_message(expected_count, exact, description):
+    """Create the message for an "at least" or an "exact" count of the description."""
+    # the "at least" check is the default, you must opt-in to an exact check
+    if not exact:
+        return (
+            "has at least "
+            + str(expected_count)
+            + constants.markers.Space
+            + description
+        )
+    return "has exactly " + str(expected_count) + constants.markers.Space + description
+
+
+def invoke_author_commits_check(
+    student_repository, author, expected_count, exact=False
+):
+    """Check to see if the author made more than the specified commits."""
+    # inspect the history of the Git repository for the author's commits
+    commit_history = history.get_history(student_repository)
+    actual_count = history.count_author_commits(commit_history, author)
+    did_check_pass, _ = util.greater_than_equal_exacted(
+        actual_count, expected_count, exact
+    )
+    # create the message and the diagnostic and report the result
+    message = "The repository " + get_count_message(
+        expected_count, exact, "commit(s) by " + author
+    )
+    diagnostic = (
+        "Found "
+        + str(actual_count)
+        + " commit(s) by "
+        + author
+        + " in the Git repository"
+    )
+    report_result(did_check_pass, message, diagnostic)
+    return did_check_pass
+
+
+def invoke_window_commits_check(
+    student_repository, expected_count, since=None, until=None, exact=False
+):
+    """Check to see if the repository has more than the specified commits in a window."""
+    # inspect the history of the Git repository for the commits between the dates
+    commit_history = history.get_history(student_repository)
+    actual_count = history.count_window_commits(commit_history, since, until)
+    did_check_pass, _ = util.greater_than_equal_exacted(
+        actual_count, expected_count, exact
+    )
+    # describe the window, which may not have a start or an end
+    window = constants.markers.Nothing
+    if since is not None:
+        window = window + " since " + since
+    if until is not None:
+        window = window + " until " + until
+    # create the message and the diagnostic and report the result
+    message = "The repository " + get_count_message(
+        expected_count, exact, "commit(s)" + window
+    )
+    diagnostic = (
+        "Found " + str(actual_count) + " commit(s)" + window + " in the Git repository"
+    )
+    report_result(did_check_pass, message, diagnostic)
+    return did_check_pass
+
+
+def invoke_commit_message_length_check(student_repository, expected_length):
+    """Check to see if every commit message has at least the specified length."""
+    # inspect the history of the Git repository for the shortest commit message
+    commit_history = history.get_history(student_repository)
+    shortest_commit = history.get_shortest_message_commit(commit_history)
+    # a repository without commits does not have any commit messages to check
+    did_check_pass = (
+        shortest_commit is not None
+        and shortest_commit.message_length >= expected_length
+    )
+    # create the message and the diagnostic and report the result
+    message = (
+        "Every commit message has at least " + str(expected_length) + " character(s)"
+    )
+    if shortest_commit is None:
+        diagnostic = "Found no commits in the Git repository"
+    else:
+        diagnostic = (
+            "Found a commit message with "
+            + str(shortest_commit.message_length)
+            + " character(s) in commit "
+            + shortest_commit.hash[: constants.versioncontrol.Short_Hash]
+        )
+    report_result(did_check_pass, message, diagnostic)
+    return did_check_pass
+
+
 def invoke_file_in_directory_check(filecheck, directory):
     """Check to see if the file is in the directory."""
     # get the project home, which contains the content subject to checking
@@ -81,6 +175,77 @@ def invoke_file_in_directory_check(filecheck, directory):
     return was_file_found
 
 
+def invoke_files_in_directory_check(required_files, directory, manifest=None):
+    """Check to see if all of the required files, or those in a manifest, are in the directory."""
+    # get the project home, which contains the content subject to checking
+    gatorgrader_home = util.get_project_home()
+    required_files = list(required_files or [])
+    manifest_files = []
+    # the required files are listed in a manifest, one on each line
+    if manifest is not None:
+        # a relative manifest, just like a relative directory, is rooted in the
+        # project directory, while an absolute manifest replaces the project directory
+        manifest_files = files.read_manifest(
+            str(files.create_path(file=manifest, home=gatorgrader_home))
+        )
+    # the manifest could not be read, so the required files are not known
+    if manifest_files is None:
+        message = (
+            "The required file(s) exist in the "
+            + directory
+            + constants.markers.Space
+            + "directory"
+        )
+        diagnostic = "Did not find the manifest " + manifest
+        report_result(False, message, diagnostic)
+        return False
+    # the manifest does not name any files, which is most likely a mistake
+    if manifest is not None and not manifest_files:
+        message = (
+            "The required file(s) exist in the "
+            + directory
+            + constants.markers.Space
+            + "directory"
+        )
+        diagnostic = "Did not find any files in the manifest " + manifest
+        report_result(False, message, diagnostic)
+        return False
+    required_files.extend(manifest_files)
+    # the directory is absolute, meaning that it does not need to be
+    # rooted in the context of the project directory
+    if files.create_path(home=directory).is_absolute():
+        missing_files = files.find_missing_files(
+            required_files=required_files, home=directory
+        )
+    # the directory is not absolute, meaning that it should be rooted
+    # in the context of the project directory
+    else:
+        missing_files = files.find_missing_files(
+            directory, required_files=required_files, home=gatorgrader_home
+        )
+    were_files_found = not missing_files
+    # construct the message about whether or not the files exist
+    message = (
+        "The "
+        + str(len(required_files))
+        + " required file(s) exist in the "
+        + directory
+        + constants.markers.Space
+        + "directory"
+    )
+    # diagnostic lists every missing file, not only the first one
+    diagnostic = (
+        "Did not find "
+        + str(len(missing_files))
+        + " of the required file(s) in the "
+        + directory
+        + " directory: "
+        + constants.markers.Comma.join(missing_files)
+    )
+    report_result(were_files_found, message, diagnostic)
+    return were_files_found
+
+
 def invoke_all_comment_checks(
     filecheck, directory, expected_count, comment_type, language, exact=False
 ):
@@ -88,70 +253,25 @@ def invoke_all_comment_checks(
     met_or_exceeded_count = 0
     actual_count = 0
     comment_count_details = {}
-    # check single-line comments
-    if comment_type == constants.comments.Single_Line:
-        # check comments in Java
-        if language == constants.languages.Java:
-            (
-                met_or_exceeded_count,
-                actual_count,
-                comment_count_details,
-            ) = entities.entity_greater_than_count(
-                filecheck,
-                directory,
-                expected_count,
-                comments.count_singleline_java_comment,
-                exact,
-            )
-        # check comments in Python
-        if language == constants.languages.Python:
-            (
-                met_or_exceeded_count,
-                actual_count,
-                comment_count_details,
-            ) = entities.entity_greater_than_count(
-                filecheck,
-                directory,
-                expected_count,
-                comments.count_singleline_python_comment,
-                exact,
-            )
-    # check multiple-line comments
-    elif comment_type == constants.comments.Multiple_Line:
-        # check comments in Java
-        if language == constants.languages.Java:
-            (
-                met_or_exceeded_count,
-                actual_count,
-                comment_count_details,
-            ) = entities.entity_greater_than_count(
-                filecheck,
-                directory,
-                expected_count,
-                comments.count_multiline_java_comment,
-                exact,
-            )
-        # check comments in Python
-        if language == constants.languages.Python:
-            (
-                met_or_exceeded_count,
-                actual_count,
-                comment_count_details,
-            ) = entities.entity_greater_than_count(
-                filecheck,
-                directory,
-                expected_count,
-                comments.count_multiline_python_comment,
-                exact,
-            )
-    # check comments in a not-supported language
-    # currently the only valid options are:
-    # --> single-line
-    # --> multiple-line
-    # this means that this check will fail because
-    # it will not find any of the specified comments
-    else:
-        pass
+    # find the function that counts every type of comment in the language with
+    # one read and one scan of each file, so that the checks for each type of
+    # comment in the same files share the record of counts for each file;
+    # a not-supported language or type of comment means that this check will
+    # fail because it will not find any of the specified comments
+    compute_comment_metrics = comments.METRICS.get(language)
+    if compute_comment_metrics is not None and comment_type in constants.comments:
+        (
+            met_or_exceeded_count,
+            actual_count,
+            comment_count_details,
+        ) = entities.metric_greater_than_count(
+            filecheck,
+            directory,
+            expected_count,
+            compute_comment_metrics,
+            comment_type,
+            exact,
+        )
     # create the message and the diagnostic
     if not exact:
         # create an "at least" message, which is the default
@@ -454,6 +574,7 @@ def invoke_all_fragment_checks(
     directory=constants.markers.Nothing,
     contents=constants.markers.Nothing,
     exact=False,
+    stop_early=False,
 ):
     """Perform the check for a fragment existence in file or contents and return the results."""
     met_or_exceeded_count = 0
@@ -469,6 +590,7 @@ def invoke_all_fragment_checks(
         directory,
         contents,
         exact,
+        stop_early,
     )
     # create a message for a file in directory
     if (
@@ -532,9 +654,12 @@ def invoke_all_fragment_checks(
     fragment_diagnostic = fragment_diagnostic.replace(
         constants.markers.Unknown_File, constants.markers.File
     )
+    # a count that stopped early is only known to be at least the expected count
     diagnostic = (
         "Found "
-        + str(actual_count)
+        + util.describe_count(
+            actual_count, util.get_count_limit(expected_count, exact, stop_early)
+        )
         + constants.markers.Space
         + "fragment(s)"
         + constants.markers.Space
@@ -553,6 +678,7 @@ def invoke_all_regex_checks(
     directory=constants.markers.Nothing,
     contents=constants.markers.Nothing,
     exact=False,
+    stop_early=False,
 ):
     """Perform the check for a regex existence in file or contents and return the results."""
     met_or_exceeded_count = 0
@@ -568,6 +694,7 @@ def invoke_all_regex_checks(
         directory,
         contents,
         exact,
+        stop_early,
     )
     # create a message for a file in directory
     if (
@@ -636,9 +763,12 @@ def invoke_all_regex_checks(
     if filecheck is not constants.markers.Nothing:
         conclusion = "or " + violating_file_name
     # create the diagnostic message and report the result
+    # a count that stopped early is only known to be at least the expected count
     diagnostic = (
         "Found "
-        + str(actual_count)
+        + util.describe_count(
+            actual_count, util.get_count_limit(expected_count, exact, stop_early)
+        )
         + constants.markers.Space
         + "match(es) of the regular expression in output"
         + constants.markers.Space
@@ -648,11 +778,14 @@ def invoke_all_regex_checks(
     return met_or_exceeded_count
 
 
-def invoke_all_command_fragment_checks(
-    command, expected_fragment, expected_count, exact=False
-):
-    """Perform the check for a fragment existence in the output of a command."""
-    command_output = run.specified_command_get_output(command)
+def report_usage(check_passed):
+    """Attach the resource usage of the most recent command to the result of a check."""
+    report.set_usage(run.get_last_usage())
+    return check_passed
+
+
+def get_command_contents(command_output):
+    """Return the contents for checking the output of a command."""
     # Since the command did not produce any output (i.e., its output is "" or
     # Nothing), we need to indicate that this was a command error. This will
     # later signal that, since this command error-ed, the tool should convert
@@ -660,46 +793,58 @@ def invoke_all_command_fragment_checks(
     # The tool needs this conditional logic since the checking of fragments is
     # overloaded for files in directories and the output of commands.
     if command_output is constants.markers.Nothing:
-        command_output = constants.markers.Command_Error
-    return invoke_all_fragment_checks(
+        return constants.markers.Command_Error
+    return command_output
+
+
+def invoke_all_command_fragment_checks(
+    command,
+    expected_fragment,
+    expected_count,
+    exact=False,
+    inputs=None,
+    refresh=False,
+    stop_early=False,
+):
+    """Perform the check for a fragment existence in the output of a command."""
+    command_output = run.specified_command_get_output(command, inputs, refresh)
+    check_passed = invoke_all_fragment_checks(
         expected_fragment,
         expected_count,
         constants.markers.Nothing,
         constants.markers.Nothing,
-        command_output,
+        get_command_contents(command_output),
         exact,
+        stop_early,
     )
+    return report_usage(check_passed)
 
 
 def invoke_all_command_regex_checks(
-    command, expected_regex, expected_count, exact=False
+    command,
+    expected_regex,
+    expected_count,
+    exact=False,
+    inputs=None,
+    refresh=False,
+    stop_early=False,
 ):
     """Perform the check for a regex existence in the output of a command."""
-    # Since the command did not produce any output (i.e., its output is "" or
-    # Nothing), we need to indicate that this was a command error. This will
-    # later signal that, since this command error-ed, the tool should convert
-    # the output to "" (i.e., Nothing) instead of looking for a file in a directory.
-    # The tool needs this conditional logic since the checking of fragments is
-    # overloaded for files in directories and the output of commands.
-    command_output = run.specified_command_get_output(command)
-    if command_output is constants.markers.Nothing:
-        command_output = constants.markers.Command_Error
-    return invoke_all_regex_checks(
+    command_output = run.specified_command_get_output(command, inputs, refresh)
+    check_passed = invoke_all_regex_checks(
         expected_regex,
         expected_count,
         constants.markers.Nothing,
         constants.markers.Nothing,
-        command_output,
+        get_command_contents(command_output),
         exact,
+        stop_early,
     )
+    return report_usage(check_passed)
 
 
-def invoke_all_command_executes_checks(command):
-    """Perform the check for whether or not a command runs without error."""
-    # pylint: disable=unused-variable
-    # note that the program does not use all of these
-    # return values, but we are capturing them if needed for debugging
-    command_output, command_error, command_returncode = run.run_command(command)
+def report_command_executes(command, command_error, command_returncode, limits=None):
+    """Report whether or not a command ran without error."""
     # note that a zero-code means that the command did not work
     # this is the opposite of what is used for processes
     # but, all other GatorGrader checks return 0 on failure and 1 on success
@@ -712,31 +857,129 @@ def invoke_all_command_executes_checks(command):
     # create the message and diagnostic and report the result
     message = "The command '" + str(command) + "'" + " executes correctly"
     diagnostic = "The command returned the error code " + str(command_returncode)
+    # the command failed because it used more of a resource than its limit allowed
+    limit_violation = run.get_limit_violation(limits, command_error, command_returncode)
+    if limit_violation is not None:
+        diagnostic = (
+            diagnostic
+            + " after exceeding its "
+            + limit_violation
+            + " limit of "
+            + str(limits[limit_violation])
+            + run.LIMIT_UNITS.get(limit_violation, constants.markers.Empty)
+        )
     report_result(command_passed, message, diagnostic)
     return command_passed
 
 
+def invoke_all_command_executes_checks(
+    command, inputs=None, refresh=False, limits=None
+):
+    """Perform the check for whether or not a command runs without error."""
+    # pylint: disable=unused-variable
+    # note that the program does not use all of these
+    # return values, but we are capturing them if needed for debugging
+    command_output, command_error, command_returncode = run.run_command(
+        command, inputs, refresh, limits
+    )
+    check_passed = report_command_executes(
+        command, command_error, command_returncode, limits
+    )
+    return report_usage(check_passed)
+
+
+def invoke_all_command_performance_checks(
+    command,
+    runs=constants.performance.Runs,
+    warmup=constants.performance.Warmup,
+    percentile=constants.performance.Percentile,
+    thresholds=None,
+):
+    """Perform the check for whether or not a command runs within its thresholds."""
+    if thresholds is None:
+        thresholds = {}
+    measurements, command_returncode = performance.measure_command(
+        command, runs, warmup
+    )
+    exceeded_thresholds = performance.get_exceeded_thresholds(
+        measurements, thresholds, percentile
+    )
+    check_passed = (
+        command_returncode == constants.codes.Success and not exceeded_thresholds
+    )
+    # create the message and diagnostic and report the result
+    message = "The command '" + str(command) + "'" + " runs successfully"
+    if thresholds:
+        message = (
+            message
+            + " within "
+            + performance.describe_thresholds(thresholds)
+            + " at the "
+            + performance.get_ordinal(percentile)
+            + " percentile"
+        )
+    message = message + " over " + str(runs) + " run(s)"
+    diagnostic = performance.describe_distribution(measurements, percentile)
+    # the command did not work, so its performance does not matter
+    if command_returncode != constants.codes.Success:
+        diagnostic = "The command returned the error code " + str(command_returncode)
+    report_result(check_passed, message, diagnostic)
+    return report_usage(check_passed)
+
+
 def invoke_all_markdown_checks(
-    markdown_tag, expected_count, filecheck, directory, exact=False
+    markdown_tag, expected_count, filecheck, directory, exact=False, stop_early=False
 ):
     """Perform the check for a markdown tag existence in a file and return the results."""
-    met_or_exceeded_count = 0
-    # perform the count, saving the details in a way that preserves information if the
-    # filecheck was given as a wildcard (i.e., "*.py")
-    (
-        (
-            met_or_exceeded_count,
-            actual_count,
-        ),
-        count_dictionary,
-    ) = markdown.specified_tag_greater_than_count(
-        markdown_tag,
-        markdown.count_specified_tag,
-        expected_count,
-        filecheck,
-        directory,
-        exact,
+    return invoke_all_markdown_tags_checks(
+        [markdown_tag], [expected_count], filecheck, directory, exact, stop_early
+    )
+
+
+def invoke_all_markdown_tags_checks(
+    markdown_tags,
+    expected_counts,
+    filecheck,
+    directory,
+    exact=False,
+    stop_early=False,
+):
+    """Perform the check for the existence of many markdown tags in a file and return the results."""
+    # perform the count of every tag with one walk of each file, saving the details
+    # in a way that preserves information if the filecheck was given as a wildcard
+    tag_results = markdown.specified_tags_greater_than_count(
+        markdown_tags, expected_counts, filecheck, directory, exact, stop_early
     )
+    # describe each of the requirements, naming the tag in the diagnostic
+    # only when there is more than one tag to tell them apart
+    tag_requirements = []
+    tag_diagnostics = []
+    for markdown_tag, expected_count, tag_result in zip(
+        markdown_tags, expected_counts, tag_results
+    ):
+        ((met_or_exceeded_count, actual_count), count_dictionary) = tag_result
+        tag_requirements.append(
+            str(expected_count) + " of the '" + markdown_tag + "' tag"
+        )
+        # Produce the diagnostic for each requirement that the file does not meet.
+        # If a wildcard (i.e., "*.py") was given for the filename, then
+        # this diagnostic is customized for the file that first breaks the check.
+        if not met_or_exceeded_count:
+            tag_name = constants.markers.Nothing
+            if len(markdown_tags) > 1:
+                tag_name = "'" + markdown_tag + "'" + constants.markers.Space
+            fragment_diagnostic = util.get_file_diagnostic(count_dictionary)
+            tag_diagnostics.append(
+                str(actual_count)
+                + constants.markers.Space
+                + tag_name
+                + "tag(s)"
+                + constants.markers.Space
+                + fragment_diagnostic
+                + constants.markers.Space
+                + constants.markers.File
+            )
+    met_or_exceeded_counts = not tag_diagnostics
     # create an "at least" message which is the default
     if exact is not True:
         message = (
@@ -745,10 +988,7 @@ def invoke_all_markdown_checks(
             + " in "
             + directory
             + " has at least "
-            + str(expected_count)
-            + " of the '"
-            + markdown_tag
-            + "' tag"
+            + constants.markers.Comma.join(tag_requirements)
         )
     # create an "exact" message which is an opt-in
     else:
@@ -758,28 +998,12 @@ def invoke_all_markdown_checks(
             + " in "
             + directory
             + " has exactly "
-            + str(expected_count)
-            + " of the '"
-            + markdown_tag
-            + "' tag"
+            + constants.markers.Comma.join(tag_requirements)
         )
-    # Produce the diagnostic and report the result.
-    # If a wildcard (i.e., "*.py") was given for the filename, then
-    # this diagnostic is customized for the file that first breaks the check.
-    fragment_diagnostic = util.get_file_diagnostic(count_dictionary)
-    diagnostic = (
-        "Found "
-        + str(actual_count)
-        + constants.markers.Space
-        + "tag(s)"
-        + constants.markers.Space
-        + fragment_diagnostic
-        + constants.markers.Space
-        + constants.markers.File
-    )
+    diagnostic = "Found " + constants.markers.Comma.join(tag_diagnostics)
     # create the diagnostic and report the result
-    report_result(met_or_exceeded_count, message, diagnostic)
-    return met_or_exceeded_count
+    report_result(met_or_exceeded_counts, message, diagnostic)
+    return met_or_exceeded_counts
 
 
 def invoke_all_count_checks(
@@ -861,13 +1085,16 @@ def invoke_all_count_checks(
     return extracted_result
 
 
-def invoke_all_command_count_checks(command, expected_count, exact=False):
+def invoke_all_command_count_checks(
+    command, expected_count, exact=False, inputs=None, refresh=False
+):
     """Perform the check for number of lines in the output of a command."""
-    command_output = run.specified_command_get_output(command)
-    return invoke_all_count_checks(
+    command_output = run.specified_command_get_output(command, inputs, refresh)
+    check_passed = invoke_all_count_checks(
         expected_count,
         constants.markers.Nothing,
         constants.markers.Nothing,
         command_output,
         exact,
     )
+    return report_usage(check_passed)
@@ -0,0 +1,42 @@
+"""Run a program and report the resources that only the program used."""
+
+# Note that this file runs as a script in a new interpreter, without the site
+# packages, so that the program it starts only inherits a few megabytes of
+# memory. A process starts with the memory of the process that started it
+# and the operating system includes that memory in the peak of the process,
+# so starting the program from GatorGrader would include all of its memory.
+
+import os
+import sys
+import time
+
+# define the return code of a program that could not be started, just like the shell
+NOT_FOUND = 127
+
+
+def launch(report_descriptor, arguments):
+    """Run the program, then write its status and its resource usage to the descriptor."""
+    # the program must not inherit the descriptor for the report
+    os.set_inheritable(report_descriptor, False)
+    start = time.perf_counter()
+    try:
+        process_id = os.posix_spawn(arguments[0], arguments, os.environ)
+    # the program could not be started, so report it like the shell does
+    except OSError as error:
+        os.write(2, (arguments[0] + ": " + error.strerror + "\n").encode())
+        return NOT_FOUND
+    _, status, resource_usage = os.wait4(process_id, 0)
+    wall = time.perf_counter() - start
+    report = [
+        status,
+        wall,
+        resource_usage.ru_utime,
+        resource_usage.ru_stime,
+        resource_usage.ru_maxrss,
+    ]
+    os.write(report_descriptor, " ".join(str(value) for value in report).encode())
+    return os.waitstatus_to_exitcode(status)
+
+
+if __name__ == "__main__":
+    sys.exit(launch(int(sys.argv[1]), sys.argv[2:]))
@@ -1,21 +1,39 @@
 """Retrieve and count the tags of a markdown file."""
 
+import collections
+
 import commonmark
 
+from gator import entities
 from gator import files
 from gator import util
 
 
-def count_specified_tag(contents, tag):
-    """Count the specified markdown tag in the string contents."""
+def count_tags(contents, limits=None):
+    """Count every markdown tag in the string contents with one walk of its AST."""
     ast = commonmark.Parser().parse(contents)
-    tag_count = 0
+    # a tag that is not in the writing has a count of zero
+    tag_counts = collections.Counter()
+    # the walk can stop once each tag with a limit has reached it
+    unmet_limits = len(limits) if limits else None
     # iteratively check all of the nodes in the AST of the markdown file
     for subnode, enter in ast.walker():
-        # check to see if the current subnode is an open node of the specified tag
-        if subnode.t == tag and enter:
-            tag_count += 1
-    return tag_count
+        # count the open node of each tag, but not the node that closes it
+        if enter:
+            tag_counts[subnode.t] += 1
+            if unmet_limits is not None and tag_counts[subnode.t] == limits.get(
+                subnode.t
+            ):
+                unmet_limits -= 1
+                if not unmet_limits:
+                    break
+    return tag_counts
+
+
+def count_specified_tag(contents, tag, limit=None):
+    """Count the specified markdown tag in the string contents, up to the limit."""
+    limits = {tag: limit} if limit is not None else None
+    return count_tags(contents, limits)[tag]
 
 
 def specified_tag_greater_than_count(
@@ -25,6 +43,7 @@ def specified_tag_greater_than_count(
     given_file,
     containing_directory,
     exact=False,
+    stop_early=False,
 ):
     """Determine if the tag count is greater than expected in given file(s)."""
     # Use these two variables to keep track of tag counts for multiple files.
@@ -34,15 +53,19 @@ def specified_tag_greater_than_count(
     file_tags_count_dictionary = {}
     # Create a Path object to the chosen file in the containing directory, accounting
     # for the fact that a wildcard like "*.md" will create multiple paths. Note that
-    # the create_paths function can only return valid paths, regardless of input.
-    for file_for_checking in files.create_paths(
+    # the iterate_paths function can only yield valid paths, regardless of input.
+    for file_for_checking in files.iterate_paths(
         file=given_file, home=containing_directory
     ):
         file_tag_count = 0
         # since the specified file must be valid and thus suitable for checking,
         # read the contents of the file and then check for the chosen tag
         file_contents = file_for_checking.read_text()
-        file_tag_count = checking_function(file_contents, chosen_tag)
+        file_tag_count = checking_function(
+            file_contents,
+            chosen_tag,
+            util.get_count_limit(expected_count, exact, stop_early),
+        )
         file_tags_count_dictionary[file_for_checking.name] = file_tag_count
     # return the minimum value and the entire dictionary of counts
     minimum_pair = util.get_first_minimum_value(file_tags_count_dictionary)
@@ -52,3 +75,55 @@ def specified_tag_greater_than_count(
         util.greater_than_equal_exacted(file_tags_count, expected_count, exact),
         file_tags_count_dictionary,
     )
+
+
+def specified_tags_greater_than_count(
+    chosen_tags,
+    expected_counts,
+    given_file,
+    containing_directory,
+    exact=False,
+    stop_early=False,
+):
+    """Determine if the count of each tag is greater than expected in given file(s)."""
+    # the walk can stop once every tag reaches its expected count, unless the
+    # counts must be exact; a tag that is chosen many times needs the largest count
+    limits = {}
+    for chosen_tag, expected_count in zip(chosen_tags, expected_counts):
+        limit = util.get_count_limit(expected_count, exact, stop_early)
+        if limit is not None:
+            limits[chosen_tag] = max(limit, limits.get(chosen_tag, limit))
+    # read each file and walk the AST of its contents only once, no matter how
+    # many tags are chosen, and then look up the count of every tag in the
+    # histogram of the tags in each file
+    file_tag_counts = {}
+    for file_for_checking in files.iterate_paths(
+        file=given_file, home=containing_directory
+    ):
+        # a walk that stopped early only has some of the counts, so its
+        # histogram is not recorded for other checks of the same file
+        if limits:
+            file_tag_counts[file_for_checking.name] = count_tags(
+                file_for_checking.read_text(), limits
+            )
+        else:
+            file_tag_counts[file_for_checking.name] = entities.get_metrics(
+                file_for_checking, count_tags
+            )
+    # evaluate every requirement against the histograms, just like
+    # specified_tag_greater_than_count does for a single requirement
+    tag_results = []
+    for chosen_tag, expected_count in zip(chosen_tags, expected_counts):
+        file_tags_count_dictionary = {
+            file_name: tag_counts[chosen_tag]
+            for file_name, tag_counts in file_tag_counts.items()
+        }
+        minimum_pair = util.get_first_minimum_value(file_tags_count_dictionary)
+        file_tags_count = minimum_pair[1]
+        tag_results.append(
+            (
+                util.greater_than_equal_exacted(file_tags_count, expected_count, exact),
+                file_tags_count_dictionary,
+            )
+        )
+    return tag_results
@@ -6,23 +6,28 @@ from gator import arguments
 from gator import checkers
 from gator import constants
 from gator import description
+from gator import files
 
 from gator import leave
 from gator import report
+from gator import run
+from gator import timeline
 
 # pylint: disable=unused-import
 from gator import display  # noqa: F401
 from gator import invoke  # noqa: F401
-from gator import run  # noqa: F401
+from gator import revision  # noqa: F401
 
 # define the name of this module
 ORCHESTRATE = sys.modules[__name__]
 
 # define the modules that contain invokable functions
 DISPLAY = sys.modules[constants.modules.Display]
+FILES = sys.modules[constants.modules.Files]
 INVOKE = sys.modules[constants.modules.Invoke]
 RUN = sys.modules[constants.modules.Run]
 REPORT = sys.modules[constants.modules.Report]
+REVISION = sys.modules[constants.modules.Revision]
 
 # define the format for the output of the checks
 OUTPUT_TYPE = getattr(REPORT, constants.outputs.Text)
@@ -52,6 +57,18 @@ def get_actions(parsed_arguments, verification_status):
         # pylint: disable=global-statement
         global OUTPUT_TYPE
         OUTPUT_TYPE = getattr(REPORT, constants.outputs.Json)
+    # Needed Action: change the files that the globs of the check match
+    if parsed_arguments.exclude is not None or parsed_arguments.gitignore is True:
+        needed_actions.append(
+            [
+                FILES,
+                "set_glob_options",
+                [parsed_arguments.exclude, parsed_arguments.gitignore],
+            ]
+        )
+    # Needed Action: check the files of a commit instead of the working tree
+    if verification_status is True and parsed_arguments.revision is not None:
+        needed_actions.append([REVISION, "use_revision", [parsed_arguments.revision]])
     # arguments were not verified, create actions for error message display and an exit
     if verification_status is False:
         # Needed Action: display incorrect arguments message
@@ -84,6 +101,10 @@ def check(system_arguments):
     # *Section: Initialize
     # step_results = []
     check_results = []
+    # check the working tree unless this check names a revision
+    files.set_revision_tree(None)
+    # match the files with the default options unless this check changes them
+    files.set_glob_options()
     # **Step: Parse and then verify the arguments, extract remaining arguments
     parsed_arguments, remaining_arguments = parse_arguments(system_arguments)
     verification_status = verify_arguments(parsed_arguments)
@@ -117,7 +138,12 @@ def check(system_arguments):
         parsed_arguments.nowelcome = True
         actions = get_actions(parsed_arguments, check_verified)
         perform_actions(actions)
+    # **Step: Perform the check at commits in the history, when requested, and
+    # then output the matrix of its outcomes instead of the report for one check
+    if parsed_arguments.history is not None:
+        return check_history(parsed_arguments, check_name, remaining_arguments)
     # **Step: Perform the check since it exists and it is verified
+    previous_usages_count = len(run.get_usages())
     check_result = check.act(parsed_arguments, remaining_arguments)
     check_results.extend(check_result)
     # *Section: Output the report
@@ -125,6 +151,15 @@ def check(system_arguments):
     result = report.get_result()
     # **Step: Override the result's description if a user-provided description exists
     result = description.transform_result_dictionary(parsed_arguments, result)
+    # **Step: Summarize the resources used by the commands of every check in the run,
+    # so that the report of the last check that ran a command summarizes the whole
+    # run, when many ran; a check that ran no command does not repeat the summary
+    usage_summary = run.summarize_usages()
+    if (
+        len(run.get_usages()) > previous_usages_count
+        and usage_summary[constants.usages.Commands] > 1
+    ):
+        report.set_summary(usage_summary)
     # **Step: produce the output
     produced_output = report.output(report.get_result(), OUTPUT_TYPE)
     # **Step: display the output
@@ -133,3 +168,26 @@ def check(system_arguments):
     # Only step: determine the correct exit code for the checks
     correct_exit_code = leave.get_code(check_results)
     return correct_exit_code
+
+
+def check_history(parsed_arguments, check_name, remaining_arguments):
+    """Perform the check at commits in the history and display the outcome at each."""
+    check_arguments = [check_name] + remaining_arguments
+    # the check must be loaded from the same directory of checkers at every commit
+    if parsed_arguments.checkerdir is not None:
+        check_arguments = [
+            constants.commandlines.Checker_Dir,
+            parsed_arguments.checkerdir,
+        ] + check_arguments
+    history_results = timeline.check_history(
+        [check_arguments], step=parsed_arguments.history
+    )
+    display.message(timeline.output_matrix(history_results, [check_arguments]))
+    # summarize the resources used by the commands at every commit only once
+    usage_summary = run.summarize_usages()
+    if usage_summary[constants.usages.Commands] > 1:
+        display.message(report.output_summary(usage_summary))
+    # the exit code depends on the outcome at the most recent commit
+    if not history_results:
+        return leave.get_code([False])
+    return leave.get_code(history_results[-1][timeline.OUTCOMES])
@@ -0,0 +1,395 @@
+"""Extract the paragraphs of Markdown writing without parsing all of its blocks."""
+
+import re
+
+from commonmark.blocks import reHtmlBlockClose
+from commonmark.blocks import reHtmlBlockOpen
+from commonmark.inlines import InlineParser
+from commonmark.node import Node
+
+from gator import constants
+
+# define the characters that make the extractor fall back to commonmark:
+# --> a carriage return changes how the writing is split into lines
+# --> a tab before the text of a line changes how the line is indented
+# --> a null character is replaced before the writing is parsed
+# --> "]:" can start the definition of a link reference, which changes links
+UNSUPPORTED_RE = re.compile(r"[\r\x00]|\]:|^[ >*+\-.)\d]*\t", re.MULTILINE)
+
+# define the characters that have a meaning inside of a paragraph;
+# a paragraph without any of them is only text and line breaks
+INLINE_SPECIAL_RE = re.compile(r"[`\[\]\\<&*_]")
+
+# define the expressions for the start of each block, just like commonmark
+ATX_HEADING_RE = re.compile(r"#{1,6}(?:[ \t]+|$)")
+CODE_FENCE_RE = re.compile(r"`{3,}(?!.*`)|~{3,}")
+CLOSING_CODE_FENCE_RE = re.compile(r"(?:`{3,}|~{3,})(?= *$)")
+SETEXT_HEADING_RE = re.compile(r"(?:=+|-+)[ \t]*$")
+THEMATIC_BREAK_RE = re.compile(
+    r"(?:(?:\*[ \t]*){3,}|(?:_[ \t]*){3,}|(?:-[ \t]*){3,})[ \t]*$"
+)
+LIST_MARKER_RE = re.compile(r"[*+-]|(\d{1,9})[.)]")
+
+# define the number of spaces that indents a line of code
+CODE_INDENT = 4
+
+# define the marker for the start of a block quote
+BLOCK_QUOTE = ">"
+
+# define the types of HTML blocks, where only those up to the last closed type
+# end with a closing tag and the others end with a blank line
+HTML_BLOCK_TYPES = range(1, len(reHtmlBlockOpen))
+LAST_CLOSED_HTML_BLOCK_TYPE = len(reHtmlBlockClose) - 1
+
+# define the kinds of blocks that contain other blocks
+LIST = "list"
+
+# define the kinds of content inside of a list or a block quote, where the
+# paragraph of a nested block can be continued by a line without its markers
+PARAGRAPH = "paragraph"
+NESTED_PARAGRAPH = "nested paragraph"
+PARAGRAPHS = (PARAGRAPH, NESTED_PARAGRAPH)
+OTHER = "other"
+
+
+class UnsupportedMarkdownError(Exception):
+    """The writing contains Markdown that only commonmark can extract correctly."""
+
+
+class Fence:
+    """A fenced code block that is open."""
+
+    def __init__(self, fence, indent):
+        """Create the fence with its characters and its indentation."""
+        self.character = fence[0]
+        self.length = len(fence)
+        self.indent = indent
+
+    def is_closed_by(self, rest, indent):
+        """Return True if the line is the closing fence for this fence."""
+        closing_fence = CLOSING_CODE_FENCE_RE.match(rest)
+        return (
+            indent < CODE_INDENT
+            and closing_fence is not None
+            and closing_fence.group()[0] == self.character
+            and len(closing_fence.group()) >= self.length
+        )
+
+
+def is_blank(line):
+    """Return True if the line only contains spaces, just like commonmark."""
+    return not line.strip(constants.markers.Space)
+
+
+def split_indent(line):
+    """Return the number of spaces that indent the line and the rest of the line."""
+    rest = line.lstrip(constants.markers.Space)
+    return len(line) - len(rest), rest
+
+
+def match_list_marker(rest):
+    """Return the number of the marker, its padding, and if the item is empty, or None."""
+    marker = LIST_MARKER_RE.match(rest)
+    if marker is None:
+        return None
+    after_marker = rest[marker.end() :]
+    # a list marker must be followed by a space or the end of the line
+    if after_marker and not after_marker.startswith(constants.markers.Space):
+        return None
+    spaces = len(after_marker) - len(after_marker.lstrip(constants.markers.Space))
+    empty = is_blank(after_marker)
+    # the content of the item starts after the spaces that follow the marker,
+    # unless there are so many spaces that the content is indented code
+    if empty or spaces >= CODE_INDENT + 1:
+        padding = marker.end() + 1
+    else:
+        padding = marker.end() + spaces
+    return marker.group(1), padding, empty
+
+
+def interrupts_paragraph(list_marker):
+    """Return True if the list item can interrupt a paragraph."""
+    number, _, empty = list_marker
+    # an ordered list can only interrupt a paragraph when it starts at one
+    return not empty and number in (None, "1")
+
+
+def match_html_block(rest, paragraph_open):
+    """Return the type of the HTML block that the unindented line starts, or None."""
+    for block_type in HTML_BLOCK_TYPES:
+        # the last type of HTML block cannot interrupt a paragraph
+        if reHtmlBlockOpen[block_type].search(rest) and (
+            block_type < HTML_BLOCK_TYPES[-1] or not paragraph_open
+        ):
+            return block_type
+    return None
+
+
+def starts_block(rest):
+    """Return True if the unindented line starts a block other than a paragraph or HTML."""
+    return (
+        rest.startswith(BLOCK_QUOTE)
+        or ATX_HEADING_RE.match(rest) is not None
+        or CODE_FENCE_RE.match(rest) is not None
+        or THEMATIC_BREAK_RE.match(rest) is not None
+    )
+
+
+def classify(content, paragraph_open, nested=False, lazy=False):
+    """Return the kind of content that a line adds to a list item or a block quote."""
+    indent, rest = split_indent(content)
+    if is_blank(content):
+        return OTHER
+    # a paragraph inside of a nested block stays nested, even when the line
+    # lazily continues it without the markers of the nested block
+    paragraph = NESTED_PARAGRAPH if nested or lazy else PARAGRAPH
+    # the line continues a paragraph or it is code, which is only supported
+    # when it is not also the continuation of a paragraph in a nested list
+    if indent >= CODE_INDENT:
+        if paragraph_open:
+            return paragraph
+        raise UnsupportedMarkdownError()
+    if rest.startswith(BLOCK_QUOTE):
+        rest = rest[1:]
+        if rest.startswith(constants.markers.Space):
+            rest = rest[1:]
+        return classify(rest, paragraph_open, True, lazy)
+    code_fence = CODE_FENCE_RE.match(rest)
+    if code_fence is not None:
+        # only a fence that is directly inside of the list item or the block
+        # quote is supported, since its end depends on the nested blocks
+        if nested:
+            raise UnsupportedMarkdownError()
+        return Fence(code_fence.group(), indent)
+    if match_html_block(rest, paragraph_open) is not None:
+        raise UnsupportedMarkdownError()
+    # the line underlines the paragraph, which makes it a setext heading,
+    # unless the line lazily continues the paragraph of a nested block
+    if paragraph_open and SETEXT_HEADING_RE.match(rest):
+        if lazy:
+            raise UnsupportedMarkdownError()
+        return OTHER
+    if starts_block(rest):
+        return OTHER
+    list_marker = match_list_marker(rest)
+    if list_marker is not None:
+        if paragraph_open and not interrupts_paragraph(list_marker):
+            return paragraph
+        # an empty item in a nested list is not supported
+        _, padding, empty = list_marker
+        if empty:
+            raise UnsupportedMarkdownError()
+        return classify(rest[padding:], False, True)
+    return paragraph
+
+
+class Extractor:
+    """An extractor of the paragraphs that are not inside of another block."""
+
+    def __init__(self):
+        """Create the extractor with no open blocks."""
+        self.paragraphs = []
+        self.paragraph = None
+        self.fence = None
+        self.html_block_type = None
+        # the open list item or block quote and the kind of its content
+        self.container = None
+        self.content = OTHER
+        # the offset of the content of the open list item, or None when the
+        # item ended, like an empty item does at the first blank line
+        self.item_offset = None
+        self.item_empty = False
+
+    def close_paragraph(self):
+        """Close the open paragraph, keeping it."""
+        if self.paragraph is not None:
+            self.paragraphs.append(self.paragraph)
+            self.paragraph = None
+
+    def add_content(self, content):
+        """Add a line to the open list item or block quote."""
+        if isinstance(self.content, Fence):
+            indent, rest = split_indent(content)
+            if is_blank(content):
+                return
+            # the line is less indented than the fence, so it may close
+            # the fence of a nested list item instead of this fence
+            if indent < self.content.indent:
+                raise UnsupportedMarkdownError()
+            if CLOSING_CODE_FENCE_RE.match(rest) and indent >= CODE_INDENT:
+                raise UnsupportedMarkdownError()
+            if self.content.is_closed_by(rest, indent):
+                self.content = OTHER
+            return
+        self.content = classify(
+            content,
+            self.content in PARAGRAPHS,
+            lazy=self.content == NESTED_PARAGRAPH,
+        )
+
+    def start_item(self, rest, indent, list_marker):
+        """Open a list item whose content starts after the marker."""
+        _, padding, empty = list_marker
+        self.container = LIST
+        self.item_offset = indent + padding
+        self.item_empty = empty
+        self.content = OTHER
+        if not empty:
+            self.add_content(rest[padding:])
+
+    def continue_container(self, line, indent, rest):
+        """Return True if the line continues the open list item or block quote."""
+        blank = is_blank(line)
+        if self.container == BLOCK_QUOTE:
+            if indent < CODE_INDENT and rest.startswith(BLOCK_QUOTE):
+                content = rest[1:]
+                if content.startswith(constants.markers.Space):
+                    content = content[1:]
+                self.add_content(content)
+                return True
+            # a blank line ends a block quote
+            if blank:
+                return False
+        else:
+            # a blank line ends a paragraph and an empty list item, but not a list
+            if blank:
+                if self.item_empty:
+                    self.item_offset = None
+                if self.content in PARAGRAPHS:
+                    self.content = OTHER
+                return True
+            if self.item_offset is not None and indent >= self.item_offset:
+                self.item_empty = False
+                self.add_content(line[self.item_offset :])
+                return True
+            # a thematic break ends the list, even if it looks like an item
+            if indent < CODE_INDENT and THEMATIC_BREAK_RE.match(rest):
+                return False
+            list_marker = match_list_marker(rest) if indent < CODE_INDENT else None
+            if list_marker is not None:
+                self.start_item(rest, indent, list_marker)
+                return True
+        # a line that does not start a block lazily continues a paragraph
+        return self.content in PARAGRAPHS and (
+            indent >= CODE_INDENT
+            or not (
+                starts_block(rest)
+                or match_list_marker(rest) is not None
+                or match_html_block(rest, False) is not None
+            )
+        )
+
+    def continue_html_block(self, line):
+        """Add a line to the open HTML block, closing it at its end."""
+        if self.html_block_type <= LAST_CLOSED_HTML_BLOCK_TYPE:
+            if reHtmlBlockClose[self.html_block_type].search(line):
+                self.html_block_type = None
+        elif is_blank(line):
+            self.html_block_type = None
+
+    def add_line(self, line):
+        """Add a line of the writing, opening and closing the blocks it changes."""
+        indent, rest = split_indent(line)
+        if self.fence is not None:
+            if self.fence.is_closed_by(rest, indent):
+                self.fence = None
+            return
+        if self.html_block_type is not None:
+            self.continue_html_block(line)
+            return
+        if self.container is not None:
+            if self.continue_container(line, indent, rest):
+                return
+            self.container = None
+            self.content = OTHER
+        if is_blank(line):
+            self.close_paragraph()
+            return
+        if indent >= CODE_INDENT:
+            # an indented line continues a paragraph or it is code
+            if self.paragraph is not None:
+                self.paragraph.append(rest)
+            return
+        if rest.startswith(BLOCK_QUOTE):
+            self.close_paragraph()
+            self.container = BLOCK_QUOTE
+            self.content = OTHER
+            self.continue_container(line, indent, rest)
+            return
+        code_fence = CODE_FENCE_RE.match(rest)
+        if code_fence is not None:
+            self.close_paragraph()
+            self.fence = Fence(code_fence.group(), indent)
+            return
+        html_block_type = match_html_block(rest, self.paragraph is not None)
+        if html_block_type is not None:
+            self.close_paragraph()
+            self.html_block_type = html_block_type
+            self.continue_html_block(line)
+            return
+        # the line underlines the paragraph, which makes it a setext heading
+        if self.paragraph is not None and SETEXT_HEADING_RE.match(rest):
+            self.paragraph = None
+            return
+        if starts_block(rest):
+            self.close_paragraph()
+            return
+        list_marker = match_list_marker(rest)
+        if list_marker is not None and (
+            self.paragraph is None or interrupts_paragraph(list_marker)
+        ):
+            self.close_paragraph()
+            self.start_item(rest, indent, list_marker)
+            return
+        if self.paragraph is None:
+            self.paragraph = [rest]
+        else:
+            self.paragraph.append(rest)
+
+    def extract(self, contents):
+        """Return the lines of each paragraph in the writing."""
+        for line in contents.split(constants.markers.Newline):
+            self.add_line(line)
+        self.close_paragraph()
+        return self.paragraphs
+
+
+def get_text(lines):
+    """Return the text of a paragraph, just like the literals that commonmark creates."""
+    subject = constants.markers.Newline.join(lines).strip()
+    # the paragraph has links, emphasis, code, or other inline content,
+    # so parse it with commonmark and then collect its literals
+    if INLINE_SPECIAL_RE.search(subject):
+        paragraph = Node(constants.markdown.Paragraph, None)
+        paragraph.string_content = subject
+        InlineParser().parse(paragraph)
+        parts = []
+        for subnode, _ in paragraph.walker():
+            if subnode.t == constants.markdown.Softbreak:
+                parts.append(constants.markers.Newline)
+            elif subnode.literal is not None:
+                parts.append(subnode.literal)
+        return constants.markers.Nothing.join(parts).strip()
+    # the paragraph is only text, so join its lines like commonmark does,
+    # where two spaces at the end of a line make a hard line break
+    parts = []
+    for line in subject.split(constants.markers.Newline):
+        if line.endswith(2 * constants.markers.Space):
+            parts.append(line.rstrip(constants.markers.Space))
+            parts.append(constants.markers.Nothing)
+        else:
+            parts.append(line.rstrip(constants.markers.Space))
+            parts.append(constants.markers.Newline)
+    return constants.markers.Nothing.join(parts[:-1]).strip()
+
+
+def extract_paragraphs(contents):
+    """Return the paragraphs that are not inside of another block, or None."""
+    # the writing contains Markdown that only commonmark handles correctly
+    if UNSUPPORTED_RE.search(contents):
+        return None
+    try:
+        paragraphs = Extractor().extract(contents)
+    except UnsupportedMarkdownError:
+        return None
+    return [get_text(lines) for lines in paragraphs]
@@ -0,0 +1,157 @@
+"""Measure the wall time, CPU time, and memory of a command over many runs."""
+
+import math
+
+from gator import constants
+from gator import run
+
+# define the number of kilobytes in a megabyte
+KILOBYTES_PER_MEGABYTE = 1024
+
+# define the measurements with the names and the units used to describe them
+MEASURES = [
+    (constants.usages.Wall, "wall time", "s"),
+    (constants.usages.Cpu, "CPU time", "s"),
+    (constants.usages.Memory, "peak memory", " MB"),
+]
+
+
+def get_measurement(usage):
+    """Return the wall time, CPU time, and peak memory in megabytes of a usage."""
+    measurement = {
+        constants.usages.Wall: usage[constants.usages.Wall],
+        constants.usages.Cpu: None,
+        constants.usages.Memory: None,
+    }
+    # the CPU time and memory are only known when the operating system reports them
+    if usage[constants.usages.User] is not None:
+        measurement[constants.usages.Cpu] = (
+            usage[constants.usages.User] + usage[constants.usages.System]
+        )
+    if usage[constants.usages.Memory] is not None:
+        measurement[constants.usages.Memory] = (
+            usage[constants.usages.Memory] / KILOBYTES_PER_MEGABYTE
+        )
+    return measurement
+
+
+def measure_command(
+    command, runs=constants.performance.Runs, warmup=constants.performance.Warmup
+):
+    """Run the command many times and return the measurements and last error code."""
+    measurements = []
+    code = constants.codes.Success
+    # only a new process for each run reports its own CPU time and memory, and
+    # only a launcher started without the memory of GatorGrader reports the
+    # memory that the command used instead of the memory that it inherited
+    previous_backend = run.set_backend(constants.backends.Process)
+    try:
+        for index in range(warmup + runs):
+            _, _, run_code = run.run_launched_process(command)
+            # remember a failing run so that it fails the entire measurement
+            if run_code != constants.codes.Success:
+                code = run_code
+            # the warmup runs fill the caches, so they are not measured
+            if index >= warmup:
+                measurements.append(get_measurement(run.get_last_usage()))
+    finally:
+        run.set_backend(previous_backend)
+    return measurements, code
+
+
+def get_percentile(values, percentile):
+    """Return the percentile of the values, interpolating between the closest two."""
+    # there are no values, so there is no percentile
+    if not values:
+        return None
+    ordered_values = sorted(values)
+    position = (len(ordered_values) - 1) * percentile / 100
+    lower_index = math.floor(position)
+    upper_index = math.ceil(position)
+    fraction = position - lower_index
+    return ordered_values[lower_index] + fraction * (
+        ordered_values[upper_index] - ordered_values[lower_index]
+    )
+
+
+def get_values(measurements, measure):
+    """Return the known values of one of the measures across all of the measurements."""
+    return [
+        measurement[measure]
+        for measurement in measurements
+        if measurement[measure] is not None
+    ]
+
+
+def create_thresholds(wall=None, cpu=None, memory=None):
+    """Create the thresholds on the measures, omitting those not given."""
+    thresholds = {
+        constants.usages.Wall: wall,
+        constants.usages.Cpu: cpu,
+        constants.usages.Memory: memory,
+    }
+    return {name: value for name, value in thresholds.items() if value is not None}
+
+
+def get_exceeded_thresholds(measurements, thresholds, percentile):
+    """Return the names of the measures whose percentile is above their threshold."""
+    exceeded_thresholds = []
+    for measure, _, _ in MEASURES:
+        if measure in thresholds:
+            value = get_percentile(get_values(measurements, measure), percentile)
+            # a measure that was not reported cannot show that the command is fast enough
+            if value is None or value > thresholds[measure]:
+                exceeded_thresholds.append(measure)
+    return exceeded_thresholds
+
+
+def get_ordinal(number):
+    """Return the ordinal (e.g., "1st" or "50th") for the number."""
+    if number % 100 in (11, 12, 13):
+        return str(number) + "th"
+    return str(number) + {1: "st", 2: "nd", 3: "rd"}.get(number % 10, "th")
+
+
+def describe_thresholds(thresholds):
+    """Describe the thresholds on the measures (e.g., "2.0s wall time")."""
+    descriptions = [
+        str(thresholds[measure]) + unit + constants.markers.Space + name
+        for measure, name, unit in MEASURES
+        if measure in thresholds
+    ]
+    return ", ".join(descriptions)
+
+
+def describe_distribution(measurements, percentile):
+    """Describe the distribution of each measure across the measurements."""
+    descriptions = []
+    for measure, name, unit in MEASURES:
+        values = get_values(measurements, measure)
+        # the operating system did not report this measure
+        if not values:
+            continue
+        descriptions.append(
+            name
+            + " of "
+            + "%.3f" % get_percentile(values, percentile)
+            + unit
+            + " at the "
+            + get_ordinal(percentile)
+            + " percentile (minimum "
+            + "%.3f" % min(values)
+            + unit
+            + ", median "
+            + "%.3f" % get_percentile(values, 50)
+            + unit
+            + ", maximum "
+            + "%.3f" % max(values)
+            + unit
+            + ")"
+        )
+    return (
+        "The command had a "
+        + "; ".join(descriptions)
+        + " over "
+        + str(len(measurements))
+        + " run(s)"
+    )
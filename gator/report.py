@@ -45,6 +45,21 @@ def set_result(description, outcome, diagnostic):
     return result
 
 
+def set_usage(usage):
+    """Attach the resource usage of a command to the current result dictionary."""
+    # there is no result yet or no command ran, so there is nothing to attach
+    if result is not None and usage is not None:
+        result[constants.results.Usage] = usage
+    return result
+
+
+def set_summary(summary):
+    """Attach the summary of the resources used by all commands to the current result."""
+    if result is not None and summary is not None:
+        result[constants.results.Summary] = summary
+    return result
+
+
 def get_result():
     """Return the result dictionary."""
     # pylint: disable=global-statement
@@ -88,9 +103,47 @@ def output_text(dictionary_result) -> str:
         submitted = (
             util.get_symbol_answer(outcome) + constants.markers.Space + description
         )
+    # there is a summary of the resources used by multiple commands, so include it
+    summary = dictionary_result.get(constants.results.Summary)
+    if summary is not None:
+        submitted = (
+            submitted
+            + constants.markers.Newline
+            + constants.markers.Tab
+            + output_summary(summary)
+        )
     return submitted
 
 
+def output_summary(summary) -> str:
+    """Produce a one-line textual summary of the resources used by commands."""
+    resources = (
+        "{:.3f}".format(summary[constants.usages.User])
+        + "s user, "
+        + "{:.3f}".format(summary[constants.usages.System])
+        + "s system"
+    )
+    # the memory is only known when a command used more than GatorGrader
+    if summary[constants.usages.Memory] is not None:
+        resources = (
+            resources
+            + ", "
+            + str(summary[constants.usages.Memory])
+            + " KB maximum memory"
+        )
+    return (
+        "Ran "
+        + str(summary[constants.usages.Commands])
+        + " command(s) in "
+        + "{:.3f}".format(summary[constants.usages.Wall])
+        + "s ("
+        + resources
+        + "); the slowest was '"
+        + str(summary[constants.usages.Slowest])
+        + "'"
+    )
+
+
 def output_json(dictionary_result) -> str:
     """Return output in a JSON-based textual format."""
     return json.dumps(dictionary_result)
@@ -1,39 +1,146 @@
 """Interact with a Git repository."""
 
-import git
+import asyncio
+import importlib
+import os
+import shutil
+import subprocess
 
 from gator import constants
+from gator import run
 from gator import util
 
+# define the arguments that make git count the commits reachable from HEAD
+COUNT_ARGUMENTS = (
+    constants.versioncontrol.Rev_List,
+    constants.versioncontrol.Count,
+    constants.versioncontrol.Head,
+)
 
-def is_git_repository(repository_path):
-    """Return True if repository_path contains a Git repository, False otherwise."""
+
+def get_gitpython():
+    """Return the GitPython module, or None if it is not installed."""
+    # GitPython is only imported when it is needed since importing it is slow
+    try:
+        return importlib.import_module(constants.gitbackends.Library)
+    except ImportError:
+        return None
+
+
+def choose_backend():
+    """Choose the backend that inspects Git repositories."""
+    # the environment variable for the Git backend is set, so use it
+    backend = os.environ.get(constants.environmentvariables.Git_Backend)
+    if backend:
+        return backend
+    # the git program is faster for the few questions that the checks
+    # ask and, unlike GitPython, it does not need to be imported
+    if shutil.which(constants.gitbackends.Program) is not None:
+        return constants.gitbackends.Cli
+    return constants.gitbackends.GitPython
+
+
+# define the backend that inspects Git repositories
+BACKEND = choose_backend()
+
+
+def set_backend(backend):
+    """Set the backend that inspects Git repositories, returning the previous one."""
+    # pylint: disable=global-statement
+    global BACKEND
+    previous_backend = BACKEND
+    BACKEND = backend
+    return previous_backend
+
+
+def get_git_environment(repository_path):
+    """Return the environment for running the git program in the repository."""
+    # Stop git from searching the parent directories for a repository so that,
+    # like GitPython, only the directory at the path can contain the repository
+    environment = dict(os.environ)
+    environment[constants.gitbackends.Ceiling] = os.path.dirname(
+        os.path.abspath(repository_path)
+    )
+    return environment
+
+
+def run_git(repository_path, *arguments, search=False):
+    """Run the git program in the repository and return its output, or None if it fails."""
+    # only search the parent directories for a repository when asked
+    environment = None
+    if not search:
+        environment = get_git_environment(repository_path)
+    try:
+        process = subprocess.run(
+            [constants.gitbackends.Program] + list(arguments),
+            cwd=repository_path,
+            env=environment,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+    # the directory does not exist or the git program is not available
+    except OSError:
+        return None
+    if process.returncode != constants.codes.Success:
+        return None
+    return process.stdout.decode()
+
+
+def get_repository(repository_path):
+    """Return the GitPython repository at repository_path, or None if there is not one."""
+    git = get_gitpython()
+    # GitPython is not installed, so it cannot create the repository
+    if git is None:
+        return None
     # attempt to create a repository using GitPython
     try:
         # it was possible to create the repository, so it must exist
-        # this means that the function should return True
-        # because it is safe to inspect attributes of this repository
-        _ = git.Repo(repository_path).git_dir
-        return True
+        # this means that it is safe to inspect attributes of this repository
+        student_repository = git.Repo(repository_path)
+        _ = student_repository.git_dir
+        return student_repository
     # it was not possible to create the repository, so it does not exist
-    # this means that the function should return False to signal
+    # this means that the function should return None to signal
     # that it is not safe to inspect Git attributes in this non-repo
-    except git.exc.InvalidGitRepositoryError:
-        return False
+    except (git.exc.InvalidGitRepositoryError, git.exc.NoSuchPathError):
+        return None
+
+
+def is_git_repository(repository_path):
+    """Return True if repository_path contains a Git repository, False otherwise."""
+    if BACKEND == constants.gitbackends.Cli:
+        output = run_git(
+            repository_path,
+            constants.versioncontrol.Rev_Parse,
+            constants.versioncontrol.Git_Directory,
+        )
+        return output is not None
+    return get_repository(repository_path) is not None
 
 
 def get_commits(repository_path):
-    """Return a list of the commits for the repository at the path."""
+    """Return a list of the hashes of the commits for the repository at the path."""
     # assume that we have not found a Git repository
     # and thus set the default commits lists is []
     commits = constants.versioncontrol.No_Commits
-    if is_git_repository(repository_path):
+    if BACKEND == constants.gitbackends.Cli:
+        # the output is empty for a repository with no commits
+        output = run_git(
+            repository_path,
+            constants.versioncontrol.Rev_List,
+            constants.versioncontrol.Head,
+        )
+        if output is not None:
+            commits = output.split()
+        return commits
+    student_repository = get_repository(repository_path)
+    if student_repository is not None:
         # the repository_path is a Git repository
         # Try to extract the commits from the repository
         # and return the list of commits if they are available.
-        student_repository = git.Repo(repository_path)
         try:
-            commits = list(student_repository.iter_commits())
+            commits = [commit.hexsha for commit in student_repository.iter_commits()]
         # In circumstances in which this does not work
         # (e.g., it is a Git repository with no commits)
         # then catch the ValueError, pass, and return the
@@ -43,6 +150,85 @@ def get_commits(repository_path):
     return commits
 
 
+def get_commit_count(repository_path):
+    """Return the number of commits for the repository at the path."""
+    # Git counts the commits reachable from HEAD while it walks the history,
+    # so this does not create an object for each of the commits in the repository
+    if BACKEND == constants.gitbackends.Cli:
+        output = run_git(repository_path, *COUNT_ARGUMENTS)
+    else:
+        output = None
+        student_repository = get_repository(repository_path)
+        # the repository_path is a Git repository, so count its commits
+        if student_repository is not None:
+            try:
+                output = student_repository.git.execute(
+                    [constants.gitbackends.Program] + list(COUNT_ARGUMENTS)
+                )
+            # In circumstances in which this does not work
+            # (e.g., it is a Git repository with no commits)
+            # then there are no commits to count
+            except get_gitpython().exc.GitCommandError:
+                pass
+    # the path is not a Git repository or it has no commits
+    if output is None:
+        return 0
+    return int(output)
+
+
+async def run_git_async(repository_path, *arguments):
+    """Run the git program in the repository without blocking and return its output."""
+    try:
+        process = await asyncio.create_subprocess_exec(
+            constants.gitbackends.Program,
+            *arguments,
+            cwd=repository_path,
+            env=get_git_environment(repository_path),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    # the directory does not exist or the git program is not available
+    except OSError:
+        return None
+    output, _ = await process.communicate()
+    if process.returncode != constants.codes.Success:
+        return None
+    return output.decode()
+
+
+async def get_commit_count_async(repository_path):
+    """Return the number of commits for the repository at the path without blocking."""
+    if BACKEND == constants.gitbackends.Cli:
+        output = await run_git_async(repository_path, *COUNT_ARGUMENTS)
+        # the path is not a Git repository or it has no commits
+        if output is None:
+            return 0
+        return int(output)
+    # GitPython blocks while it counts, so count in one of the loop's threads
+    return await asyncio.get_running_loop().run_in_executor(
+        None, get_commit_count, repository_path
+    )
+
+
+async def get_commit_counts_async(
+    repository_paths, limit=constants.concurrency.Repositories
+):
+    """Count the commits of the repositories concurrently, without blocking."""
+    commit_counts = await run.gather_with_limit(
+        [
+            get_commit_count_async(repository_path)
+            for repository_path in repository_paths
+        ],
+        limit,
+    )
+    return dict(zip(repository_paths, commit_counts))
+
+
+def get_commit_counts(repository_paths, limit=constants.concurrency.Repositories):
+    """Count the commits of the repositories concurrently, returning a dictionary."""
+    return asyncio.run(get_commit_counts_async(repository_paths, limit))
+
+
 def count_commits(commits):
     """Return the count of the list of commits."""
     return len(commits)
@@ -50,8 +236,7 @@ def count_commits(commits):
 
 def commits_greater_than_count(path, expected_count, exact=False):
     """Return count and True if count of commits is greater than limit, else False."""
-    # extract the commit log and then count the commits
-    commits = get_commits(path)
-    number_commits = count_commits(commits)
+    # count the commits without extracting the entire commit log
+    number_commits = get_commit_count(path)
     # check the condition and also return number_commits
     return util.greater_than_equal_exacted(number_commits, expected_count, exact)
@@ -0,0 +1,227 @@
+"""Read the files of a commit from the Git object database, without a checkout."""
+
+import atexit
+import os
+import posixpath
+import subprocess
+
+from gator import constants
+from gator import files
+from gator import repository
+from gator import util
+from gator import walk
+
+# define the types of the objects in the tree of a commit
+BLOB = "blob"
+TREE = "tree"
+
+# define the suffix that resolves a revision to a commit
+COMMIT_SUFFIX = "^{commit}"
+
+# create the empty table of the processes that read blobs, one for each repository
+blob_readers = {}
+
+
+class RevisionPath:
+    """A file or directory in the tree of a commit that acts like a Path."""
+
+    def __init__(self, tree, path, kind, object_id):
+        """Create the path for an object in the tree of a commit."""
+        self.tree = tree
+        self.path = path
+        self.kind = kind
+        self.object_id = object_id
+
+    def __str__(self):
+        """Return the path of the object, relative to the top of the repository."""
+        return self.path
+
+    def __repr__(self):
+        """Return a representation of the path that includes its commit."""
+        return "RevisionPath(" + self.tree.commit + ":" + self.path + ")"
+
+    def __lt__(self, other):
+        """Order the paths by their names, just like a Path."""
+        return str(self) < str(other)
+
+    @property
+    def name(self):
+        """Return the name of the file or directory."""
+        return posixpath.basename(self.path)
+
+    @property
+    def version(self):
+        """Return the hash of the object, which is the same in every commit with it."""
+        return self.object_id
+
+    def is_file(self):
+        """Return True if the path is a file in the tree of the commit."""
+        return self.kind == BLOB
+
+    def is_dir(self):
+        """Return True if the path is a directory in the tree of the commit."""
+        return self.kind == TREE
+
+    def read_text(self):
+        """Return the contents of the file in the commit."""
+        return self.read_bytes().decode()
+
+    def read_bytes(self):
+        """Return the contents of the file in the commit as bytes."""
+        return self.tree.read_bytes(self.object_id)
+
+
+class RevisionTree:
+    """The tree of files and directories in a commit of a repository."""
+
+    def __init__(self, toplevel, commit, contents=None):
+        """Create the tree for the commit, listing all of its objects at once."""
+        self.toplevel = toplevel
+        self.commit = commit
+        self.paths = {}
+        # the contents of the blobs may be shared with the trees of other commits
+        # since a blob with the same object identifier always has the same contents
+        self.contents = {} if contents is None else contents
+        # record the globs matched against the tree to learn which files were checked
+        self.globs = []
+        # list every file and directory, separating them with a zero byte
+        # so that file names do not need to be unquoted
+        output = repository.run_git(
+            toplevel,
+            constants.versioncontrol.Ls_Tree,
+            "-r",
+            "-t",
+            "-z",
+            "--full-tree",
+            commit,
+        )
+        for entry in output.split("\0"):
+            if not entry:
+                continue
+            details, path = entry.split("\t", 1)
+            _, kind, object_id = details.split()
+            self.paths[path] = RevisionPath(self, path, kind, object_id)
+
+    def read_bytes(self, object_id):
+        """Return the contents of a blob, reading each blob only once."""
+        if object_id not in self.contents:
+            self.contents[object_id] = get_blob_reader(self.toplevel).read_bytes(
+                object_id
+            )
+        return self.contents[object_id]
+
+    def get_relative_parts(self, file_or_glob_path):
+        """Return the parts of the path relative to the top of the repository."""
+        # relative paths are rooted in the current working directory, just like glob
+        absolute_path = os.path.join(os.path.realpath(os.getcwd()), file_or_glob_path)
+        relative_path = os.path.relpath(absolute_path, self.toplevel)
+        # the path is outside of the repository, so it is not in the tree
+        if relative_path == os.pardir or relative_path.startswith(os.pardir + os.sep):
+            return None
+        return relative_path.split(os.sep)
+
+    def glob(self, file_or_glob_path, excludes=None):
+        """Return the paths in the tree that match a file or a glob, just like glob."""
+        self.globs.append(str(file_or_glob_path))
+        return self.match(str(file_or_glob_path), excludes)
+
+    def match(self, file_or_glob_path, excludes=None):
+        """Return the paths in the tree that match a file or a glob without recording it."""
+        pattern_parts = self.get_relative_parts(file_or_glob_path)
+        if pattern_parts is None:
+            return []
+        return walk.match_paths(self.paths, pattern_parts, excludes)
+
+
+class BlobReader:
+    """A git cat-file process that reads the blobs of a repository one after another."""
+
+    def __init__(self, toplevel):
+        """Start the process that reads the blobs of the repository."""
+        self.process = subprocess.Popen(
+            [constants.gitbackends.Program, "cat-file", "--batch"],
+            cwd=toplevel,
+            env=repository.get_git_environment(toplevel),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def read_bytes(self, object_id):
+        """Return the contents of the blob, without decoding them."""
+        self.process.stdin.write(object_id.encode() + b"\n")
+        self.process.stdin.flush()
+        # the contents follow a line with the identifier, the type, and the size
+        # of the object, or a line that says that the object is missing
+        header = self.process.stdout.readline().split()
+        if len(header) != 3:
+            raise FileNotFoundError(object_id)
+        contents = self.process.stdout.read(int(header[2]))
+        # the contents of each object end with an extra newline
+        self.process.stdout.read(1)
+        return contents
+
+    def close(self):
+        """Stop the process that reads the blobs."""
+        self.process.stdin.close()
+        self.process.wait()
+        self.process.stdout.close()
+
+
+def get_blob_reader(toplevel):
+    """Return the process that reads the blobs of the repository, starting it once."""
+    if toplevel not in blob_readers:
+        blob_readers[toplevel] = BlobReader(toplevel)
+    return blob_readers[toplevel]
+
+
+@atexit.register
+def close_blob_readers():
+    """Stop all of the processes that read blobs."""
+    for blob_reader in blob_readers.values():
+        blob_reader.close()
+    blob_readers.clear()
+
+
+def get_toplevel(home):
+    """Return the top directory of the repository that contains home, or None."""
+    output = repository.run_git(
+        home, constants.versioncontrol.Rev_Parse, "--show-toplevel", search=True
+    )
+    if output is None:
+        return None
+    return os.path.realpath(output.strip())
+
+
+def resolve_revision(revision, home):
+    """Return the commit for the revision in the repository containing home, or None."""
+    output = repository.run_git(
+        home,
+        constants.versioncontrol.Rev_Parse,
+        "--verify",
+        "--quiet",
+        revision + COMMIT_SUFFIX,
+        search=True,
+    )
+    if output is None:
+        return None
+    return output.strip()
+
+
+def create_tree(revision, home):
+    """Create the tree of the revision in the repository containing home, or None."""
+    toplevel = get_toplevel(home)
+    commit = resolve_revision(revision, home)
+    # the home is not in a repository or the revision is not a commit
+    if toplevel is None or commit is None:
+        return None
+    return RevisionTree(toplevel, commit)
+
+
+def use_revision(revision, home=None):
+    """Check the files of the revision instead of those in the working tree."""
+    if home is None:
+        home = util.get_project_home()
+    tree = create_tree(revision, home)
+    files.set_revision_tree(tree)
+    return tree
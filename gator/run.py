@@ -1,15 +1,124 @@
 """Run a specified process."""
 
+from gator import cache
 from gator import constants
+from gator import shell
+from gator import util
 
+import asyncio
+import errno
+import os
+import re
+import selectors
+import shlex
+import shutil
+import signal
 import subprocess
 import sys
+import time
 
+# the resource module is only available on POSIX systems
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
 
-def specified_command_get_output(command):
+# define the name of the operating system family that can run commands without a shell
+POSIX = "posix"
+
+# create the empty list of the resource usage of each command
+usages = []
+
+# define the number of bytes in a kilobyte
+KILOBYTE = 1024
+
+# define the name of the platform that reports memory usage in bytes
+MACOS = "darwin"
+
+# define the size of each read from the output and error of a process
+READ_SIZE = 65536
+
+# define the program that runs a command and reports the resources that only the
+# command used, which runs without the site packages to use as little memory as possible
+LAUNCHER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "launcher.py")
+LAUNCHER_OPTIONS = ["-S", "-I"]
+
+# define the number that the shell adds to a signal to create a return code
+SHELL_SIGNAL_OFFSET = 128
+
+# define the number of bytes in a megabyte
+MEGABYTE = 1024 * 1024
+
+# define the resource and the scale of its value for each of the limits
+if resource is not None:
+    RESOURCE_LIMITS = {
+        constants.limits.Cpu: (resource.RLIMIT_CPU, 1),
+        constants.limits.Memory: (resource.RLIMIT_AS, MEGABYTE),
+        constants.limits.Files: (resource.RLIMIT_NOFILE, 1),
+        constants.limits.Processes: (resource.RLIMIT_NPROC, 1),
+    }
+
+# define the units of the limits that are not a count, for describing them
+LIMIT_UNITS = {constants.limits.Cpu: " second(s)", constants.limits.Memory: " MB"}
+
+# define the errors that a command reports when it violates one of the limits
+LIMIT_ERRORS = [
+    (
+        constants.limits.Memory,
+        [os.strerror(errno.ENOMEM), "MemoryError", "bad_alloc", "out of memory"],
+    ),
+    (constants.limits.Files, [os.strerror(errno.EMFILE)]),
+    (constants.limits.Processes, [os.strerror(errno.EAGAIN), "fork"]),
+]
+
+# define the backend that runs commands, which can be chosen with an environment variable
+BACKEND = os.environ.get(
+    constants.environmentvariables.Backend, constants.backends.Process
+)
+
+# define whether or not to let the subprocess module launch programs with posix_spawn;
+# Python 3.10 and later launch programs with vfork, which is faster than posix_spawn
+USE_POSIX_SPAWN = hasattr(os, "posix_spawn") and sys.version_info < (3, 10)
+
+# define regular expression for the characters that only the shell understands
+SHELL_METACHARACTERS_RE = re.compile(r"[|&;<>()$`\\*?\[\]{}~#\n]")
+
+# define the builtins of the shell that either have no program or that must
+# run inside of the shell because they change the shell's own state
+SHELL_BUILTINS = frozenset(
+    [
+        ".",
+        "alias",
+        "cd",
+        "command",
+        "eval",
+        "exec",
+        "exit",
+        "export",
+        "read",
+        "readonly",
+        "set",
+        "shift",
+        "source",
+        "trap",
+        "type",
+        "ulimit",
+        "umask",
+        "unset",
+        "wait",
+    ]
+)
+
+
+def specified_command_get_output(command, inputs=None, refresh=False, limits=None):
     """Run the command and return the output as a String."""
     # run the command and gather the output and error details
-    output, error, code = run_command(command)
+    output, error, code = run_command(command, inputs, refresh, limits)
+    return get_produced_output(output, error, code)
+
+
+def get_produced_output(output, error, code):
+    """Return the output of a command as a String when the command did not fail."""
     # there was no error, so process the output
     produced_output = constants.markers.Nothing
     if error == constants.markers.Empty and code == constants.codes.Success:
@@ -34,17 +143,375 @@ def get_actual_output(output):
     return actual_output
 
 
-def run_command(command):
-    """Run a command and return the output and error code."""
+def get_cache_key(command, inputs, refresh, limits=None):
+    """Return the key and the cached result for a command, refreshing it if asked."""
+    # the key for the cache depends on the command, its limits, and the contents
+    # of the files matched by the inputs, which are rooted in the project directory
+    if limits:
+        command = command + constants.markers.Space + str(sorted(limits.items()))
+    key = cache.create_key(command, inputs, util.get_project_home())
+    # the person running the check asked for a fresh result, so forget the old one
+    if refresh:
+        cache.invalidate(key)
+        return key, None
+    # none of the inputs changed since the command last ran, so replay its result
+    return key, cache.lookup(key)
+
+
+def run_command(command, inputs=None, refresh=False, limits=None):
+    """Run a command, or replay its cached result when its inputs did not change."""
+    # the command did not declare its inputs, so it must always run
+    if not inputs:
+        return run_process(command, limits)
+    start = time.perf_counter()
+    key, cached_result = get_cache_key(command, inputs, refresh, limits)
+    if cached_result is not None:
+        record_usage(command, time.perf_counter() - start, cached=True)
+        return cached_result
+    # the result is not cached, so run the command and then cache its result
+    output, error, code = run_process(command, limits)
+    cache.store(key, command, output, error, code)
+    return output, error, code
+
+
+async def gather_with_limit(awaitables, limit):
+    """Await all of the awaitables, with at most limit of them running at once."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def await_with_limit(awaitable):
+        """Await the awaitable once fewer than limit others are running."""
+        async with semaphore:
+            return await awaitable
+
+    # the results are in the same order as the provided awaitables
+    return await asyncio.gather(
+        *[await_with_limit(awaitable) for awaitable in awaitables]
+    )
+
+
+def get_direct_arguments(command):
+    """Return the arguments for running a command without a shell, or None if it needs one."""
+    # only POSIX systems can launch a command without the shell's help
+    if os.name != POSIX:
+        return None
+    # the command uses a feature of the shell (e.g., a pipe or a variable)
+    if SHELL_METACHARACTERS_RE.search(command):
+        return None
+    # split the command into its arguments, handling quotes just like the shell
+    try:
+        arguments = shlex.split(command)
+    except ValueError:
+        return None
+    # there is nothing to run, the program is one of the shell's builtins,
+    # or the command starts by assigning a variable (e.g., "NAME=value program")
+    if not arguments or arguments[0] in SHELL_BUILTINS or "=" in arguments[0]:
+        return None
+    # the program must be found so that it can be run by its full path
+    program = shutil.which(arguments[0])
+    if program is None:
+        return None
+    return [program] + arguments[1:]
+
+
+def set_backend(backend):
+    """Set the backend that runs commands, returning the previous backend."""
+    # pylint: disable=global-statement
+    global BACKEND
+    previous_backend = BACKEND
+    BACKEND = backend
+    return previous_backend
+
+
+def run_process(command, limits=None):
+    """Run a command with the chosen backend and return the output and error code."""
+    start = time.perf_counter()
+    # the long-lived shells are only available on POSIX systems and, since
+    # they were started earlier, they cannot limit the resources of a command
+    if BACKEND == constants.backends.Shell and os.name == POSIX and not limits:
+        output, error, code = shell.run_command(command)
+        # the command ran in a shell started earlier, so only its time is known
+        record_usage(command, time.perf_counter() - start)
+        return output, error, code
+    arguments = get_direct_arguments(command)
+    # the command does not need the shell, so avoid starting one
+    if arguments is not None:
+        try:
+            return run_direct_process(arguments, command, limits)
+        # the program could not be launched, so let the shell report the problem
+        except OSError:
+            pass
+    return run_shell_process(command, limits)
+
+
+def run_direct_process(arguments, command=None, limits=None):
+    """Run a program with its arguments in a new process without a shell."""
+    # by default, describe the command by joining all of its arguments
+    if command is None:
+        command = constants.markers.Space.join(arguments)
+    start = time.perf_counter()
+    # since the program is given by its full path, the subprocess module can use the
+    # fast posix_spawn as long as file descriptors are not closed and there are no
+    # limits to apply; this is safe because Python does not let a child inherit the
+    # descriptors that it opens by itself
+    process = subprocess.Popen(
+        arguments,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        close_fds=not USE_POSIX_SPAWN,
+        preexec_fn=create_limiter(limits),
+    )
+    # run the command and return the results
+    return wait_for_process(command, process, start)
+
+
+def run_shell_process(command, limits=None):
+    """Run a command with the shell in a new process."""
+    start = time.perf_counter()
     # configure the process that will run the command
     process = subprocess.Popen(
-        command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        shell=True,
+        preexec_fn=create_limiter(limits),
     )
     # run the command and return the results
-    output, error = process.communicate()
+    return wait_for_process(command, process, start)
+
+
+def wait_for_process(command, process, start):
+    """Wait for a process to finish, recording its resource usage and returning its results."""
+    # the operating system cannot report the resource usage of one process,
+    # so only record the time that the command took to run
+    if not hasattr(os, "wait4"):
+        output, error = process.communicate()
+        record_usage(command, time.perf_counter() - start)
+        return output, error, process.returncode
+    # read all of the output and error before collecting the finished process
+    # so that its resource usage, which includes all of the processes that
+    # it waited for (e.g., the programs started by a shell), is available
+    output, error = read_streams(process)
+    _, status, resource_usage = os.wait4(process.pid, 0)
+    # the process was collected here, so tell the subprocess module its return code
+    if os.WIFSIGNALED(status):
+        process.returncode = -os.WTERMSIG(status)
+    else:
+        process.returncode = os.WEXITSTATUS(status)
+    record_usage(
+        command,
+        time.perf_counter() - start,
+        (resource_usage.ru_utime, resource_usage.ru_stime),
+        get_own_memory(resource_usage),
+    )
     return output, error, process.returncode
 
 
+def run_launched_process(command):
+    """Run a command through the launcher, recording the resources that only it used."""
+    # the launcher needs functions that are only available on POSIX systems
+    if not hasattr(os, "posix_spawn") or not hasattr(os, "wait4"):
+        return run_process(command)
+    start = time.perf_counter()
+    arguments = get_direct_arguments(command)
+    if arguments is None:
+        arguments = [constants.shells.Program, "-c", command]
+    # the launcher writes the status and the resource usage of the command to a
+    # pipe of its own, leaving the output and the error to the command
+    read_descriptor, write_descriptor = os.pipe()
+    try:
+        process = subprocess.Popen(
+            [sys.executable, *LAUNCHER_OPTIONS, LAUNCHER, str(write_descriptor)]
+            + arguments,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            pass_fds=[write_descriptor],
+        )
+    finally:
+        os.close(write_descriptor)
+    output, error = process.communicate()
+    with os.fdopen(read_descriptor, "rb") as report_file:
+        report = report_file.read().split()
+    # the launcher could not start the command, so only the time it took is known
+    if not report:
+        record_usage(command, time.perf_counter() - start)
+        return output, error, process.returncode
+    status, wall, user, system, maximum_memory = report
+    record_usage(
+        command,
+        float(wall),
+        (float(user), float(system)),
+        get_memory(int(maximum_memory)),
+    )
+    return output, error, os.waitstatus_to_exitcode(int(status))
+
+
+def read_streams(process):
+    """Read the output and error of a process until both of them are closed."""
+    buffers = {process.stdout: [], process.stderr: []}
+    with selectors.DefaultSelector() as selector:
+        for stream in buffers:
+            selector.register(stream, selectors.EVENT_READ)
+        while selector.get_map():
+            for key, _ in selector.select():
+                data = os.read(key.fd, READ_SIZE)
+                # the process closed this stream, so stop reading from it
+                if not data:
+                    selector.unregister(key.fileobj)
+                    key.fileobj.close()
+                else:
+                    buffers[key.fileobj].append(data)
+    return (
+        constants.markers.Empty.join(buffers[process.stdout]),
+        constants.markers.Empty.join(buffers[process.stderr]),
+    )
+
+
+def create_limits(cpu=None, memory=None, files=None, processes=None):
+    """Create the limits on the resources of a command, omitting those not given."""
+    limits = {
+        constants.limits.Cpu: cpu,
+        constants.limits.Memory: memory,
+        constants.limits.Files: files,
+        constants.limits.Processes: processes,
+    }
+    return {name: value for name, value in limits.items() if value is not None}
+
+
+def create_limiter(limits):
+    """Create a function that applies the limits in a new process before it runs."""
+    # there are no limits or the operating system cannot apply them
+    if not limits or resource is None:
+        return None
+    # Compute the soft and hard limits before starting the process so that the
+    # function only calls setrlimit, which is safe in a new process. The hard
+    # limit on CPU time is one second more than the soft one so that the command
+    # first receives a SIGXCPU signal that is reported as its own failure.
+    resource_limits = []
+    for name, value in limits.items():
+        kind, scale = RESOURCE_LIMITS[name]
+        soft_limit = value * scale
+        hard_limit = soft_limit + 1 if name == constants.limits.Cpu else soft_limit
+        # a limit cannot be raised above the current hard limit
+        _, current_hard_limit = resource.getrlimit(kind)
+        if current_hard_limit != resource.RLIM_INFINITY:
+            soft_limit = min(soft_limit, current_hard_limit)
+            hard_limit = min(hard_limit, current_hard_limit)
+        resource_limits.append((kind, (soft_limit, hard_limit)))
+
+    def limit_resources():
+        """Apply the limits to the resources of the new process."""
+        for kind, soft_and_hard_limits in resource_limits:
+            resource.setrlimit(kind, soft_and_hard_limits)
+
+    return limit_resources
+
+
+def get_limit_violation(limits, error, code):
+    """Return the name of the limit that a command violated, or None if it did not."""
+    # there were no limits, so the command could not have violated them
+    if not limits or resource is None:
+        return None
+    # a command that used all of its CPU time receives SIGXCPU (or SIGKILL, when it
+    # ignores SIGXCPU); the shell reports that a program it ran received a signal
+    # with a return code of 128 plus the number of the signal
+    if constants.limits.Cpu in limits and code in (
+        -signal.SIGXCPU,
+        -signal.SIGKILL,
+        SHELL_SIGNAL_OFFSET + signal.SIGXCPU,
+        SHELL_SIGNAL_OFFSET + signal.SIGKILL,
+    ):
+        return constants.limits.Cpu
+    # the command did not succeed, so look for the errors that a limit would cause
+    if code != constants.codes.Success:
+        decoded_error = error.decode(errors="replace")
+        for name, messages in LIMIT_ERRORS:
+            if name in limits and any(message in decoded_error for message in messages):
+                return name
+    return None
+
+
+def get_memory(maximum_memory):
+    """Return a maximum resident set size in kilobytes."""
+    # MacOS reports the maximum resident set size in bytes instead of kilobytes
+    if sys.platform == MACOS:
+        return maximum_memory // KILOBYTE
+    return maximum_memory
+
+
+def get_own_memory(resource_usage):
+    """Return the peak memory in kilobytes that only the process used, or None if unknown."""
+    # A new process starts with the memory of GatorGrader and the operating system
+    # includes that memory in the peak of the new process. The peak only belongs
+    # to the process when it is more than GatorGrader ever used; otherwise, the
+    # process used at most as much memory as GatorGrader, but how much is not known.
+    maximum_memory = get_memory(resource_usage.ru_maxrss)
+    if maximum_memory <= get_memory(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss):
+        return None
+    return maximum_memory
+
+
+def record_usage(command, wall, cpu_times=None, memory=None, cached=False):
+    """Record the wall time and, if known, the CPU time and memory used by a command."""
+    usage = {
+        constants.usages.Command: command,
+        constants.usages.Wall: wall,
+        constants.usages.User: None,
+        constants.usages.System: None,
+        constants.usages.Memory: memory,
+        constants.usages.Cached: cached,
+    }
+    if cpu_times is not None:
+        usage[constants.usages.User], usage[constants.usages.System] = cpu_times
+    usages.append(usage)
+    return usage
+
+
+def get_usages():
+    """Return the resource usage of all of the commands run so far."""
+    return usages
+
+
+def get_last_usage():
+    """Return the resource usage of the most recently run command, if there is one."""
+    if usages:
+        return usages[-1]
+    return None
+
+
+def reset_usages():
+    """Forget the resource usage of all of the commands run so far."""
+    usages.clear()
+
+
+def summarize_usages():
+    """Summarize the resource usage of all of the commands run so far."""
+    summary = {
+        constants.usages.Commands: len(usages),
+        constants.usages.Wall: sum(usage[constants.usages.Wall] for usage in usages),
+        constants.usages.User: sum(
+            usage[constants.usages.User] or 0 for usage in usages
+        ),
+        constants.usages.System: sum(
+            usage[constants.usages.System] or 0 for usage in usages
+        ),
+        # the memory of a command is not always known, so only use the known values
+        constants.usages.Memory: max(
+            (
+                usage[constants.usages.Memory]
+                for usage in usages
+                if usage[constants.usages.Memory] is not None
+            ),
+            default=None,
+        ),
+        constants.usages.Slowest: None,
+    }
+    # name the command that took the longest so that it is easy to investigate
+    if usages:
+        slowest_usage = max(usages, key=lambda usage: usage[constants.usages.Wall])
+        summary[constants.usages.Slowest] = slowest_usage[constants.usages.Command]
+    return summary
+
+
 def run_exit(exit_value):
     """Exit from the program using the provided exit value."""
     sys.exit(exit_value)
@@ -0,0 +1,155 @@
+"""Run commands in long-lived shells that are reused across many commands."""
+
+import atexit
+import os
+import selectors
+import shlex
+import signal
+import subprocess
+import time
+import uuid
+
+from gator import constants
+
+# create the empty table of the running shells, one for each working directory
+shells = {}
+
+# define the size of each read from the output and error of a shell
+READ_SIZE = 65536
+
+
+def start_shell(directory):
+    """Start a shell in the directory and record it as the shell for that directory."""
+    # the shell starts a new session so that it, and all of the processes
+    # that it starts, can be stopped together when a command is hung
+    process = subprocess.Popen(
+        [constants.shells.Program],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=directory,
+        start_new_session=True,
+    )
+    shells[directory] = process
+    return process
+
+
+def get_shell(directory):
+    """Return the running shell for the directory, starting a new one if needed."""
+    process = shells.get(directory)
+    # there is no shell for this directory or the previous one stopped
+    if process is None or process.poll() is not None:
+        process = start_shell(directory)
+    return process
+
+
+def stop_shell(directory):
+    """Stop the shell for the directory, along with all of the processes it started."""
+    process = shells.pop(directory, None)
+    # there was never a shell for this directory, so there is nothing to stop
+    if process is None:
+        return False
+    # the shell is still running, so stop its entire session
+    if process.poll() is None:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        # the shell stopped before it could be killed
+        except ProcessLookupError:
+            pass
+    process.wait()
+    for stream in (process.stdin, process.stdout, process.stderr):
+        stream.close()
+    return True
+
+
+def stop_shells():
+    """Stop all of the running shells."""
+    for directory in list(shells):
+        stop_shell(directory)
+
+
+# stop all of the running shells when GatorGrader finishes
+atexit.register(stop_shells)
+
+
+def create_framed_command(command, sentinel):
+    """Create the text that runs the command and then marks the end of its results."""
+    # The command runs in a subshell with eval so that it cannot change the state of
+    # the long-lived shell (e.g., with "cd" or "exit") and so that a syntax error only
+    # fails the command. The sentinel, followed by the return code, marks the end of
+    # the output and the sentinel on its own marks the end of the error.
+    return (
+        "( eval "
+        + shlex.quote(command)
+        + " ) < /dev/null\n"
+        + "printf '%s %d\\n' "
+        + sentinel
+        + ' "$?"\n'
+        + "printf '%s' "
+        + sentinel
+        + " >&2\n"
+    )
+
+
+def read_framed_result(process, sentinel, timeout):
+    """Read the output, error, and return code of a framed command from the shell."""
+    marker = sentinel.encode()
+    buffers = {process.stdout: b"", process.stderr: b""}
+    finished = set()
+    deadline = time.monotonic() + timeout
+    with selectors.DefaultSelector() as selector:
+        for stream in buffers:
+            selector.register(stream, selectors.EVENT_READ)
+        # keep reading until both the output and the error contain the sentinel
+        while len(finished) < len(buffers):
+            remaining = deadline - time.monotonic()
+            # the command did not finish in time, so it is hung
+            if remaining <= 0:
+                return None
+            for key, _ in selector.select(remaining):
+                data = os.read(key.fd, READ_SIZE)
+                # the shell stopped before the command finished
+                if not data:
+                    return None
+                buffers[key.fileobj] += data
+                if marker in buffers[key.fileobj]:
+                    finished.add(key.fileobj)
+                    selector.unregister(key.fileobj)
+    # the output ends with the sentinel and the return code on their own line,
+    # so wait for the entire line before extracting the return code
+    output, _, code_line = buffers[process.stdout].partition(marker)
+    while not code_line.endswith(b"\n"):
+        data = os.read(process.stdout.fileno(), READ_SIZE)
+        if not data:
+            return None
+        code_line += data
+    error = buffers[process.stderr].partition(marker)[0]
+    return output, error, int(code_line)
+
+
+def run_command(command, directory=None, timeout=constants.shells.Timeout):
+    """Run a command in the long-lived shell for the directory and return its results."""
+    # by default, commands run in the current working directory
+    if directory is None:
+        directory = os.getcwd()
+    process = get_shell(directory)
+    # a unique sentinel ensures that the command's own output cannot end its results
+    sentinel = uuid.uuid4().hex
+    try:
+        process.stdin.write(create_framed_command(command, sentinel).encode())
+        process.stdin.flush()
+        result = read_framed_result(process, sentinel, timeout)
+    # the shell stopped while the command was being sent to it
+    except BrokenPipeError:
+        result = None
+    # the command was hung or the shell stopped, so restart the shell
+    # for the next command and report that this command did not work
+    if result is None:
+        stop_shell(directory)
+        diagnostic = (
+            "The command did not finish within "
+            + str(timeout)
+            + " seconds or stopped its shell"
+        )
+        return constants.markers.Empty, diagnostic.encode(), constants.codes.Timeout
+    return result
@@ -0,0 +1,146 @@
+"""Perform checks at every commit in the history of a repository."""
+
+from gator import arguments
+from gator import checkers
+from gator import constants
+from gator import files
+from gator import report
+from gator import repository
+from gator import revision
+from gator import util
+
+# define the keys in the results of checks across the history
+COMMIT = "commit"
+OUTCOMES = "outcomes"
+REUSED = "reused"
+
+
+def get_history_commits(toplevel, step=1):
+    """Return every step-th commit reachable from HEAD, oldest first and ending at HEAD."""
+    output = repository.run_git(
+        toplevel,
+        constants.versioncontrol.Rev_List,
+        "--reverse",
+        constants.versioncontrol.Head,
+    )
+    # the repository does not have any commits
+    if not output:
+        return []
+    commits = output.split()
+    chosen_commits = commits[::step]
+    # the most recent commit is always checked
+    if chosen_commits[-1] != commits[-1]:
+        chosen_commits.append(commits[-1])
+    return chosen_commits
+
+
+def get_signature(tree, globs):
+    """Return the files, and their blobs, matched in the tree by the globs."""
+    return tuple(
+        (
+            file_or_glob,
+            tuple(
+                sorted(
+                    (str(revision_path), revision_path.object_id)
+                    for revision_path in tree.match(file_or_glob, files.excludes)
+                )
+            ),
+        )
+        for file_or_glob in globs
+    )
+
+
+def load_check(check_arguments):
+    """Load the check specified by the command-line arguments and parse its arguments."""
+    parsed_arguments, remaining_arguments = arguments.parse(check_arguments)
+    checker_source = checkers.get_source([checkers.get_checker_dir(parsed_arguments)])
+    check_file = checkers.transform_check(checkers.get_chosen_check(parsed_arguments))
+    check = checker_source.load_plugin(check_file)
+    return check, parsed_arguments, remaining_arguments
+
+
+def perform_check(loaded_check):
+    """Perform a loaded check, returning True if all of its results passed."""
+    check, parsed_arguments, remaining_arguments = loaded_check
+    report.reset()
+    check_results = check.act(parsed_arguments, remaining_arguments)
+    return all(check_results)
+
+
+def check_history(checks, home=None, step=1):
+    """Perform the checks at every step-th commit, reusing results for unchanged files."""
+    if home is None:
+        home = util.get_project_home()
+    toplevel = revision.get_toplevel(home)
+    # the home is not in a repository, so there is no history to check
+    if toplevel is None:
+        return []
+    # load each check once since the same checks are performed at every commit
+    loaded_checks = [load_check(check_arguments) for check_arguments in checks]
+    history_results = []
+    # remember the signature of the files read by each check and its outcome
+    previous_signatures = [None] * len(checks)
+    previous_outcomes = [None] * len(checks)
+    contents = {}
+    previous_revision_tree = files.revision_tree
+    try:
+        for commit in get_history_commits(toplevel, step):
+            tree = revision.RevisionTree(toplevel, commit, contents)
+            files.set_revision_tree(tree)
+            outcomes = []
+            reused = 0
+            for index, loaded_check in enumerate(loaded_checks):
+                # the check read the same blobs at the previous commit, so it
+                # must have the same outcome and there is no need to perform it
+                previous_signature = previous_signatures[index]
+                if previous_signature and previous_signature == get_signature(
+                    tree, [file_or_glob for file_or_glob, _ in previous_signature]
+                ):
+                    outcomes.append(previous_outcomes[index])
+                    reused = reused + 1
+                    continue
+                tree.globs = []
+                outcome = perform_check(loaded_check)
+                previous_signatures[index] = get_signature(tree, tree.globs)
+                previous_outcomes[index] = outcome
+                outcomes.append(outcome)
+            history_results.append({COMMIT: commit, OUTCOMES: outcomes, REUSED: reused})
+    finally:
+        files.set_revision_tree(previous_revision_tree)
+    return history_results
+
+
+def get_first_passing_commits(history_results, number_checks):
+    """Return the first commit at which each check passed, or None if it never passed."""
+    first_passing_commits = [None] * number_checks
+    for history_result in history_results:
+        for index, outcome in enumerate(history_result[OUTCOMES]):
+            if outcome and first_passing_commits[index] is None:
+                first_passing_commits[index] = history_result[COMMIT]
+    return first_passing_commits
+
+
+def output_matrix(history_results, checks):
+    """Produce the matrix of each check's outcome at each commit in textual format."""
+    short_hash = constants.versioncontrol.Short_Hash
+    lines = []
+    # each row has the commit and then the symbol for each check's outcome
+    for history_result in history_results:
+        lines.append(
+            history_result[COMMIT][:short_hash]
+            + constants.markers.Space
+            + constants.markers.Space.join(
+                util.get_symbol_answer(outcome) for outcome in history_result[OUTCOMES]
+            )
+        )
+    # summarize the first commit at which each of the checks passed
+    first_passing_commits = get_first_passing_commits(history_results, len(checks))
+    for check_arguments, first_passing_commit in zip(checks, first_passing_commits):
+        if first_passing_commit is None:
+            passing_summary = "never passed"
+        else:
+            passing_summary = "first passed at " + first_passing_commit[:short_hash]
+        lines.append(
+            constants.markers.Space.join(check_arguments) + ": " + passing_summary
+        )
+    return constants.markers.Newline.join(lines)
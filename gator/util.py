@@ -197,6 +197,22 @@ def greater_than_equal_exacted(first, second, exact=False):
     return False, first
 
 
+def get_count_limit(expected_count, exact=False, stop_early=False):
+    """Return the count at which counting can stop, or None to count everything."""
+    # an exact check must count everything, while a check for a minimum
+    # number only needs to count up to the minimum when it stops early
+    if stop_early and not exact:
+        return expected_count
+    return None
+
+
+def describe_count(count, limit=None):
+    """Describe a count, which is only a minimum when counting stopped at the limit."""
+    if limit is not None and count >= limit:
+        return constants.words.At_Least + constants.markers.Space + str(count)
+    return str(count)
+
+
 def get_number_as_words(number, format=constants.words.Ordinal):
     """Return a textual version of the provided word."""
     return num2words(number, to=format)
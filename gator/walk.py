@@ -0,0 +1,280 @@
+"""Match globs by walking the file system with scandir, pruning directories."""
+
+import fnmatch
+import os
+import re
+
+from pathlib import Path
+
+from gator import constants
+
+# define the characters that make a part of a glob match more than one name
+MAGIC = re.compile("[*?[]")
+
+# define the character that starts the name of a hidden file
+HIDDEN = "."
+
+# define the character that starts a comment or a negated rule in a .gitignore
+COMMENT = "#"
+NEGATION = "!"
+
+
+def has_magic(part):
+    """Return True if the part of a glob contains a wildcard."""
+    return MAGIC.search(part) is not None
+
+
+def is_hidden(name, pattern_part):
+    """Return True if a wildcard cannot match the name since it is hidden."""
+    return name.startswith(HIDDEN) and not pattern_part.startswith(HIDDEN)
+
+
+def translate_rule(pattern):
+    """Translate a pattern in a .gitignore into a regular expression."""
+    expression = []
+    index = 0
+    while index < len(pattern):
+        # "**/" matches zero or more directories
+        if pattern.startswith("**/", index):
+            expression.append("(?:.*/)?")
+            index = index + 3
+        # a final "**" matches everything inside of a directory
+        elif pattern.startswith("**", index):
+            expression.append(".*")
+            index = index + 2
+        elif pattern[index] == "*":
+            expression.append("[^/]*")
+            index = index + 1
+        elif pattern[index] == "?":
+            expression.append("[^/]")
+            index = index + 1
+        # a character class is the same in a glob and a regular expression,
+        # except that a glob negates the class with "!" instead of "^"
+        elif pattern[index] == "[" and "]" in pattern[index + 1 :]:
+            end = pattern.index("]", index + 1)
+            character_class = pattern[index + 1 : end]
+            if character_class.startswith(NEGATION):
+                character_class = "^" + character_class[1:]
+            expression.append("[" + character_class.replace("\\", "\\\\") + "]")
+            index = end + 1
+        else:
+            expression.append(re.escape(pattern[index]))
+            index = index + 1
+    return re.compile("".join(expression) + r"\Z")
+
+
+def read_rules(directory):
+    """Return the rules in the .gitignore of the directory, or an empty list."""
+    rules = []
+    try:
+        with open(
+            os.path.join(directory, constants.globs.Gitignore), encoding="utf-8"
+        ) as gitignore_file:
+            lines = gitignore_file.read().splitlines()
+    # the directory does not have a .gitignore that can be read
+    except (OSError, UnicodeDecodeError):
+        return rules
+    for line in lines:
+        line = line.rstrip()
+        if not line or line.startswith(COMMENT):
+            continue
+        negated = line.startswith(NEGATION)
+        if negated:
+            line = line[1:]
+        # a trailing slash means the rule only matches directories
+        directory_only = line.endswith("/")
+        line = line.strip("/") if directory_only else line
+        # a rule with a slash before its end is relative to the .gitignore,
+        # while any other rule matches the name at any depth below it
+        anchored = "/" in line
+        line = line.lstrip("/")
+        rules.append(
+            (directory, translate_rule(line), negated, directory_only, anchored)
+        )
+    return rules
+
+
+def is_ignored(path, name, is_directory, rules):
+    """Return True if the rules of the .gitignore files ignore the path."""
+    ignored = False
+    # the last rule that matches the path decides, just like in Git
+    for directory, expression, negated, directory_only, anchored in rules:
+        if directory_only and not is_directory:
+            continue
+        if anchored:
+            candidate = os.path.relpath(path, directory).replace(os.sep, "/")
+        else:
+            candidate = name
+        if expression.match(candidate):
+            ignored = not negated
+    return ignored
+
+
+def is_excluded(name, excludes):
+    """Return True if the name matches one of the patterns to exclude."""
+    return any(fnmatch.fnmatchcase(name, exclude) for exclude in excludes)
+
+
+def is_pruned_name(name, pattern_part, excludes, recursive):
+    """Return True if a wildcard does not match the name or anything inside of it."""
+    if is_hidden(name, pattern_part):
+        return True
+    # only the names that a "**" reaches are excluded, so that a glob
+    # like "build/*.java" still matches the files it names
+    return recursive and is_excluded(name, excludes)
+
+
+def match_parts(path_parts, pattern_parts, excludes, recursive=False):
+    """Return True if the parts of a path match the parts of a glob, just like a walk."""
+    if not pattern_parts:
+        return not path_parts
+    if not path_parts and pattern_parts[0] != constants.globs.Recursive:
+        return False
+    pattern_part, remaining_parts = pattern_parts[0], pattern_parts[1:]
+    # "**" matches zero or more directories, so first match the remaining
+    # parts here and then match them after entering one more directory
+    if pattern_part == constants.globs.Recursive:
+        if remaining_parts and match_parts(path_parts, remaining_parts, excludes, True):
+            return True
+        if not path_parts or is_pruned_name(
+            path_parts[0], pattern_part, excludes, True
+        ):
+            return False
+        # a final "**" matches every file and directory
+        if not remaining_parts and len(path_parts) == 1:
+            return True
+        return match_parts(path_parts[1:], pattern_parts, excludes, True)
+    # a part without a wildcard names exactly one file or directory
+    if not has_magic(pattern_part):
+        matched = path_parts[0] == pattern_part
+    else:
+        matched = fnmatch.fnmatchcase(
+            path_parts[0], pattern_part
+        ) and not is_pruned_name(path_parts[0], pattern_part, excludes, recursive)
+    return matched and match_parts(path_parts[1:], remaining_parts, excludes, recursive)
+
+
+def match_paths(paths, pattern_parts, excludes=None):
+    """Return the values of the paths, keyed by "/"-separated path, that match the glob."""
+    if excludes is None:
+        excludes = constants.globs.Excludes
+    return [
+        value
+        for path, value in paths.items()
+        if match_parts(path.split("/"), pattern_parts, excludes)
+    ]
+
+
+def scan_directory(directory):
+    """Return the entries of the directory, or an empty list if it cannot be read."""
+    try:
+        with os.scandir(directory or os.curdir) as entries:
+            return list(entries)
+    # the directory does not exist or it is not a directory
+    except OSError:
+        return []
+
+
+def is_directory_entry(entry):
+    """Return True if the entry is a directory, following symbolic links like glob."""
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+class Walk:
+    """A walk of the file system that matches the parts of a glob."""
+
+    def __init__(self, excludes, gitignore):
+        """Create the walk with the patterns to exclude and the use of .gitignore."""
+        self.excludes = excludes
+        self.gitignore = gitignore
+
+    def get_rules(self, directory, rules):
+        """Return the rules that apply inside of the directory."""
+        if not self.gitignore:
+            return rules
+        return rules + read_rules(directory or os.curdir)
+
+    def is_pruned(self, entry, pattern_part, rules, recursive):
+        """Return True if a wildcard does not match the entry or anything inside of it."""
+        if is_pruned_name(entry.name, pattern_part, self.excludes, recursive):
+            return True
+        # like the patterns to exclude, the .gitignore only prunes the entries
+        # that a "**" reaches
+        if not recursive:
+            return False
+        return self.gitignore and is_ignored(
+            entry.path, entry.name, is_directory_entry(entry), rules
+        )
+
+    def match(self, directory, pattern_parts, rules, recursive=False):
+        """Yield the paths inside of the directory that match the parts of the glob."""
+        # the rules already include those of the .gitignore in the directory
+        pattern_part, remaining_parts = pattern_parts[0], pattern_parts[1:]
+        # "**" matches zero or more directories, so first match the remaining
+        # parts in this directory and then in each of its sub-directories
+        if pattern_part == constants.globs.Recursive:
+            if remaining_parts:
+                yield from self.match(directory, remaining_parts, rules, True)
+            yield from self.match_recursive(directory, remaining_parts, rules)
+        # a part without a wildcard names exactly one file or directory,
+        # so there is no need to list the directory
+        elif not has_magic(pattern_part):
+            path = os.path.join(directory, pattern_part)
+            if not remaining_parts:
+                if os.path.lexists(path):
+                    yield path
+            elif os.path.isdir(path):
+                yield from self.match(
+                    path, remaining_parts, self.get_rules(path, rules), recursive
+                )
+        else:
+            for entry in scan_directory(directory):
+                if not fnmatch.fnmatch(entry.name, pattern_part):
+                    continue
+                if self.is_pruned(entry, pattern_part, rules, recursive):
+                    continue
+                path = os.path.join(directory, entry.name)
+                if not remaining_parts:
+                    yield path
+                elif is_directory_entry(entry):
+                    yield from self.match(
+                        path, remaining_parts, self.get_rules(path, rules), recursive
+                    )
+
+    def match_recursive(self, directory, remaining_parts, rules):
+        """Yield the matches in every sub-directory, pruning before descending."""
+        for entry in scan_directory(directory):
+            # a pruned directory is never listed, so nothing inside of it is walked
+            if self.is_pruned(entry, constants.globs.Recursive, rules, True):
+                continue
+            path = os.path.join(directory, entry.name)
+            # a final "**" matches every file and directory
+            if not remaining_parts:
+                yield path
+            if is_directory_entry(entry) and not entry.is_symlink():
+                sub_rules = self.get_rules(path, rules)
+                if remaining_parts:
+                    yield from self.match(path, remaining_parts, sub_rules, True)
+                yield from self.match_recursive(path, remaining_parts, sub_rules)
+
+
+def iterate_glob(file_or_glob_path, excludes=None, gitignore=False):
+    """Yield a Path for each file or directory that matches the glob, while walking."""
+    if excludes is None:
+        excludes = constants.globs.Excludes
+    file_or_glob = str(file_or_glob_path)
+    drive, file_or_glob = os.path.splitdrive(file_or_glob)
+    # the glob is absolute, so the walk starts at the root of the file system
+    if os.path.isabs(file_or_glob):
+        root = drive + os.sep
+    else:
+        root = drive
+    pattern_parts = [part for part in file_or_glob.split(os.sep) if part]
+    if not pattern_parts:
+        return
+    walk = Walk(excludes, gitignore)
+    for path in walk.match(root, pattern_parts, walk.get_rules(root, [])):
+        yield Path(path)
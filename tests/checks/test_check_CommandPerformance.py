@@ -0,0 +1,124 @@
+"""Tests for CommandPerformance's input and verification of command-line arguments."""
+
+import pytest
+import os
+import sys
+
+from unittest.mock import patch
+
+from gator import arguments
+from gator import constants
+from gator import report
+from gator.checks import check_CommandPerformance
+
+
+def test_no_arguments_incorrect_system_exit(capsys):
+    """No command-line arguments causes SystemExit crash of argparse with error output."""
+    with pytest.raises(SystemExit):
+        _ = check_CommandPerformance.parse([])
+    captured = capsys.readouterr()
+    # there is no standard output
+    counted_newlines = captured.out.count("\n")
+    assert counted_newlines == 0
+    # standard error has two lines from pytest
+    assert "usage:" in captured.err
+    counted_newlines = captured.err.count("\n")
+    assert counted_newlines == 5
+
+
+@pytest.mark.parametrize(
+    "commandline_arguments",
+    [
+        (["--commandWRONG", "echo"]),
+        (["--command", "run", "--WRONG"]),
+        (["--command"]),
+        (["--command", "run", "--runs", "many"]),
+        (["--command", "run", "--wall"]),
+        (["--command", "run", "--percentile", "101"]),
+        (["--command", "run", "--percentile", "-1"]),
+        (["--command", "run", "--runs", "0"]),
+        (["--command", "run", "--runs", "-3"]),
+        (["--command", "run", "--warmup", "-1"]),
+    ],
+)
+def test_required_commandline_arguments_cannot_parse(commandline_arguments, capsys):
+    """Check that incorrect optional command-line arguments check correctly."""
+    with pytest.raises(SystemExit):
+        _ = check_CommandPerformance.parse(commandline_arguments)
+    captured = capsys.readouterr()
+    # there is no standard output
+    counted_newlines = captured.out.count("\n")
+    assert counted_newlines == 0
+    # standard error has two lines from pytest
+    assert "usage:" in captured.err
+    counted_newlines = captured.err.count("\n")
+    assert counted_newlines == 5
+
+
+@pytest.mark.parametrize(
+    "commandline_arguments, expected_runs, expected_warmup, expected_percentile",
+    [
+        (
+            ["--command", "run_command"],
+            constants.performance.Runs,
+            constants.performance.Warmup,
+            constants.performance.Percentile,
+        ),
+        (["--command", "run_command", "--runs", "9", "--warmup", "0"], 9, 0, 50),
+        (["--command", "run_command", "--percentile", "95", "--wall", "2"], 5, 1, 95),
+        (["--command", "run_command", "--runs", "1", "--percentile", "100"], 1, 1, 100),
+        (["--command", "run_command", "--percentile", "0"], 5, 1, 0),
+    ],
+)
+def test_optional_commandline_arguments_can_parse(
+    commandline_arguments,
+    expected_runs,
+    expected_warmup,
+    expected_percentile,
+    not_raises,
+):
+    """Check that correct optional command-line arguments check correctly."""
+    with not_raises(SystemExit):
+        check_parsed_arguments = check_CommandPerformance.parse(commandline_arguments)
+    assert check_parsed_arguments.runs == expected_runs
+    assert check_parsed_arguments.warmup == expected_warmup
+    assert check_parsed_arguments.percentile == expected_percentile
+
+
+@pytest.mark.parametrize(
+    "commandline_arguments, expected_result",
+    [
+        (["CommandPerformance", "--command", "WrongCommand", "--runs", "1"], False),
+        (
+            ["CommandPerformance", "--command", 'echo "Fast"', "--wall", "10"],
+            True,
+        ),
+        (
+            ["CommandPerformance", "--command", "sleep 0.2", "--wall", "0.05"],
+            False,
+        ),
+    ],
+)
+def test_act_produces_output(commandline_arguments, expected_result, load_checker):
+    """Check that using the check produces output."""
+    testargs = [os.getcwd()]
+    with patch.object(sys, "argv", testargs):
+        parsed_arguments, remaining_arguments = arguments.parse(commandline_arguments)
+        args_verified = arguments.verify(parsed_arguments)
+        assert args_verified is True
+        check_exists, checker_source, check_file = load_checker(parsed_arguments)
+        assert check_exists is True
+        check = checker_source.load_plugin(check_file)
+        check_result = check.act(parsed_arguments, remaining_arguments)
+        # check the result
+        assert check_result is not None
+        assert len(check_result) == 1
+        assert check_result[0] is expected_result
+        # check the contents of the report
+        assert report.get_result() is not None
+        assert len(report.get_result()["check"]) > 1
+        assert report.get_result()["outcome"] is expected_result
+        if expected_result:
+            assert report.get_result()["diagnostic"] == ""
+        else:
+            assert report.get_result()["diagnostic"] != ""
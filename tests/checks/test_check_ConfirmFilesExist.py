@@ -0,0 +1,119 @@
+"""Tests for ConfirmFilesExist's input and verification of command-line arguments."""
+
+import pytest
+import os
+import sys
+
+from unittest.mock import patch
+
+
+from gator import arguments
+from gator import report
+from gator.checks import check_ConfirmFilesExist
+
+
+def test_no_arguments_incorrect_system_exit(capsys):
+    """No command-line arguments causes SystemExit crash of argparse with error output."""
+    with pytest.raises(SystemExit):
+        _ = check_ConfirmFilesExist.parse([])
+    captured = capsys.readouterr()
+    # there is no standard output
+    counted_newlines = captured.out.count("\n")
+    assert counted_newlines == 0
+    # standard error has usage information from argparse
+    assert "usage:" in captured.err
+
+
+@pytest.mark.parametrize(
+    "commandline_arguments",
+    [
+        (["--directory", "directory"]),
+        (["--files"]),
+        (["--files", "filename"]),
+        (["--directory", "directory", "--files"]),
+        (["--directory", "directory", "--manifest"]),
+        (["--directory", "directory", "--files", "filename", "--manifest", "list"]),
+        (["--directory", "directory", "--manifestWRONG", "list"]),
+    ],
+)
+def test_required_commandline_arguments_cannot_parse(commandline_arguments, capsys):
+    """Check that incorrect optional command-line arguments check correctly."""
+    with pytest.raises(SystemExit):
+        _ = check_ConfirmFilesExist.parse(commandline_arguments)
+    captured = capsys.readouterr()
+    # there is no standard output
+    counted_newlines = captured.out.count("\n")
+    assert counted_newlines == 0
+    # standard error has usage information from argparse
+    assert "usage:" in captured.err
+
+
+@pytest.mark.parametrize(
+    "commandline_arguments",
+    [
+        (["--files", "filename", "--directory", "directoryname"]),
+        (["--directory", "directoryname", "--files", "first", "second"]),
+        (["--directory", "directoryname", "--manifest", "manifest.txt"]),
+    ],
+)
+def test_required_commandline_arguments_can_parse(commandline_arguments, not_raises):
+    """Check that correct optional command-line arguments check correctly."""
+    with not_raises(SystemExit):
+        _ = check_ConfirmFilesExist.parse(commandline_arguments)
+
+
+@pytest.mark.parametrize(
+    "required_files, manifest, expected_result",
+    [
+        (["first.txt", "second.txt"], None, True),
+        (["first.txt", "sub/third.txt"], None, True),
+        (["first.txt", "First.txt"], None, False),
+        (["first.txt", "missing.txt"], None, False),
+        (None, "# required files\nfirst.txt\n\nsub/third.txt\n", True),
+        (None, "first.txt\nsub/missing.txt\n", False),
+        (None, "# no required files\n\n", False),
+    ],
+)
+def test_act_produces_output(
+    required_files, manifest, expected_result, tmpdir, load_checker
+):
+    """Check that using the check produces output."""
+    testargs = [os.getcwd()]
+    with patch.object(sys, "argv", testargs):
+        containing_directory = tmpdir.mkdir("containing_directory")
+        containing_directory.join("first.txt").write("first")
+        containing_directory.join("second.txt").write("second")
+        containing_directory.mkdir("sub").join("third.txt").write("third")
+        commandline_arguments = [
+            "ConfirmFilesExist",
+            "--directory",
+            str(containing_directory),
+        ]
+        if required_files is not None:
+            commandline_arguments.extend(["--files"] + required_files)
+        else:
+            manifest_file = tmpdir.join("manifest.txt")
+            manifest_file.write(manifest)
+            commandline_arguments.extend(["--manifest", str(manifest_file)])
+        parsed_arguments, remaining_arguments = arguments.parse(commandline_arguments)
+        args_verified = arguments.verify(parsed_arguments)
+        assert args_verified is True
+        check_exists, checker_source, check_file = load_checker(parsed_arguments)
+        assert check_exists is True
+        check = checker_source.load_plugin(check_file)
+        check_result = check.act(parsed_arguments, remaining_arguments)
+        # check the result
+        assert check_result is not None
+        assert len(check_result) == 1
+        # check the contents of the report
+        assert report.get_result() is not None
+        assert len(report.get_result()["check"]) > 1
+        assert report.get_result()["outcome"] is expected_result
+        if expected_result:
+            assert report.get_result()["diagnostic"] == ""
+        else:
+            assert (
+                "missing.txt" in report.get_result()["diagnostic"]
+                or "First.txt" in report.get_result()["diagnostic"]
+                or "manifest.txt" in report.get_result()["diagnostic"]
+            )
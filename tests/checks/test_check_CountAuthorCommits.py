@@ -0,0 +1,103 @@
+"""Tests for CountAuthorCommits's input and verification of command-line arguments."""
+
+import pytest
+import os
+import sys
+
+from unittest.mock import patch
+
+
+from gator import arguments
+from gator import report
+from gator.checks import check_CountAuthorCommits
+
+
+def test_no_arguments_incorrect_system_exit(capsys):
+    """No command-line arguments causes SystemExit crash of argparse with error output."""
+    with pytest.raises(SystemExit):
+        _ = check_CountAuthorCommits.parse([])
+    captured = capsys.readouterr()
+    # there is no standard output
+    counted_newlines = captured.out.count("\n")
+    assert counted_newlines == 0
+    # standard error has two lines from pytest
+    assert "usage:" in captured.err
+    counted_newlines = captured.err.count("\n")
+    assert counted_newlines == 2
+
+
+@pytest.mark.parametrize(
+    "commandline_arguments",
+    [
+        (["--author", "Ada"]),
+        (["--count", "5"]),
+        (["--author", "Ada", "--count", "5", "--exactWRONG"]),
+    ],
+)
+def test_optional_commandline_arguments_cannot_verify(commandline_arguments, capsys):
+    """Check that incorrect optional command-line arguments check correctly."""
+    with pytest.raises(SystemExit):
+        _ = check_CountAuthorCommits.parse(commandline_arguments)
+    captured = capsys.readouterr()
+    # there is no standard output
+    counted_newlines = captured.out.count("\n")
+    assert counted_newlines == 0
+    # standard error has two lines from pytest
+    assert "usage:" in captured.err
+    counted_newlines = captured.err.count("\n")
+    assert counted_newlines == 2
+
+
+@pytest.mark.parametrize(
+    "commandline_arguments",
+    [
+        (["--author", "Ada", "--count", "5"]),
+        (["--count", "5", "--author", "Ada", "--exact"]),
+    ],
+)
+def test_required_commandline_arguments_can_parse(commandline_arguments, not_raises):
+    """Check that correct optional command-line arguments check correctly."""
+    with not_raises(SystemExit):
+        _ = check_CountAuthorCommits.parse(commandline_arguments)
+
+
+@pytest.mark.parametrize(
+    "commandline_arguments, expected_result",
+    [
+        (["CountAuthorCommits", "--author", "Ada", "--count", "2"], True),
+        (["CountAuthorCommits", "--author", "Ada", "--count", "3"], False),
+        (["CountAuthorCommits", "--author", "Grace", "--count", "1", "--exact"], True),
+        (["CountAuthorCommits", "--author", "Linus", "--count", "1"], False),
+    ],
+)
+def test_act_produces_output(
+    commandline_arguments,
+    expected_result,
+    load_checker,
+    history_repository,
+    monkeypatch,
+):
+    """Check that using the check produces output."""
+    testargs = [os.getcwd()]
+    with patch.object(sys, "argv", testargs):
+        parsed_arguments, remaining_arguments = arguments.parse(commandline_arguments)
+        args_verified = arguments.verify(parsed_arguments)
+        assert args_verified is True
+        check_exists, checker_source, check_file = load_checker(parsed_arguments)
+        assert check_exists is True
+        check = checker_source.load_plugin(check_file)
+        # the check inspects the repository in the current directory
+        monkeypatch.chdir(history_repository)
+        check_result = check.act(parsed_arguments, remaining_arguments)
+        # check the result
+        assert check_result is not None
+        assert len(check_result) == 1
+        assert check_result[0] is expected_result
+        # check the contents of the report
+        assert report.get_result() is not None
+        assert len(report.get_result()["check"]) > 1
+        assert report.get_result()["outcome"] is expected_result
+        if expected_result:
+            assert report.get_result()["diagnostic"] == ""
+        else:
+            assert report.get_result()["diagnostic"] != ""
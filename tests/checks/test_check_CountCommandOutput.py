@@ -22,7 +22,7 @@ def test_no_arguments_incorrect_system_exit(capsys):
     # standard error has two lines from pytest
     assert "usage:" in captured.err
     counted_newlines = captured.err.count("\n")
-    assert counted_newlines == 2
+    assert counted_newlines == 3
 
 
 @pytest.mark.parametrize(
@@ -46,7 +46,7 @@ def test_required_commandline_arguments_cannot_parse(commandline_arguments, caps
     # standard error has two lines from pytest
     assert "usage:" in captured.err
     counted_newlines = captured.err.count("\n")
-    assert counted_newlines == 2
+    assert counted_newlines == 3
 
 
 @pytest.mark.parametrize(
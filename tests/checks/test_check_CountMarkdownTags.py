@@ -49,6 +49,20 @@ def test_no_arguments_incorrect_system_exit(capsys):
                 "code",
             ]
         ),
+        (
+            [
+                "--file",
+                "filename",
+                "--directory",
+                "directory",
+                "--count",
+                "5",
+                "--tag",
+                "code",
+                "--tag",
+                "link",
+            ]
+        ),
     ],
 )
 def test_required_commandline_arguments_cannot_parse(commandline_arguments, capsys):
@@ -481,3 +495,61 @@ of GatorGrader. Depending on your goals, there are several different..."""
             assert report.get_result()["diagnostic"] == ""
         else:
             assert report.get_result()["diagnostic"] != ""
+
+
+@pytest.mark.parametrize(
+    "tags_and_counts, expected_result, expected_diagnostic",
+    [
+        (
+            ["--tag", "heading", "--count", "5", "--tag", "link", "--count", "3"],
+            True,
+            "",
+        ),
+        (
+            ["--tag", "heading", "--count", "5", "--tag", "image", "--count", "1"],
+            False,
+            "Found 0 'image' tag(s) in the file_to_find file",
+        ),
+        (
+            ["--tag", "heading", "--count", "1", "--tag", "link", "--count", "1"]
+            + ["--stop-early"],
+            True,
+            "",
+        ),
+        (
+            ["--count", "6", "--tag", "heading", "--count", "3", "--tag", "link"],
+            False,
+            "Found 5 'heading' tag(s) in the file_to_find file",
+        ),
+    ],
+)
+def test_act_produces_output_for_many_tags(
+    tags_and_counts, expected_result, expected_diagnostic, tmpdir, load_checker
+):
+    """Check that using the check with many tags produces one output for all of them."""
+    test_contents = (
+        "# GatorGrader\n\n## Installing\n\n## Running\n\n## Testing\n\n"
+        "### Automated Testing\n\nUse [Gradle](https://gradle.org), "
+        "[Pytest](https://pytest.org), and [Pipenv](https://pipenv.org).\n"
+    )
+    testargs = [os.getcwd()]
+    with patch.object(sys, "argv", testargs):
+        new_file = tmpdir.mkdir("containing_directory").join("file_to_find")
+        new_file.write(test_contents)
+        commandline_arguments = [
+            "CountMarkdownTags",
+            "--file",
+            "file_to_find",
+            "--directory",
+            str(tmpdir.join("containing_directory")),
+        ] + tags_and_counts
+        parsed_arguments, remaining_arguments = arguments.parse(commandline_arguments)
+        args_verified = arguments.verify(parsed_arguments)
+        assert args_verified is True
+        check_exists, checker_source, check_file = load_checker(parsed_arguments)
+        assert check_exists is True
+        check = checker_source.load_plugin(check_file)
+        check_result = check.act(parsed_arguments, remaining_arguments)
+        assert check_result == [expected_result]
+        assert report.get_result()["outcome"] is expected_result
+        assert report.get_result()["diagnostic"] == expected_diagnostic
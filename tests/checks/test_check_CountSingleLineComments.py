@@ -138,6 +138,18 @@ def test_required_commandline_arguments_cannot_parse(commandline_arguments, caps
                 "Java",
             ]
         ),
+        (
+            [
+                "--file",
+                "filename",
+                "--directory",
+                "directoryname",
+                "--count",
+                "5",
+                "--language",
+                "C++",
+            ]
+        ),
         (
             [
                 "--directory",
@@ -530,3 +542,41 @@ def test_act_produces_output_java(
             assert report.get_result()["diagnostic"] == ""
         else:
             assert report.get_result()["diagnostic"] != ""
+
+
+@pytest.mark.parametrize(
+    "language, chosen_file, contents, provided_count, expected_result",
+    [
+        ("C", "file.c", "int x; // a comment\n", "1", True),
+        ("C", "file.c", 'char *s = "// not a comment";\n', "1", False),
+        ("Go", "file.go", "s := `// not a comment`\n// a comment\n", "1", True),
+        ("Rust", "file.rs", "fn f<'a>() {} // a comment\n", "1", True),
+        ("Shell", "file.sh", 'echo "# not a comment" # a comment\n', "2", False),
+    ],
+)
+def test_act_produces_output_for_table_languages(
+    language, chosen_file, contents, provided_count, expected_result, tmpdir
+):
+    """Check that the check counts the comments of the languages in the table."""
+    testargs = [os.getcwd()]
+    with patch.object(sys, "argv", testargs):
+        tmpdir.join(chosen_file).write(contents)
+        commandline_arguments = [
+            "CountSingleLineComments",
+            "--file",
+            chosen_file,
+            "--directory",
+            str(tmpdir),
+            "--count",
+            provided_count,
+            "--language",
+            language,
+        ]
+        parsed_arguments, remaining_arguments = arguments.parse(commandline_arguments)
+        args_verified = arguments.verify(parsed_arguments)
+        assert args_verified is True
+        check_result = check_CountSingleLineComments.act(
+            parsed_arguments, remaining_arguments
+        )
+        assert len(check_result) == 1
+        assert report.get_result()["outcome"] is expected_result
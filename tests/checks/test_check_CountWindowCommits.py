@@ -0,0 +1,118 @@
+"""Tests for CountWindowCommits's input and verification of command-line arguments."""
+
+import pytest
+import os
+import sys
+
+from unittest.mock import patch
+
+
+from gator import arguments
+from gator import report
+from gator.checks import check_CountWindowCommits
+
+
+def test_no_arguments_incorrect_system_exit(capsys):
+    """No command-line arguments causes SystemExit crash of argparse with error output."""
+    with pytest.raises(SystemExit):
+        _ = check_CountWindowCommits.parse([])
+    captured = capsys.readouterr()
+    # there is no standard output
+    counted_newlines = captured.out.count("\n")
+    assert counted_newlines == 0
+    # standard error has two lines from pytest
+    assert "usage:" in captured.err
+    counted_newlines = captured.err.count("\n")
+    assert counted_newlines == 3
+
+
+@pytest.mark.parametrize(
+    "commandline_arguments",
+    [
+        (["--since", "2019-09-01"]),
+        (["--count", "5", "--since"]),
+        (["--count", "5", "--exactWRONG"]),
+        (["--count", "5", "--since", "September 1"]),
+        (["--count", "5", "--until", "2019-13-01"]),
+        (["--count", "5", "--since", "2019-09-01", "--until", "tomorrow"]),
+    ],
+)
+def test_optional_commandline_arguments_cannot_verify(commandline_arguments, capsys):
+    """Check that incorrect optional command-line arguments check correctly."""
+    with pytest.raises(SystemExit):
+        _ = check_CountWindowCommits.parse(commandline_arguments)
+    captured = capsys.readouterr()
+    # there is no standard output
+    counted_newlines = captured.out.count("\n")
+    assert counted_newlines == 0
+    # standard error has two lines from pytest
+    assert "usage:" in captured.err
+    counted_newlines = captured.err.count("\n")
+    assert counted_newlines == 3
+
+
+@pytest.mark.parametrize(
+    "commandline_arguments",
+    [
+        (["--count", "5"]),
+        (["--count", "5", "--since", "2019-09-01", "--until", "2019-09-30", "--exact"]),
+    ],
+)
+def test_required_commandline_arguments_can_parse(commandline_arguments, not_raises):
+    """Check that correct optional command-line arguments check correctly."""
+    with not_raises(SystemExit):
+        _ = check_CountWindowCommits.parse(commandline_arguments)
+
+
+@pytest.mark.parametrize(
+    "commandline_arguments, expected_result",
+    [
+        (["CountWindowCommits", "--count", "3"], True),
+        (["CountWindowCommits", "--count", "2", "--until", "2019-09-30"], True),
+        (["CountWindowCommits", "--count", "3", "--since", "2019-09-02"], False),
+        (
+            [
+                "CountWindowCommits",
+                "--count",
+                "1",
+                "--since",
+                "2019-09-02",
+                "--until",
+                "2019-09-30",
+                "--exact",
+            ],
+            True,
+        ),
+    ],
+)
+def test_act_produces_output(
+    commandline_arguments,
+    expected_result,
+    load_checker,
+    history_repository,
+    monkeypatch,
+):
+    """Check that using the check produces output."""
+    testargs = [os.getcwd()]
+    with patch.object(sys, "argv", testargs):
+        parsed_arguments, remaining_arguments = arguments.parse(commandline_arguments)
+        args_verified = arguments.verify(parsed_arguments)
+        assert args_verified is True
+        check_exists, checker_source, check_file = load_checker(parsed_arguments)
+        assert check_exists is True
+        check = checker_source.load_plugin(check_file)
+        # the check inspects the repository in the current directory
+        monkeypatch.chdir(history_repository)
+        check_result = check.act(parsed_arguments, remaining_arguments)
+        # check the result
+        assert check_result is not None
+        assert len(check_result) == 1
+        assert check_result[0] is expected_result
+        # check the contents of the report
+        assert report.get_result() is not None
+        assert len(report.get_result()["check"]) > 1
+        assert report.get_result()["outcome"] is expected_result
+        if expected_result:
+            assert report.get_result()["diagnostic"] == ""
+        else:
+            assert report.get_result()["diagnostic"] != ""
@@ -9,6 +9,7 @@ from unittest.mock import patch
 
 from gator import arguments
 from gator import report
+from gator import run
 from gator.checks import check_ExecuteCommand
 
 
@@ -23,12 +24,20 @@ def test_no_arguments_incorrect_system_exit(capsys):
     # standard error has two lines from pytest
     assert "usage:" in captured.err
     counted_newlines = captured.err.count("\n")
-    assert counted_newlines == 2
+    assert counted_newlines == 4
 
 
 @pytest.mark.parametrize(
     "commandline_arguments",
-    [(["--commandWRONG", "echo"]), (["--command", "run", "--WRONG"]), (["--command"])],
+    [
+        (["--commandWRONG", "echo"]),
+        (["--command", "run", "--WRONG"]),
+        (["--command"]),
+        (["--command", "run", "--cpu", "0"]),
+        (["--command", "run", "--memory", "-64"]),
+        (["--command", "run", "--files", "0"]),
+        (["--command", "run", "--processes", "-1"]),
+    ],
 )
 def test_required_commandline_arguments_cannot_parse(commandline_arguments, capsys):
     """Check that incorrect optional command-line arguments check correctly."""
@@ -41,7 +50,7 @@ def test_required_commandline_arguments_cannot_parse(commandline_arguments, caps
     # standard error has two lines from pytest
     assert "usage:" in captured.err
     counted_newlines = captured.err.count("\n")
-    assert counted_newlines == 2
+    assert counted_newlines == 4
 
 
 @pytest.mark.parametrize(
@@ -67,6 +76,55 @@ def test_optional_commandline_arguments_can_parse_created_parser(
         _ = check_ExecuteCommand.parse(commandline_arguments, parser)
 
 
+@pytest.mark.parametrize(
+    "commandline_arguments, expected_inputs, expected_refresh",
+    [
+        (["--command", "run_command_first"], None, False),
+        (["--command", "run_command", "--inputs", "*.py"], ["*.py"], False),
+        (
+            ["--command", "run_command", "--inputs", "*.py", "*.md", "--refresh"],
+            ["*.py", "*.md"],
+            True,
+        ),
+    ],
+)
+def test_optional_cache_commandline_arguments_can_parse(
+    commandline_arguments, expected_inputs, expected_refresh, not_raises
+):
+    """Check that the optional command-line arguments for caching parse correctly."""
+    with not_raises(SystemExit):
+        check_parsed_arguments = check_ExecuteCommand.parse(commandline_arguments)
+    assert check_parsed_arguments.inputs == expected_inputs
+    assert check_parsed_arguments.refresh is expected_refresh
+
+
+@pytest.mark.parametrize(
+    "commandline_arguments, expected_limits",
+    [
+        (["--command", "run_command"], {}),
+        (["--command", "run_command", "--cpu", "2"], {"cpu": 2}),
+        (
+            ["--command", "run_command", "--memory", "64", "--files", "16"],
+            {"memory": 64, "files": 16},
+        ),
+        (["--command", "run_command", "--processes", "8"], {"processes": 8}),
+    ],
+)
+def test_optional_limit_commandline_arguments_can_parse(
+    commandline_arguments, expected_limits, not_raises
+):
+    """Check that the optional command-line arguments for limits parse correctly."""
+    with not_raises(SystemExit):
+        check_parsed_arguments = check_ExecuteCommand.parse(commandline_arguments)
+    limits = run.create_limits(
+        check_parsed_arguments.cpu,
+        check_parsed_arguments.memory,
+        check_parsed_arguments.files,
+        check_parsed_arguments.processes,
+    )
+    assert limits == expected_limits
+
+
 @pytest.mark.parametrize(
     "commandline_arguments, expected_result",
     [
@@ -310,3 +310,47 @@ def test_act_produces_output(
             assert report.get_result()["diagnostic"] == ""
         else:
             assert report.get_result()["diagnostic"] != ""
+
+
+@pytest.mark.parametrize(
+    "provided_count, extra_arguments, expected_result",
+    [
+        ("2", ["--stop-early"], True),
+        ("4", ["--stop-early"], False),
+        ("3", ["--stop-early", "--exact"], True),
+        ("2", ["--stop-early", "--exact"], False),
+    ],
+)
+def test_act_produces_output_stopping_early(
+    provided_count, extra_arguments, expected_result, tmpdir, load_checker
+):
+    """Check that using the check and stopping at the minimum produces output."""
+    testargs = [os.getcwd()]
+    with patch.object(sys, "argv", testargs):
+        containing_directory = tmpdir.mkdir("containing_directory")
+        containing_directory.join("file_to_find").write("GatorGrader " * 3)
+        commandline_arguments = [
+            "MatchFileFragment",
+            "--file",
+            "file_to_find",
+            "--directory",
+            str(containing_directory),
+            "--fragment",
+            "GatorGrader",
+            "--count",
+            provided_count,
+        ] + extra_arguments
+        parsed_arguments, remaining_arguments = arguments.parse(commandline_arguments)
+        args_verified = arguments.verify(parsed_arguments)
+        assert args_verified is True
+        check_exists, checker_source, check_file = load_checker(parsed_arguments)
+        assert check_exists is True
+        check = checker_source.load_plugin(check_file)
+        check_result = check.act(parsed_arguments, remaining_arguments)
+        assert check_result == [expected_result]
+        assert report.get_result()["outcome"] is expected_result
+        # the failing counts are complete, since they never reach the minimum
+        if expected_result:
+            assert report.get_result()["diagnostic"] == ""
+        else:
+            assert "Found 3 fragment(s)" in report.get_result()["diagnostic"]
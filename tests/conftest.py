@@ -7,7 +7,12 @@ import pytest
 
 from contextlib import contextmanager
 
+from git import Actor
+from git import Repo
+
 from gator import checkers
+from gator import constants
+from gator import history
 
 
 GO_BACK_A_DIRECTORY = "/../"
@@ -16,9 +21,34 @@ GO_BACK_A_DIRECTORY = "/../"
 PREVIOUS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, PREVIOUS_DIRECTORY + GO_BACK_A_DIRECTORY)
 
-# define two fixtures for use in the test suites
+# define an option for running the benchmarks, which are skipped by default
+# because their comparisons of timings are not reliable on a loaded machine
+
+
+def pytest_addoption(parser):
+    """Add the option that runs the benchmarks."""
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="run the benchmarks that compare timings",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the benchmarks unless the option that runs them is given."""
+    if config.getoption("--benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="only runs with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+# define three fixtures for use in the test suites
 # --> load_checker
 # --> not_raises
+# --> history_repository
 
 
 @pytest.fixture(scope="session")
@@ -54,3 +84,28 @@ def not_raises():  # noqa: D202
             raise AssertionError(f"An unexpected exception {error} raised.") from error
 
     return _not_raises
+
+
+@pytest.fixture
+def history_repository(tmpdir, monkeypatch):
+    """Create a Git repository with commits by several authors and return its directory."""
+    monkeypatch.setenv(constants.environmentvariables.Cache, str(tmpdir.mkdir("cache")))
+    repository_directory = tmpdir.mkdir("repository")
+    temp_file = repository_directory.join("hello.txt")
+    testing_repository = Repo.init(str(repository_directory))
+    for number, (author, date, message) in enumerate(
+        [
+            ("Ada", "2019-09-01T09:00:00", "Add the first version of the program"),
+            ("Grace", "2019-09-15T10:00:00", "Fix"),
+            ("Ada", "2019-10-02T08:00:00", "Add the test cases for the program"),
+        ]
+    ):
+        temp_file.write("content " + str(number))
+        testing_repository.index.add([str(temp_file)])
+        testing_repository.index.commit(
+            message,
+            author=Actor(author, author.lower() + "@example.com"),
+            author_date=date,
+        )
+    yield repository_directory
+    history.histories.clear()
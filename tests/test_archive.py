@@ -0,0 +1,176 @@
+"""Test cases for the archive module."""
+
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+from gator import archive
+from gator import files
+from gator import fragments
+
+# define the members of the archives and their contents
+MEMBERS = {
+    "README.md": "First paragraph.\n\nSecond paragraph.\n",
+    ".hidden.md": "Hidden.\n",
+    "src/hello.py": "print('hello')\nprint('world')\n",
+    "src/nested/deep.py": "pass\n",
+}
+
+
+def create_zip(directory):
+    """Create a zip archive of the members."""
+    archive_path = str(directory.join("submission.zip"))
+    with zipfile.ZipFile(archive_path, "w") as zip_archive:
+        for name, contents in MEMBERS.items():
+            zip_archive.writestr(name, contents)
+    return archive_path
+
+
+def create_tar(directory):
+    """Create a compressed tar archive of the members."""
+    source_directory = directory.mkdir("source")
+    for name, contents in MEMBERS.items():
+        source_directory.join(name).write(contents, ensure=True)
+    archive_path = str(directory.join("submission.tar.gz"))
+    with tarfile.open(archive_path, "w:gz") as tar_archive:
+        tar_archive.add(str(source_directory), arcname=".")
+    return archive_path
+
+
+@pytest.fixture(params=[create_zip, create_tar])
+def archive_path(request, tmpdir):
+    """Create a zip and then a tar archive of the members."""
+    return request.param(tmpdir)
+
+
+# pylint: disable=redefined-outer-name
+@pytest.mark.parametrize(
+    "file_or_glob, expected_names",
+    [
+        ("README.md", ["README.md"]),
+        ("*.md", ["README.md"]),
+        (".*.md", [".hidden.md"]),
+        ("*", ["README.md", "src"]),
+        ("src/*.py", ["hello.py"]),
+        ("src/*/*.py", ["deep.py"]),
+        ("**/*.py", ["deep.py", "hello.py"]),
+        ("src/**/*.py", ["deep.py", "hello.py"]),
+        ("**/deep.py", ["deep.py"]),
+        ("src/**", ["deep.py", "hello.py", "nested"]),
+        ("missing.md", []),
+    ],
+)
+def test_create_paths_matches_members(archive_path, file_or_glob, expected_names):
+    """Check that globs match the members of an archive, just like a walk."""
+    paths = files.create_paths(file=file_or_glob, home=archive_path)
+    assert sorted(path.name for path in paths) == expected_names
+
+
+def test_archive_paths_act_like_paths(archive_path):
+    """Check that the paths in an archive can be read like a Path."""
+    paths = files.create_paths("src", file="hello.py", home=archive_path)
+    assert len(paths) == 1
+    assert paths[0].is_file() and not paths[0].is_dir()
+    assert paths[0].read_text() == MEMBERS["src/hello.py"]
+    assert str(paths[0]) == archive_path + "/src/hello.py"
+    directories = files.create_paths(file="src", home=archive_path)
+    assert directories[0].is_dir() and not directories[0].is_file()
+
+
+def test_only_read_members_are_decompressed(archive_path, monkeypatch):
+    """Check that only the members a check reads are decompressed."""
+    read_members = []
+    tree = archive.get_tree(archive_path)
+    read_bytes = tree.read_bytes
+
+    def record_read_bytes(member):
+        """Record each member that is read."""
+        read_members.append(member)
+        return read_bytes(member)
+
+    monkeypatch.setattr(tree, "read_bytes", record_read_bytes)
+    line_count, _ = fragments.count_lines("hello.py", os.path.join(archive_path, "src"))
+    assert line_count == 2
+    assert len(read_members) == 1
+
+
+@pytest.mark.parametrize(
+    "file, containing_directory, expected_found",
+    [
+        ("README.md", None, True),
+        ("readme.md", None, False),
+        ("hello.py", "src", True),
+        ("Hello.py", "src", False),
+        ("deep.py", "src", False),
+        ("src/hello.py", None, True),
+        ("nested/deep.py", "src", True),
+    ],
+)
+def test_check_file_in_archive(
+    archive_path, file, containing_directory, expected_found
+):
+    """Check that a file is only found in an archive with its exact name."""
+    containing_directories = [containing_directory] if containing_directory else []
+    assert (
+        files.check_file_in_directory(
+            *containing_directories, file=file, home=archive_path
+        )
+        is expected_found
+    )
+
+
+def test_find_missing_files_in_archive(archive_path):
+    """Check that the required files in sub-directories of an archive are found."""
+    required_files = [
+        "README.md",
+        "src/hello.py",
+        "src/nested/deep.py",
+        "src/missing.py",
+        "src",
+        "Readme.md",
+    ]
+    missing_files = files.find_missing_files(
+        required_files=required_files, home=archive_path
+    )
+    assert missing_files == ["src/missing.py", "src", "Readme.md"]
+
+
+def test_changed_archive_is_opened_again(tmpdir):
+    """Check that an archive is opened again after it changes."""
+    archive_path = create_zip(tmpdir)
+    assert len(files.create_paths(file="*.txt", home=archive_path)) == 0
+    with zipfile.ZipFile(archive_path, "a") as zip_archive:
+        zip_archive.writestr("added.txt", "Added.\n")
+    # make sure that the archive has a new modification time
+    archive_status = os.stat(archive_path)
+    os.utime(
+        archive_path, ns=(archive_status.st_atime_ns, archive_status.st_mtime_ns + 1)
+    )
+    assert len(files.create_paths(file="*.txt", home=archive_path)) == 1
+
+
+def test_file_named_like_archive_is_not_an_archive(tmpdir):
+    """Check that a file that is only named like an archive is not opened."""
+    tmpdir.join("notes.zip").write("Not an archive.\n")
+    assert archive.create_paths(tmpdir.join("notes.zip", "README.md")) is None
+    assert files.create_paths(file="notes.zip", home=str(tmpdir))[0].is_file()
+    assert archive.find_archive(tmpdir.join("README.md")) is None
+
+
+@pytest.mark.parametrize(
+    "name, expected_archive",
+    [
+        ("submission.zip", True),
+        ("SUBMISSION.ZIP", True),
+        ("submission.tar", True),
+        ("submission.tar.gz", True),
+        ("submission.tgz", True),
+        ("submission.gz", False),
+        ("submission.py", False),
+    ],
+)
+def test_is_archive(name, expected_archive):
+    """Check that archives are recognized by their names."""
+    assert archive.is_archive(name) is expected_archive
@@ -150,3 +150,50 @@ def test_help_produces_output(capsys):
     assert "usage:" in captured.out
     assert "all checks:" in captured.out
     assert "internal checks:" in captured.out
+
+
+def test_revision_is_valid_arguments_verify():
+    """Check that command-line argument with a commit of the repository verifies."""
+    commandline_arguments = ["--revision", "HEAD", "check_FakeMessages"]
+    gg_arguments, remaining_arguments = arguments.parse(commandline_arguments)
+    assert gg_arguments.revision == "HEAD"
+    args_verified = arguments.verify(gg_arguments)
+    assert args_verified is True
+
+
+def test_revision_is_not_valid_arguments_verify():
+    """Check that command-line argument without a commit of the repository fails."""
+    commandline_arguments = ["--revision", "not-a-revision", "check_FakeMessages"]
+    gg_arguments, remaining_arguments = arguments.parse(commandline_arguments)
+    args_verified = arguments.verify(gg_arguments)
+    assert args_verified is False
+
+
+def test_glob_options_arguments_verify():
+    """Check that command-line arguments that change the matched files verify."""
+    commandline_arguments = [
+        "--exclude",
+        "vendor",
+        "--exclude",
+        "gen*",
+        "--gitignore",
+        "check_FakeMessages",
+    ]
+    gg_arguments, remaining_arguments = arguments.parse(commandline_arguments)
+    assert gg_arguments.exclude == ["vendor", "gen*"]
+    assert gg_arguments.gitignore is True
+    args_verified = arguments.verify(gg_arguments)
+    assert args_verified is True
+
+
+@pytest.mark.parametrize(
+    "step, expected_verification",
+    [("1", True), ("3", True), ("0", False), ("-1", False)],
+)
+def test_history_arguments_verify(step, expected_verification):
+    """Check that command-line argument with a step through the history verifies."""
+    commandline_arguments = ["--history", step, "check_FakeMessages"]
+    gg_arguments, remaining_arguments = arguments.parse(commandline_arguments)
+    assert gg_arguments.history == int(step)
+    args_verified = arguments.verify(gg_arguments)
+    assert args_verified is expected_verification
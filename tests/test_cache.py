@@ -0,0 +1,182 @@
+"""Test cases for the cache module."""
+
+import os
+
+import pytest
+
+from gator import cache
+from gator import constants
+from gator import run
+
+
+@pytest.fixture
+def cache_home(tmpdir, monkeypatch):
+    """Store the cached command results in a temporary directory."""
+    cache_directory = tmpdir.mkdir("cache")
+    monkeypatch.setenv(constants.environmentvariables.Cache, str(cache_directory))
+    return cache_directory
+
+
+# pylint: disable=unused-argument
+# pylint: disable=redefined-outer-name
+def test_cache_directory_uses_environment_variable(cache_home):
+    """Check that the cache directory is inside of the configured cache home."""
+    cache_directory = cache.get_cache_directory()
+    assert str(cache_directory).startswith(str(cache_home))
+    assert cache_directory.name == constants.caches.Directory
+
+
+def test_cache_directory_defaults_to_home(monkeypatch):
+    """Check that the cache directory is in the user's home when not configured."""
+    monkeypatch.delenv(constants.environmentvariables.Cache, raising=False)
+    cache_directory = cache.get_cache_directory()
+    assert "gatorgrader" in str(cache_directory)
+    assert cache_directory.name == constants.caches.Directory
+
+
+def test_hash_inputs_changes_with_contents(tmpdir):
+    """Check that the digest of the inputs changes when a file changes."""
+    hello_file = tmpdir.join("hello.txt")
+    hello_file.write("hello")
+    first_digest = cache.hash_inputs(["*.txt"], str(tmpdir))
+    assert first_digest == cache.hash_inputs(["*.txt"], str(tmpdir))
+    hello_file.write("hello world")
+    second_digest = cache.hash_inputs(["*.txt"], str(tmpdir))
+    assert first_digest != second_digest
+
+
+def test_hash_inputs_changes_with_files_in_directory(tmpdir):
+    """Check that the digest of a directory changes when a file inside of it changes."""
+    nested_file = tmpdir.mkdir("src").mkdir("nested").join("hello.txt")
+    nested_file.write("hello")
+    first_digest = cache.hash_inputs(["src"], str(tmpdir))
+    assert first_digest == cache.hash_inputs(["src"], str(tmpdir))
+    nested_file.write("hello world")
+    second_digest = cache.hash_inputs(["src"], str(tmpdir))
+    assert second_digest != first_digest
+    tmpdir.join("src", "added.txt").write("added")
+    assert cache.hash_inputs(["src"], str(tmpdir)) != second_digest
+
+
+def test_hash_inputs_does_not_depend_on_order(tmpdir):
+    """Check that the digest of the inputs does not depend on their order."""
+    tmpdir.join("hello.txt").write("hello")
+    tmpdir.join("hello.md").write("# hello")
+    first_digest = cache.hash_inputs(["*.txt", "*.md"], str(tmpdir))
+    second_digest = cache.hash_inputs(["*.md", "*.txt"], str(tmpdir))
+    assert first_digest == second_digest
+
+
+def test_create_key_depends_on_command(tmpdir):
+    """Check that the key is different for different commands."""
+    tmpdir.join("hello.txt").write("hello")
+    first_key = cache.create_key("ls", ["*.txt"], str(tmpdir))
+    second_key = cache.create_key("ls -l", ["*.txt"], str(tmpdir))
+    assert first_key != second_key
+
+
+def test_store_then_lookup(cache_home):
+    """Check that a stored result is returned by a lookup."""
+    assert cache.lookup("key") is None
+    cache.store("key", "echo", b"hello\n", b"", 0)
+    assert cache.lookup("key") == (b"hello\n", b"", 0)
+
+
+def test_lookup_damaged_entry_is_not_cached(cache_home):
+    """Check that a damaged result is not returned by a lookup."""
+    cache.store("key", "echo", b"hello\n", b"", 0)
+    cache.get_entry_path("key").write_text("not JSON")
+    assert cache.lookup("key") is None
+
+
+def test_invalidate_removes_entry(cache_home):
+    """Check that an invalidated result is no longer cached."""
+    cache.store("key", "echo", b"hello\n", b"", 0)
+    assert cache.invalidate("key") is True
+    assert cache.lookup("key") is None
+    assert cache.invalidate("key") is False
+
+
+def test_evict_removes_least_recently_used(cache_home):
+    """Check that eviction keeps only the most recently used results."""
+    for index in range(3):
+        cache.store(str(index), "echo", b"", b"", 0)
+        # give each entry a distinct time of last use
+        os.utime(cache.get_entry_path(str(index)), (index, index))
+    # using the oldest entry makes it the most recently used one
+    assert cache.lookup("0") is not None
+    assert cache.evict(2) == 1
+    assert cache.lookup("0") is not None
+    assert cache.lookup("1") is None
+    assert cache.lookup("2") is not None
+
+
+def test_clear_removes_all_entries(cache_home):
+    """Check that clearing the cache removes all of the results."""
+    cache.store("first", "echo", b"", b"", 0)
+    cache.store("second", "echo", b"", b"", 0)
+    assert cache.clear() == 2
+    assert cache.lookup("first") is None
+
+
+def test_evict_without_cache_directory(cache_home):
+    """Check that eviction works when nothing was ever cached."""
+    assert cache.evict() == 0
+
+
+def test_run_command_replays_cached_result(cache_home, tmpdir, monkeypatch):
+    """Check that a command with unchanged inputs is not run again."""
+    monkeypatch.chdir(tmpdir)
+    input_file = tmpdir.join("input.txt")
+    input_file.write("first")
+    counter_file = tmpdir.join("counter.txt")
+    command = "echo run >> " + str(counter_file) + " && cat input.txt"
+    output, _, code = run.run_command(command, ["*.txt"])
+    assert output == b"first"
+    assert code == 0
+    # the counter file is an input that changed, so only declare input.txt
+    output, _, _ = run.run_command(command, ["input.txt"])
+    output, _, _ = run.run_command(command, ["input.txt"])
+    assert output == b"first"
+    assert counter_file.read().count("run") == 2
+    # changing the input causes the command to run again
+    input_file.write("second")
+    output, _, _ = run.run_command(command, ["input.txt"])
+    assert output == b"second"
+    assert counter_file.read().count("run") == 3
+
+
+def test_run_command_refresh_runs_again(cache_home, tmpdir, monkeypatch):
+    """Check that refreshing a cached result runs the command again."""
+    monkeypatch.chdir(tmpdir)
+    tmpdir.join("input.txt").write("input")
+    counter_file = tmpdir.join("counter.txt")
+    command = "echo run >> " + str(counter_file)
+    run.run_command(command, ["input.txt"])
+    run.run_command(command, ["input.txt"])
+    assert counter_file.read().count("run") == 1
+    run.run_command(command, ["input.txt"], refresh=True)
+    assert counter_file.read().count("run") == 2
+
+
+def test_run_command_limits_change_cache_key(cache_home, tmpdir, monkeypatch):
+    """Check that a command run with different limits is not replayed from the cache."""
+    monkeypatch.chdir(tmpdir)
+    tmpdir.join("input.txt").write("input")
+    counter_file = tmpdir.join("counter.txt")
+    command = "echo run >> " + str(counter_file)
+    run.run_command(command, ["input.txt"])
+    run.run_command(command, ["input.txt"], limits=run.create_limits(files=64))
+    assert counter_file.read().count("run") == 2
+    run.run_command(command, ["input.txt"], limits=run.create_limits(files=64))
+    assert counter_file.read().count("run") == 2
+
+
+def test_store_in_cache_that_cannot_be_written(tmpdir, monkeypatch):
+    """Check that storing a result in a cache that cannot be written is skipped."""
+    blocking_file = tmpdir.join("file.txt")
+    blocking_file.write("not a directory")
+    monkeypatch.setenv(constants.environmentvariables.Cache, str(blocking_file))
+    key = cache.create_key("echo hello", [], str(tmpdir))
+    assert cache.store(key, "echo hello", b"hello\n", b"", 0) is False
+    assert cache.lookup(key) is None
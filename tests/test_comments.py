@@ -1,5 +1,9 @@
 """Test cases for the comments and entities modules."""
 
+import random
+import re
+import time
+
 import pytest
 
 from gator import comments
@@ -466,3 +470,236 @@ def test_multiline_python_comments_many(code_string, expected_count):
         code_string
     )
     assert count_of_multiline_python_comments == expected_count
+
+
+def count_java_comments_with_regexes(code_string):
+    """Count the Java comments with the regular expressions that the scanner replaced."""
+    singleline_pattern = re.compile(
+        comments.SINGLELINECOMMENT_RE_JAVA, re.MULTILINE | re.VERBOSE
+    )
+    multiline_pattern = re.compile(comments.MULTILINECOMMENT_RE_JAVA, re.MULTILINE)
+    return (
+        len(singleline_pattern.findall(code_string)),
+        len(multiline_pattern.findall(code_string)),
+    )
+
+
+def create_java_code(generator):
+    """Create Java code from a random sequence of code, strings, and comments."""
+    fragments = [
+        "int count = 0;",
+        "total = total / 2;",
+        "x = a/b/c;",
+        "System.out.println(count);",
+        '"hello"',
+        '"http://www.example.com"',
+        r'"escaped \" quote"',
+        r'"a backslash \\"',
+        '""',
+        "// a comment",
+        "//",
+        "//// a comment // with slashes",
+        "// a comment /* with a multiline comment */",
+        "/* a comment */",
+        "/** a Javadoc comment\n * @author me\n */",
+        "/* a comment\n // with a singleline comment\n */",
+        "/**/",
+        "/* a comment ** with stars **/",
+        "\n",
+        "\n",
+        " ",
+        "{",
+        "}",
+    ]
+    # separate the fragments so that they do not combine into other tokens
+    return " ".join(
+        generator.choice(fragments) for _ in range(generator.randint(0, 40))
+    )
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_java_comment_scanner_matches_regexes(seed):
+    """Check that the scanner counts the same comments as the regexes."""
+    code_string = create_java_code(random.Random(seed))
+    assert comments.scan_java_comments(code_string) == count_java_comments_with_regexes(
+        code_string
+    )
+
+
+@pytest.mark.parametrize(
+    "code_string",
+    [
+        "",
+        "/* hello world",
+        "/* hello world\n// hi",
+        "// hello /* world\n still */ // here",
+        "/* a */ /* b */ // c /* d */ e // f",
+        'String s = "unterminated',
+        'String s = "multiple\nlines"; // comment',
+        "/*/ hello */",
+        "a // b\r\nc // d\r\n",
+        "char c = '\\''; // comment",
+    ],
+)
+def test_java_comment_scanner_matches_regexes_edge_cases(code_string):
+    """Check that the scanner counts the same comments as the regexes at the edges."""
+    assert comments.scan_java_comments(code_string) == count_java_comments_with_regexes(
+        code_string
+    )
+
+
+@pytest.mark.parametrize(
+    "code_string, expected_counts, regex_counts",
+    [
+        ("char quote = '\"'; // comment\nint x = 1; // second", (2, 0), (1, 0)),
+        ('String s = "/* not a comment */";', (0, 0), (0, 1)),
+        ("/* first *//* second */", (0, 2), (1, 2)),
+        (
+            'String s = """\n  a "quote" and /* no comment */\n  """; // real',
+            (1, 0),
+            (1, 1),
+        ),
+    ],
+)
+def test_java_comment_scanner_lexes_like_java(
+    code_string, expected_counts, regex_counts
+):
+    """Check that the scanner lexes the code like Java where the regexes do not."""
+    assert count_java_comments_with_regexes(code_string) == regex_counts
+    assert comments.scan_java_comments(code_string) == expected_counts
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "code_string",
+    [
+        'String s = "' + "a\\" * 100000,
+        "/*" + "*a" * 100000,
+        "'\"\n" * 50000 + "// comment",
+        "/ " * 100000,
+    ],
+)
+def test_benchmark_java_comment_scanner_is_linear(code_string):
+    """Benchmark counting the comments in pathological code with the scanner."""
+    start = time.perf_counter()
+    comments.scan_java_comments(code_string)
+    assert time.perf_counter() - start < 1
+
+
+def create_python_code(generator):
+    """Create Python code from a random sequence of statements and comments."""
+    lines = [
+        "import os",
+        "count = 0",
+        "total = count / 2",
+        'message = "hello"',
+        "# a comment",
+        "#",
+        "count = count + 1  # a trailing comment",
+        '"""A docstring."""',
+        '"""A docstring\nthat spans\nlines."""',
+        "",
+    ]
+    return "\n".join(generator.choice(lines) for _ in range(generator.randint(0, 30)))
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_python_comment_tokenizer_matches_regexes(seed):
+    """Check that the tokenizer counts the same comments as the regexes."""
+    code_string = create_python_code(random.Random(seed))
+    assert comments.scan_python_comments(
+        code_string
+    ) == comments.count_python_comments_with_regexes(code_string)
+
+
+@pytest.mark.parametrize(
+    "code_string, expected_counts, regex_counts",
+    [
+        ("message = 'a # in a string'", (0, 0), (1, 0)),
+        ("'''A docstring.'''", (0, 1), (0, 0)),
+        ('r"""A raw docstring."""', (0, 1), (0, 0)),
+        ('"""A docstring."""  # with a comment', (1, 1), (1, 0)),
+        ('text = """\n"""\n"""A docstring."""', (0, 1), (0, 1)),
+        ('"""A\ndocstring."""\nprint("# not a comment")', (0, 1), (1, 1)),
+        ('call(\n    """An argument.""",\n)', (0, 0), (0, 0)),
+    ],
+)
+def test_python_comment_tokenizer_lexes_like_python(
+    code_string, expected_counts, regex_counts
+):
+    """Check that the tokenizer counts the comments like Python where the regexes do not."""
+    assert comments.count_python_comments_with_regexes(code_string) == regex_counts
+    assert comments.scan_python_comments(code_string) == expected_counts
+
+
+@pytest.mark.parametrize(
+    "code_string",
+    ['"""\nhello world\n', "# hello world\n'''", 'message = "unterminated'],
+)
+def test_python_comment_counts_fall_back_to_regexes(code_string):
+    """Check that code the tokenizer cannot understand is counted with the regexes."""
+    assert comments.get_python_comment_counts(
+        code_string
+    ) == comments.count_python_comments_with_regexes(code_string)
+
+
+def test_python_comment_counts_cached_by_contents(monkeypatch):
+    """Check that the comments in the same code are only counted once."""
+    scanned_contents = []
+    scan_python_comments = comments.scan_python_comments
+
+    def record_scan_python_comments(contents):
+        """Record the code whose comments are counted."""
+        scanned_contents.append(contents)
+        return scan_python_comments(contents)
+
+    monkeypatch.setattr(comments, "scan_python_comments", record_scan_python_comments)
+    code_string = '"""Cached docstring."""\n# cached comment\n' + str(random.random())
+    assert comments.count_singleline_python_comment(code_string) == (1, {1: 1})
+    assert comments.count_multiline_python_comment(code_string) == (1, {1: 1})
+    assert scanned_contents == [code_string]
+
+
+@pytest.mark.parametrize(
+    "language, code_string, expected_counts",
+    [
+        ("C", "int x = 1; // a comment\n/* a\n block */\n", (1, 1)),
+        ("C", 'char *s = "// not /* a */ comment";\n', (0, 0)),
+        ("C", "char q = '\"'; // a comment\n", (1, 0)),
+        ("C", 'char *s = "unterminated\n// a comment\n', (1, 0)),
+        ("C", "// a /* comment */\n/* a // comment */\n", (1, 1)),
+        ("C++", 'auto s = R"x(// not )" /* a */ comment)x"; // a comment\n', (1, 0)),
+        ("C++", 'auto s = R"(\n/* not a comment */\n)";\n', (0, 0)),
+        ("Go", "s := `// not\n/* a comment */`\n// a comment\n", (1, 0)),
+        ("Go", "s := `C:\\`  // a comment\n", (1, 0)),
+        ("JavaScript", "let s = `// not ${x} /* a */ comment`; // a comment\n", (1, 0)),
+        ("JavaScript", 'let s = "\\"//"; /* a comment */\n', (0, 1)),
+        (
+            "Java",
+            'String s = "// not a comment"; // a comment\n/* a block */\n',
+            (1, 1),
+        ),
+        ("Java", "// a /* comment */\n", (1, 1)),
+        ("Python", '"""A docstring."""\n# a comment\n', (1, 1)),
+        ("Rust", "/* outer /* inner */ still outer */ // a comment\n", (1, 1)),
+        ("Rust", "/* outer /* inner */\n", (0, 0)),
+        ("Rust", "fn f<'a>(x: &'a str) -> char { '\"' } // a comment\n", (1, 0)),
+        ("Rust", 'let s = r#"// not a "comment""#; // a comment\n', (1, 0)),
+        ("Rust", "let c = b'/'; let d = '\\u{2F}'; // a comment\n", (1, 0)),
+        ("Shell", "# a comment\necho \"# not\" '# not' a#b # a comment\n", (2, 0)),
+        ("Shell", "echo ${name#prefix} $# ;# a comment\n", (1, 0)),
+    ],
+)
+def test_count_comments_in_table_languages(language, code_string, expected_counts):
+    """Check that the table of languages counts the comments in each language."""
+    assert comments.count_comments(code_string, language) == expected_counts
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("language", list(comments.LANGUAGES))
+@pytest.mark.parametrize("fragment", ["/*", "//", '"', "'", "`", "#", "\\", 'x "\\'])
+def test_benchmark_comment_scanner_is_linear(language, fragment):
+    """Benchmark counting pathological code in every language."""
+    start = time.perf_counter()
+    comments.count_comments(fragment * 20000, language)
+    assert time.perf_counter() - start < 1
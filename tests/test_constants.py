@@ -11,6 +11,25 @@ def test_languages_constant_defined():
     """Check correctness for the variables in the languages constant."""
     assert constants.languages.Python == "Python"
     assert constants.languages.Java == "Java"
+    assert constants.languages.C == "C"
+    assert constants.languages.Cpp == "C++"
+    assert constants.languages.Go == "Go"
+    assert constants.languages.JavaScript == "JavaScript"
+    assert constants.languages.Rust == "Rust"
+    assert constants.languages.Shell == "Shell"
+
+
+def test_archives_constant_defined():
+    """Check correctness for the variables in the archives constant."""
+    assert constants.archives.Zip == (".zip",)
+    assert ".tar.gz" in constants.archives.Tar
+
+
+def test_globs_constant_defined():
+    """Check correctness for the variables in the globs constant."""
+    assert constants.globs.Recursive == "**"
+    assert constants.globs.Gitignore == ".gitignore"
+    assert "node_modules" in constants.globs.Excludes
 
 
 def test_markers_constant_defined():
@@ -32,6 +51,8 @@ def test_markers_constant_defined():
     assert constants.markers.No == "No"
     assert constants.markers.Checkmark == "✔"
     assert constants.markers.Xmark == "✘"
+    assert constants.markers.Hash == "#"
+    assert constants.markers.Comma == ", "
 
 
 def test_paths_constant_defined():
@@ -57,6 +78,7 @@ def test_codes_constant_defined():
     assert constants.codes.Error == 1
     assert constants.codes.Success == 0
     assert constants.codes.No_Words == 0
+    assert constants.codes.Timeout == 124
 
 
 def test_checkers_constant_defined():
@@ -78,8 +100,10 @@ def test_arguments_constant_defined():
 def test_modules_constant_defined():
     """Check correctness for the variables in the modules constant."""
     assert constants.modules.Display == "gator.display"
+    assert constants.modules.Files == "gator.files"
     assert constants.modules.Invoke == "gator.invoke"
     assert constants.modules.Report == "gator.report"
+    assert constants.modules.Revision == "gator.revision"
     assert constants.modules.Run == "gator.run"
 
 
@@ -99,6 +123,20 @@ def test_results_constant_defined():
     assert constants.results.Description == "check"
     assert constants.results.Outcome == "outcome"
     assert constants.results.Diagnostic == "diagnostic"
+    assert constants.results.Summary == "summary"
+    assert constants.results.Usage == "usage"
+
+
+def test_usages_constant_defined():
+    """Check correctness for the variables in the usages constant."""
+    assert constants.usages.Cached == "cached"
+    assert constants.usages.Command == "command"
+    assert constants.usages.Commands == "commands"
+    assert constants.usages.Memory == "maxrss"
+    assert constants.usages.Slowest == "slowest"
+    assert constants.usages.System == "system"
+    assert constants.usages.User == "user"
+    assert constants.usages.Wall == "wall"
 
 
 def test_versioncontrol_constant_defined():
@@ -111,6 +149,7 @@ def test_words_constant_defined():
     """Check correctness for the variables in the versioncontrol constant."""
     assert constants.words.Minimum == "word(s) in every paragraph"
     assert constants.words.Total == "word(s) in total"
+    assert constants.words.At_Least == "at least"
     assert constants.words.In_A == "in a"
     assert constants.words.In_Every == "in every"
     assert constants.words.In_The == "in the"
@@ -122,6 +161,33 @@ def test_words_constant_defined():
 def test_environmentvariables_constant_defined():
     """Check correctness for the variables in the environmentvariables constant."""
     assert constants.environmentvariables.Home == "GATORGRADER_HOME"
+    assert constants.environmentvariables.Cache == "GATORGRADER_CACHE"
+    assert constants.environmentvariables.Backend == "GATORGRADER_BACKEND"
+
+
+def test_backends_constant_defined():
+    """Check correctness for the variables in the backends constant."""
+    assert constants.backends.Process == "process"
+    assert constants.backends.Shell == "shell"
+
+
+def test_concurrency_constant_defined():
+    """Check correctness for the variables in the concurrency constant."""
+    assert constants.concurrency.Repositories == 16
+
+
+def test_shells_constant_defined():
+    """Check correctness for the variables in the shells constant."""
+    assert constants.shells.Program == "/bin/sh"
+    assert constants.shells.Timeout == 600
+
+
+def test_caches_constant_defined():
+    """Check correctness for the variables in the caches constant."""
+    assert constants.caches.Directory == "commands"
+    assert constants.caches.Home == ".cache/gatorgrader"
+    assert constants.caches.Maximum_Entries == 256
+    assert constants.caches.Suffix == ".json"
 
 
 def test_functions_constant_defined():
@@ -135,6 +201,10 @@ def test_commandlines_constant_defined():
     assert constants.commandlines.No_Welcome == "--nowelcome"
     assert constants.commandlines.Json == "--json"
     assert constants.commandlines.Check == "check"
+    assert constants.commandlines.Revision == "--revision"
+    assert constants.commandlines.History == "--history"
+    assert constants.commandlines.Exclude == "--exclude"
+    assert constants.commandlines.Gitignore == "--gitignore"
 
 
 def test_help_constant_defined():
@@ -148,6 +218,9 @@ def test_help_constant_defined():
 def test_metavars_constant_defined():
     """Check correctness for the variables in the metavar constant."""
     assert constants.metavars.Check == "CHECK"
+    assert constants.metavars.Revision == "REVISION"
+    assert constants.metavars.Pattern == "PATTERN"
+    assert constants.metavars.Step == "STEP"
 
 
 def test_languages_constant_cannot_redefine():
@@ -334,6 +407,7 @@ def test_words_constant_cannot_redefine():
     with pytest.raises(AttributeError):
         constants.words.Minimum = CANNOT_SET_CONSTANT_VARIABLE
         constants.words.Total = CANNOT_SET_CONSTANT_VARIABLE
+        constants.words.At_Least = CANNOT_SET_CONSTANT_VARIABLE
         constants.words.In_A = CANNOT_SET_CONSTANT_VARIABLE
         constants.words.In_Every = CANNOT_SET_CONSTANT_VARIABLE
         constants.words.In_The = CANNOT_SET_CONSTANT_VARIABLE
@@ -346,3 +420,13 @@ def test_environmentvariables_constant_cannot_redefine():
     """Check cannot redefine the variables in the environmentvariables constant."""
     with pytest.raises(AttributeError):
         constants.environmentvariables.Home = CANNOT_SET_CONSTANT_VARIABLE
+    with pytest.raises(AttributeError):
+        constants.environmentvariables.Cache = CANNOT_SET_CONSTANT_VARIABLE
+
+
+def test_caches_constant_cannot_redefine():
+    """Check cannot redefine the variables in the caches constant."""
+    with pytest.raises(AttributeError):
+        constants.caches.Directory = CANNOT_SET_CONSTANT_VARIABLE
+    with pytest.raises(AttributeError):
+        constants.caches.Maximum_Entries = CANNOT_SET_CONSTANT_VARIABLE
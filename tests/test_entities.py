@@ -0,0 +1,72 @@
+"""Test cases for the entities module."""
+
+import os
+import pathlib
+
+import pytest
+
+from gator import comments
+from gator import constants
+from gator import entities
+from gator import files
+from gator import invoke
+from gator import report
+
+
+@pytest.fixture
+def read_files(monkeypatch):
+    """Record the name of each file whose contents are read."""
+    entities.reset_metrics()
+    read_names = []
+    read_text = pathlib.Path.read_text
+
+    def record_read_text(path, *args, **kwargs):
+        """Record the name of the file that is read."""
+        read_names.append(path.name)
+        return read_text(path, *args, **kwargs)
+
+    monkeypatch.setattr(pathlib.Path, "read_text", record_read_text)
+    return read_names
+
+
+# pylint: disable=redefined-outer-name
+def test_comment_checks_read_each_file_once(read_files, tmpdir):
+    """Check that the checks for each type of comment share one read of each file."""
+    tmpdir.join("First.java").write("// one\n/* two */\n")
+    tmpdir.join("Second.java").write("// one\n// two\n/* three */\n")
+    report.reset()
+    invoke.invoke_all_comment_checks(
+        "*.java", str(tmpdir), 1, constants.comments.Single_Line, "Java"
+    )
+    assert report.get_result()["outcome"] is True
+    report.reset()
+    invoke.invoke_all_comment_checks(
+        "*.java", str(tmpdir), 2, constants.comments.Multiple_Line, "Java"
+    )
+    assert report.get_result()["outcome"] is False
+    assert sorted(read_files) == ["First.java", "Second.java"]
+
+
+def test_metrics_computed_again_when_file_changes(read_files, tmpdir):
+    """Check that the record of metrics is computed again after the file changes."""
+    code_file = tmpdir.join("Code.java")
+    code_file.write("// one\n")
+    compute_comment_metrics = comments.METRICS[constants.languages.Java]
+    assert entities.count_entities(
+        "Code.java", str(tmpdir), compute_comment_metrics, "single-line"
+    ) == (1, {"Code.java": {1: 1}})
+    code_file.write("// one\n// two\n")
+    # make sure that the file has a new modification time
+    file_status = os.stat(str(code_file))
+    os.utime(str(code_file), ns=(file_status.st_atime_ns, file_status.st_mtime_ns + 1))
+    assert entities.count_entities(
+        "Code.java", str(tmpdir), compute_comment_metrics, "single-line"
+    ) == (2, {"Code.java": {1: 2}})
+    assert read_files == ["Code.java", "Code.java"]
+
+
+def test_metrics_of_missing_file_are_not_cached(tmpdir):
+    """Check that a file that cannot be identified does not have a version."""
+    assert files.get_version(pathlib.Path(str(tmpdir.join("missing.java")))) is None
+    tmpdir.join("present.java").write("// one\n")
+    assert files.get_version(pathlib.Path(str(tmpdir.join("present.java"))))
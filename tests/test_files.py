@@ -1,8 +1,10 @@
 """Test cases for the files module."""
 
+import os
 import platform
 
 from gator import files
+from gator import walk
 
 # define the operating systems on which to run processes
 WINDOWS = "Windows"
@@ -390,3 +392,110 @@ def test_many_files_not_found_in_subdirectory(tmpdir):
 
 
 # }}}
+
+
+# Region: Tests for the Listings of Directories {{{
+
+
+def test_directory_listed_once_for_many_files(tmpdir, monkeypatch):
+    """Ensure that checking many files in one directory only lists it once."""
+    source_directory = tmpdir.mkdir("src")
+    for index in range(30):
+        source_directory.join("File" + str(index) + ".java").write("content")
+    files.reset_listings()
+    listed_directories = []
+    scan_directory = walk.scan_directory
+
+    def record_scan_directory(directory):
+        """Record each directory that is listed."""
+        listed_directories.append(directory)
+        return scan_directory(directory)
+
+    monkeypatch.setattr(walk, "scan_directory", record_scan_directory)
+    for index in range(30):
+        assert files.check_file_in_directory(
+            file="File" + str(index) + ".java", home=str(source_directory)
+        )
+    assert not files.check_file_in_directory(
+        file="file0.java", home=str(source_directory)
+    )
+    assert len(listed_directories) == 1
+
+
+def test_directory_listed_again_after_it_changes(tmpdir):
+    """Ensure that the listing of a directory is replaced when the directory changes."""
+    files.reset_listings()
+    assert not files.case_sensitive_check_file_in_directory(
+        file="hello.txt", home=str(tmpdir)
+    )
+    tmpdir.join("hello.txt").write("content")
+    # make sure that the directory has a new modification time
+    directory_status = os.stat(str(tmpdir))
+    os.utime(
+        str(tmpdir),
+        ns=(directory_status.st_atime_ns, directory_status.st_mtime_ns + 1),
+    )
+    assert files.case_sensitive_check_file_in_directory(
+        file="hello.txt", home=str(tmpdir)
+    )
+
+
+def test_listing_excludes_hidden_files_and_missing_directories(tmpdir):
+    """Ensure that the listing, like the glob "*", does not contain hidden files."""
+    tmpdir.join(".hidden").write("content")
+    tmpdir.mkdir("sub")
+    assert files.get_listing(str(tmpdir)) == frozenset(["sub"])
+    assert files.get_listing(str(tmpdir.join("missing"))) == frozenset()
+
+
+def test_missing_files_found_with_one_listing_per_directory(tmpdir, monkeypatch):
+    """Ensure that the missing files are found by listing each directory once."""
+    source_directory = tmpdir.mkdir("src")
+    source_directory.join("Main.java").write("content")
+    source_directory.mkdir("nested").join("Deep.java").write("content")
+    files.reset_listings()
+    listed_directories = []
+    scan_directory = walk.scan_directory
+
+    def record_scan_directory(directory):
+        """Record each directory that is listed."""
+        listed_directories.append(directory)
+        return scan_directory(directory)
+
+    monkeypatch.setattr(walk, "scan_directory", record_scan_directory)
+    required_files = [
+        "Main.java",
+        "main.java",
+        "nested/Deep.java",
+        "nested/Missing.java",
+        "nested",
+        "missing/File.java",
+    ]
+    missing_files = files.find_missing_files(
+        required_files=required_files, home=str(source_directory)
+    )
+    assert missing_files == [
+        "main.java",
+        "nested/Missing.java",
+        "nested",
+        "missing/File.java",
+    ]
+    assert len(listed_directories) == 2
+
+
+def test_manifest_read_without_comments_or_blank_lines(tmpdir):
+    """Ensure that a manifest names one file on each line."""
+    manifest_file = tmpdir.join("manifest.txt")
+    manifest_file.write("# required files\nREADME.md\n\n  src/Main.java  \n")
+    assert files.read_manifest(str(manifest_file)) == ["README.md", "src/Main.java"]
+    assert files.read_manifest(str(tmpdir.join("missing.txt"))) is None
+
+
+def test_manifest_read_as_utf8(tmpdir):
+    """Ensure that a manifest is read as UTF-8 whatever the locale."""
+    manifest_file = tmpdir.join("manifest.txt")
+    manifest_file.write_binary("résumé.md\n".encode("utf-8"))
+    assert files.read_manifest(str(manifest_file)) == ["résumé.md"]
+
+
+# }}}
@@ -1,5 +1,9 @@
 """Test cases for the fragments module."""
 
+import random
+import re
+import timeit
+
 import pytest
 
 from gator import fragments
@@ -941,3 +945,155 @@ def test_count_regex_from_contents_with_threshold():
     )
     assert actual_count == -1
     assert exceeds_threshold is False
+
+
+@pytest.mark.parametrize(
+    "writing_string, chosen_fragment",
+    [
+        ("hello world! hello world!! hello world!!!", "hello"),
+        ("aaaaaaa", "aa"),
+        ("hello world", ""),
+        ("", ""),
+        ("hello world", "missing"),
+    ],
+)
+@pytest.mark.parametrize("limit", [0, 1, 2, 3, 100])
+def test_count_fragment_and_regex_up_to_limit(writing_string, chosen_fragment, limit):
+    """Check that counting up to a limit stops at the limit or at the full count."""
+    expected_count = min(
+        fragments.count_specified_fragment(writing_string, chosen_fragment), limit
+    )
+    assert (
+        fragments.count_specified_fragment(writing_string, chosen_fragment, limit)
+        == expected_count
+    )
+    assert (
+        fragments.count_specified_regex(
+            writing_string, re.escape(chosen_fragment), limit
+        )
+        == expected_count
+    )
+
+
+def test_count_fragment_from_contents_stopping_early():
+    """Check that counting with a stop at the expected count gives the same result."""
+    value = "hello world! " * 1000
+    for expected_count, exact in ((10, False), (1001, False), (1000, True)):
+        for checking_function in (
+            fragments.count_specified_fragment,
+            fragments.count_specified_regex,
+        ):
+            complete_result = fragments.specified_entity_greater_than_count(
+                "hello", checking_function, expected_count, contents=value, exact=exact
+            )
+            early_result = fragments.specified_entity_greater_than_count(
+                "hello",
+                checking_function,
+                expected_count,
+                contents=value,
+                exact=exact,
+                stop_early=True,
+            )
+            assert early_result[0] is complete_result[0]
+    # the count stops at the expected count unless the count must be exact
+    assert fragments.specified_entity_greater_than_count(
+        "hello", fragments.count_specified_fragment, 10, contents=value, stop_early=True
+    ) == (True, 10, {})
+    assert fragments.specified_entity_greater_than_count(
+        "hello",
+        fragments.count_specified_fragment,
+        10,
+        contents=value,
+        exact=True,
+        stop_early=True,
+    ) == (False, 1000, {})
+
+
+def count_paragraph_words_with_regex(paragraph):
+    """Count the words in a paragraph by substituting the punctuation with a regex."""
+    return len(re.sub(fragments.WHITESPACE_RE, " ", paragraph).split())
+
+
+def create_markdown_book(generator, paragraph_count):
+    """Create Markdown writing with many paragraphs of words, punctuation, and code."""
+    # most of the words in technical writing are plain words
+    words = "the of and to in is that for it as was with be by on not this are".split()
+    words = words * 3 + [
+        "GatorGrader's",
+        "e.g.,",
+        "end.",
+        "(parenthetical)",
+        "`code()`",
+        "**strong**",
+        "[link](https://example.com/path?query=1)",
+        "a--b",
+        "x{y}z",
+        "50%",
+        "tab\there",
+        "!!",
+    ]
+    paragraphs = []
+    for paragraph_number in range(paragraph_count):
+        if paragraph_number % 10 == 0:
+            paragraphs.append("## Section " + str(paragraph_number))
+        lines = [
+            " ".join(generator.choice(words) for _ in range(generator.randint(5, 15)))
+            for _ in range(generator.randint(1, 8))
+        ]
+        paragraphs.append("\n".join(lines))
+    return "\n\n".join(paragraphs) + "\n"
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_count_paragraph_words_matches_regex(seed):
+    """Check that the word counting kernel counts the same words as the regex."""
+    generator = random.Random(seed)
+    characters = [chr(character) for character in range(128)] + [
+        "\u00a0",
+        "\u2003",
+        "\u3000",
+        "é",
+        "ß",
+        "—",
+    ]
+    for _ in range(50):
+        paragraph = "".join(
+            generator.choice(characters) for _ in range(generator.randint(0, 80))
+        )
+        assert fragments.count_paragraph_words(
+            paragraph
+        ) == count_paragraph_words_with_regex(paragraph)
+
+
+def test_count_words_in_book_matches_regex():
+    """Check that the word counting kernel counts book-length Markdown like the regex."""
+    book = create_markdown_book(random.Random(0), 2000)
+    paragraphs = fragments.get_paragraphs(book)
+    assert len(paragraphs) == 2000
+    expected_counts = [
+        count_paragraph_words_with_regex(paragraph) for paragraph in paragraphs
+    ]
+    word_count, paragraph_word_counts = fragments.count_words(book, sum)
+    assert word_count == sum(expected_counts)
+    assert list(paragraph_word_counts.values()) == expected_counts
+
+
+@pytest.mark.benchmark
+def test_benchmark_count_words_in_book_faster_than_regex():
+    """Benchmark counting the words in book-length Markdown with the kernel and regex."""
+    paragraphs = fragments.get_paragraphs(create_markdown_book(random.Random(0), 2000))
+    regex_time = min(
+        timeit.repeat(
+            lambda: [count_paragraph_words_with_regex(para) for para in paragraphs],
+            number=3,
+            repeat=5,
+        )
+    )
+    kernel_time = min(
+        timeit.repeat(
+            lambda: [fragments.count_paragraph_words(para) for para in paragraphs],
+            number=3,
+            repeat=5,
+        )
+    )
+    assert kernel_time < regex_time
@@ -0,0 +1,153 @@
+"""Test cases for the history module."""
+
+import pytest
+
+from git import Actor
+from git import Repo
+
+from gator import constants
+from gator import history
+from gator import repository
+
+
+@pytest.fixture(autouse=True)
+def forget_histories():
+    """Forget the histories that a test case created."""
+    yield
+    history.histories.clear()
+
+
+@pytest.fixture(params=[constants.gitbackends.Cli, constants.gitbackends.GitPython])
+def git_backend(request):
+    """Run a test case with each of the backends that inspect Git repositories."""
+    previous_backend = repository.set_backend(request.param)
+    yield request.param
+    repository.set_backend(previous_backend)
+
+
+COMMITS = [
+    ("Ada", "2019-09-01T09:00:00", "Add the first draft of the paper"),
+    ("Grace", "2019-09-15T23:30:00", "Fix"),
+    ("Ada", "2019-09-30T12:00:00", "Revise the paper\n\nAdd the conclusion."),
+    ("Ada", "2019-10-02T08:00:00", "Add the bibliography ü"),
+]
+
+
+def create_repository_with_history(directory):
+    """Create a Git repository in the directory with the commits of several authors."""
+    temp_file = directory.join("paper.md")
+    testing_repository = Repo.init(directory)
+    for number, (author, date, message) in enumerate(COMMITS):
+        temp_file.write("content " + str(number))
+        testing_repository.index.add([str(temp_file)])
+        testing_repository.index.commit(
+            message,
+            author=Actor(author, author.lower() + "@example.com"),
+            author_date=date,
+        )
+    return testing_repository
+
+
+# pylint: disable=unused-argument
+# pylint: disable=redefined-outer-name
+def test_history_without_repository_or_commits(tmpdir, git_backend):
+    """Check that there is no history without a repository or commits."""
+    assert history.get_head(str(tmpdir)) is None
+    assert history.get_history(str(tmpdir)) == []
+    _ = Repo.init(str(tmpdir))
+    assert history.get_head(str(tmpdir)) is None
+    assert history.get_history(str(tmpdir)) == []
+
+
+def test_history_has_compact_records(tmpdir, git_backend):
+    """Check that the history has a record for every commit, newest first."""
+    testing_repository = create_repository_with_history(tmpdir)
+    commit_history = history.get_history(str(tmpdir))
+    assert len(commit_history) == len(COMMITS)
+    assert commit_history[0].hash == testing_repository.head.commit.hexsha
+    assert [commit.author for commit in commit_history] == [
+        "Ada",
+        "Ada",
+        "Grace",
+        "Ada",
+    ]
+    assert commit_history[0].message_length == len("Add the bibliography ü")
+    assert commit_history[1].message_length == len(COMMITS[2][2])
+
+
+def test_backends_create_identical_histories(tmpdir):
+    """Check that the backends create the same history of a repository."""
+    create_repository_with_history(tmpdir)
+    histories = []
+    for backend in [constants.gitbackends.Cli, constants.gitbackends.GitPython]:
+        previous_backend = repository.set_backend(backend)
+        histories.append(history.create_history(str(tmpdir)))
+        repository.set_backend(previous_backend)
+    assert histories[0] == histories[1]
+
+
+def test_history_is_cached_for_head(tmpdir):
+    """Check that the history is reused until HEAD changes."""
+    testing_repository = create_repository_with_history(tmpdir)
+    first_history = history.get_history(str(tmpdir))
+    assert history.get_history(str(tmpdir)) is first_history
+    # a new commit changes HEAD and thus the history
+    testing_repository.index.commit("Add another commit")
+    second_history = history.get_history(str(tmpdir))
+    assert len(second_history) == len(first_history) + 1
+
+
+def test_history_does_not_use_cache_of_commands(tmpdir, monkeypatch):
+    """Check that the history is not stored in the cache of the commands."""
+    create_repository_with_history(tmpdir)
+    cache_directory = tmpdir.join("cache")
+    monkeypatch.setenv(constants.environmentvariables.Cache, str(cache_directory))
+    assert len(history.get_history(str(tmpdir))) == len(COMMITS)
+    assert not cache_directory.check()
+
+
+def test_stream_commits_across_reads(tmpdir, monkeypatch):
+    """Check that a commit split across two reads of the output is not damaged."""
+    create_repository_with_history(tmpdir)
+    monkeypatch.setattr(history, "READ_SIZE", 7)
+    assert list(history.stream_commits(str(tmpdir))) == history.create_history(
+        str(tmpdir)
+    )
+
+
+def test_count_author_commits(tmpdir):
+    """Check that the commits are counted for each author."""
+    create_repository_with_history(tmpdir)
+    commit_history = history.get_history(str(tmpdir))
+    assert history.count_author_commits(commit_history, "Ada") == 3
+    assert history.count_author_commits(commit_history, "Grace") == 1
+    assert history.count_author_commits(commit_history, "Linus") == 0
+
+
+@pytest.mark.parametrize(
+    "since, until, expected_count",
+    [
+        (None, None, 4),
+        ("2019-09-01", None, 4),
+        ("2019-09-02", None, 3),
+        (None, "2019-09-15", 2),
+        ("2019-09-15", "2019-09-30", 2),
+        ("2019-09-30T12:00:01", "2019-10-01", 0),
+        ("2019-09-01", "2019-09-01T08:59:59", 0),
+    ],
+)
+def test_count_window_commits(tmpdir, since, until, expected_count):
+    """Check that the commits are counted between the dates, including the whole days."""
+    create_repository_with_history(tmpdir)
+    commit_history = history.get_history(str(tmpdir))
+    assert history.count_window_commits(commit_history, since, until) == expected_count
+
+
+def test_get_shortest_message_commit(tmpdir):
+    """Check that the commit with the shortest message is found."""
+    assert history.get_shortest_message_commit([]) is None
+    create_repository_with_history(tmpdir)
+    commit_history = history.get_history(str(tmpdir))
+    shortest_commit = history.get_shortest_message_commit(commit_history)
+    assert shortest_commit.author == "Grace"
+    assert shortest_commit.message_length == 3
@@ -6,10 +6,15 @@ import sys
 
 from unittest.mock import patch
 
+from git import Actor
+from git import Repo
+
 from gator import constants
 from gator import fragments
 from gator import invoke
 from gator import report
+from gator import run
+from gator import util
 
 
 @pytest.fixture
@@ -72,6 +77,54 @@ def test_file_exists_in_directory_check_test_file(reset_results_dictionary):
         assert details[constants.results.Diagnostic] == ""
 
 
+# pylint: disable=unused-argument
+# pylint: disable=redefined-outer-name
+def test_files_exist_in_directory_check(reset_results_dictionary, tmpdir):
+    """Check that invocation of the bulk file existence check reports every missing file."""
+    source_directory = tmpdir.mkdir("sub")
+    source_directory.join("hello.txt").write("content")
+    source_directory.mkdir("nested").join("world.txt").write("content")
+    directory = str(source_directory)
+    invoke.invoke_files_in_directory_check(["hello.txt", "nested/world.txt"], directory)
+    details = report.get_result()
+    assert details[constants.results.Outcome] is True
+    assert "2 required file(s) exist in" in details[constants.results.Description]
+    assert details[constants.results.Diagnostic] == ""
+    report.reset()
+    invoke.invoke_files_in_directory_check(
+        ["hello.txt", "Hello.txt", "nested/missing.txt", "nested"], directory
+    )
+    details = report.get_result()
+    assert details[constants.results.Outcome] is False
+    assert details[constants.results.Diagnostic].endswith(
+        "Did not find 3 of the required file(s) in the "
+        + directory
+        + " directory: Hello.txt, nested/missing.txt, nested"
+    )
+    report.reset()
+    invoke.invoke_files_in_directory_check(
+        None, directory, manifest=str(tmpdir.join("missing.txt"))
+    )
+    details = report.get_result()
+    assert details[constants.results.Outcome] is False
+    assert "Did not find the manifest" in details[constants.results.Diagnostic]
+
+
+def test_file_exists_in_directory_check_reads_relative_manifest_from_project(
+    reset_results_dictionary, tmpdir, monkeypatch
+):
+    """Check that a relative manifest is found in the project, not the working directory."""
+    project_directory = tmpdir.mkdir("project")
+    project_directory.join("manifest.txt").write("README.md\n")
+    project_directory.join("README.md").write("Read me.\n")
+    monkeypatch.chdir(tmpdir.mkdir("elsewhere"))
+    monkeypatch.setattr(util, "get_project_home", lambda: str(project_directory))
+    check_passed = invoke.invoke_files_in_directory_check(
+        None, ".", manifest="manifest.txt"
+    )
+    assert check_passed is True
+
+
 # pylint: disable=unused-argument
 # pylint: disable=redefined-outer-name
 def test_file_exists_in_directory_check_paragraphs(reset_results_dictionary, tmpdir):
@@ -817,3 +870,83 @@ def test_run_command_does_execute_correctly_would_make_output(
     directory = tmpdir.dirname + "/" + tmpdir.basename + "/"
     executed_yes = invoke.invoke_all_command_executes_checks("ls " + directory)
     assert executed_yes is True
+
+
+# pylint: disable=unused-argument
+# pylint: disable=redefined-outer-name
+def test_command_executes_checks_attach_usage(reset_results_dictionary):
+    """Check that the result of a command check includes the command's resource usage."""
+    invoke.invoke_all_command_executes_checks('echo "CorrectCommand"')
+    usage = report.get_result()[constants.results.Usage]
+    assert usage[constants.usages.Command] == 'echo "CorrectCommand"'
+    assert usage[constants.usages.Wall] > 0
+
+
+@pytest.mark.skipif(os.name != run.POSIX, reason="requires a POSIX system")
+def test_command_executes_checks_report_limit_violation(reset_results_dictionary):
+    """Check that the diagnostic names the limit that the command exceeded."""
+    limits = run.create_limits(cpu=1)
+    check_passed = invoke.invoke_all_command_executes_checks(
+        "python3 -c 'while True: pass'", limits=limits
+    )
+    assert check_passed is False
+    diagnostic = report.get_result()[constants.results.Diagnostic]
+    assert "exceeding its cpu limit of 1 second(s)" in diagnostic
+
+
+def test_command_performance_checks_report_distribution(reset_results_dictionary):
+    """Check that the performance check reports the distribution when it fails."""
+    check_passed = invoke.invoke_all_command_performance_checks(
+        "sleep 0.1", runs=2, warmup=0, thresholds={constants.usages.Wall: 0.01}
+    )
+    assert check_passed is False
+    result = report.get_result()
+    assert "within 0.01s wall time at the 50th percentile" in result["check"]
+    assert "over 2 run(s)" in result[constants.results.Diagnostic]
+    check_passed = invoke.invoke_all_command_performance_checks(
+        "sleep 0.1", runs=2, warmup=0, thresholds={constants.usages.Wall: 10}
+    )
+    assert check_passed is True
+
+
+@pytest.mark.skipif(not hasattr(os, "posix_spawn"), reason="requires os.posix_spawn")
+def test_command_performance_checks_pass_small_memory_threshold(
+    reset_results_dictionary,
+):
+    """Check that a trivial command stays within a small memory threshold."""
+    check_passed = invoke.invoke_all_command_performance_checks(
+        "true", runs=2, warmup=0, thresholds={constants.usages.Memory: 16}
+    )
+    assert check_passed is True
+
+
+def test_history_checks_report_counts(reset_results_dictionary, tmpdir, monkeypatch):
+    """Check that the checks on the history of a repository report what they found."""
+    monkeypatch.setenv(constants.environmentvariables.Cache, str(tmpdir.mkdir("cache")))
+    repository_directory = tmpdir.mkdir("repository")
+    testing_repository = Repo.init(str(repository_directory))
+    testing_repository.index.commit("Start", author=Actor("Ada", "ada@example.com"))
+    check_passed = invoke.invoke_author_commits_check(
+        str(repository_directory), "Grace", 1
+    )
+    assert check_passed is False
+    assert report.get_result()[constants.results.Diagnostic] == (
+        "Found 0 commit(s) by Grace in the Git repository"
+    )
+    check_passed = invoke.invoke_window_commits_check(
+        str(repository_directory), 1, since="2000-01-01", exact=True
+    )
+    assert check_passed is True
+    assert "exactly 1 commit(s) since 2000-01-01" in report.get_result()["check"]
+    check_passed = invoke.invoke_commit_message_length_check(
+        str(repository_directory), 6
+    )
+    assert check_passed is False
+    assert report.get_result()[constants.results.Diagnostic].startswith(
+        "Found a commit message with 5 character(s) in commit "
+    )
+    check_passed = invoke.invoke_commit_message_length_check(str(tmpdir), 1)
+    assert check_passed is False
+    assert report.get_result()[constants.results.Diagnostic] == (
+        "Found no commits in the Git repository"
+    )
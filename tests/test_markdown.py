@@ -321,3 +321,78 @@ def test_count_fragments_from_incorrect_wildcard(tmpdir):
     )
     assert actual_count == 0
     assert exceeds_threshold is False
+
+
+def test_count_tags_in_one_walk():
+    """Check that the histogram of tags has the count of every tag."""
+    tag_counts = markdown.count_tags(
+        "# Heading\n\nText with `code` and `more`.\n\n```\nblock\n```\n"
+    )
+    assert tag_counts["heading"] == 1
+    assert tag_counts["paragraph"] == 1
+    assert tag_counts["code"] == 2
+    assert tag_counts["code_block"] == 1
+    assert tag_counts["image"] == 0
+
+
+def test_count_many_tags_from_files_wildcard(tmpdir):
+    """Check that counting many tags in files matches counting each tag."""
+    directory = tmpdir.mkdir("subdirectory")
+    directory.join("First.md").write("# One\n\nSome `code` and ![Image](image.png).\n")
+    directory.join("Second.md").write("# One\n\n## Two\n\n`code` and `more`.\n")
+    chosen_tags = ["heading", "code", "image", "link"]
+    expected_counts = [1, 1, 1, 0]
+    for exact in (False, True):
+        tag_results = markdown.specified_tags_greater_than_count(
+            chosen_tags, expected_counts, "*.md", str(directory), exact
+        )
+        assert tag_results == [
+            markdown.specified_tag_greater_than_count(
+                chosen_tag,
+                markdown.count_specified_tag,
+                expected_count,
+                "*.md",
+                str(directory),
+                exact,
+            )
+            for chosen_tag, expected_count in zip(chosen_tags, expected_counts)
+        ]
+    # the exact counts use the minimum count of each tag across the files
+    assert [tag_result[0][0] for tag_result in tag_results] == [
+        True,
+        True,
+        False,
+        True,
+    ]
+
+
+def test_count_tags_stops_at_limits():
+    """Check that the walk stops once every tag with a limit reaches it."""
+    contents = "# One\n\n`a` `b` `c`\n\n# Two\n\n`d`\n"
+    assert markdown.count_specified_tag(contents, "code") == 4
+    assert markdown.count_specified_tag(contents, "code", 2) == 2
+    assert markdown.count_specified_tag(contents, "code", 10) == 4
+    tag_counts = markdown.count_tags(contents, {"code": 1, "heading": 1})
+    assert tag_counts["code"] == 1
+    assert tag_counts["heading"] == 1
+    # the walk stops at the second heading, before the last code
+    assert markdown.count_tags(contents, {"code": 1, "heading": 2})["code"] == 3
+
+
+def test_count_many_tags_stopping_early(tmpdir):
+    """Check that stopping the walk early does not change the outcomes."""
+    directory = tmpdir.mkdir("subdirectory")
+    directory.join("First.md").write("# One\n\n`a` `b` `c`\n\n# Two\n\n`d`\n")
+    directory.join("Second.md").write("# One\n\n`a` and `b`\n")
+    chosen_tags = ["heading", "code", "code", "image"]
+    expected_counts = [1, 2, 3, 0]
+    for exact in (False, True):
+        complete_results = markdown.specified_tags_greater_than_count(
+            chosen_tags, expected_counts, "*.md", str(directory), exact
+        )
+        early_results = markdown.specified_tags_greater_than_count(
+            chosen_tags, expected_counts, "*.md", str(directory), exact, True
+        )
+        assert [tag_result[0][0] for tag_result in early_results] == [
+            tag_result[0][0] for tag_result in complete_results
+        ]
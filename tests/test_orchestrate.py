@@ -6,9 +6,13 @@ import sys
 
 from unittest.mock import patch
 
+from gator import comments
 from gator import constants
+from gator import files
 from gator import orchestrate
 from gator import report
+from gator import run
+from gator import walk
 
 
 @pytest.fixture
@@ -43,6 +47,10 @@ def test_verify_arguments(commandline_arguments):
         (["--json", "--nowelcome", "CHECK"], True, 0),
         (["--nowelcome", "CHECK"], True, 0),
         (["--nowelcome", "--checkerdir", "WRONG", "CHECK"], False, 3),
+        (["--nowelcome", "--revision", "HEAD", "CHECK"], True, 1),
+        (["--nowelcome", "--revision", "WRONG", "CHECK"], False, 3),
+        (["--nowelcome", "--exclude", "vendor", "CHECK"], True, 1),
+        (["--nowelcome", "--gitignore", "CHECK"], True, 1),
     ],
 )
 def test_get_actions(commandline_arguments, expected_verification, action_count):
@@ -107,6 +115,20 @@ def test_perform_actions_single_parameter_exit(capsys):
             ],
             0,
         ),
+        (
+            [
+                "--revision",
+                "HEAD",
+                "CountFileLines",
+                "--file",
+                "README.md",
+                "--directory",
+                ".",
+                "--count",
+                "10",
+            ],
+            0,
+        ),
         (
             [
                 "MatchCommandFragment",
@@ -202,6 +224,8 @@ def test_check_produces_correct_output(commandline_arguments, expected_result, c
     testargs = [os.getcwd()]
     with patch.object(sys, "argv", testargs):
         check_exit_code = orchestrate.check(commandline_arguments)
+        # the next test case must check the working tree
+        files.set_revision_tree(None)
         captured = capsys.readouterr()
         counted_newlines = captured.out.count("\n")
         assert check_exit_code == expected_result
@@ -280,3 +304,158 @@ def test_check_produces_correct_output_for_incorrect_check_specification(
     assert captured.out != ""
     assert "Incorrect command-line arguments." in captured.out
     assert counted_newlines > 5
+
+
+def test_check_history_produces_matrix(capsys):
+    """Ensure that performing a check across the history outputs a matrix."""
+    testargs = [os.getcwd()]
+    commandline_arguments = [
+        "--history",
+        "5",
+        "ConfirmFileExists",
+        "--file",
+        "README.md",
+        "--directory",
+        ".",
+    ]
+    with patch.object(sys, "argv", testargs):
+        check_exit_code = orchestrate.check(commandline_arguments)
+    captured = capsys.readouterr()
+    assert check_exit_code == 0
+    assert captured.err == ""
+    assert "first passed at" in captured.out
+    assert files.revision_tree is None
+
+
+def test_check_summarizes_commands_of_every_check_in_run():
+    """Ensure that a check that ran a command summarizes the commands of the run."""
+    run.reset_usages()
+    commandline_arguments = [
+        "--nowelcome",
+        "MatchCommandFragment",
+        "--command",
+        'echo "CorrectCommand"',
+        "--fragment",
+        "CorrectCommand",
+        "--count",
+        "1",
+    ]
+    testargs = [os.getcwd()]
+    with patch.object(sys, "argv", testargs):
+        assert orchestrate.check(commandline_arguments) == 0
+        # the first check ran only one command, so there is nothing to summarize
+        assert constants.results.Summary not in report.get_result()
+        assert orchestrate.check(commandline_arguments) == 0
+    # the second check summarizes the commands of both checks in the run
+    summary = report.get_result()[constants.results.Summary]
+    assert summary[constants.usages.Commands] == 2
+    assert "Ran 2 command(s)" in report.output_summary(summary)
+    run.reset_usages()
+
+
+def test_check_caches_command_with_inputs_at_revision(tmpdir, monkeypatch):
+    """Ensure that the inputs of a command can be matched in a revision."""
+    monkeypatch.setenv(constants.environmentvariables.Cache, str(tmpdir))
+    commandline_arguments = [
+        "--nowelcome",
+        "--revision",
+        "HEAD",
+        "ExecuteCommand",
+        "--command",
+        "true",
+        "--inputs",
+        "gator/*.py",
+    ]
+    testargs = [os.getcwd()]
+    with patch.object(sys, "argv", testargs):
+        assert orchestrate.check(commandline_arguments) == 0
+    assert report.get_result()[constants.results.Outcome] is True
+    files.set_revision_tree(None)
+    run.reset_usages()
+
+
+def test_check_does_not_summarize_commands_for_check_without_commands(tmpdir):
+    """Ensure that a check that ran no command does not repeat the summary of the run."""
+    run.reset_usages()
+    tmpdir.join("README.md").write("Read me.\n")
+    command_arguments = [
+        "--nowelcome",
+        "ExecuteCommand",
+        "--command",
+        "true",
+    ]
+    file_arguments = [
+        "--nowelcome",
+        "ConfirmFileExists",
+        "--file",
+        "README.md",
+        "--directory",
+        str(tmpdir),
+    ]
+    testargs = [os.getcwd()]
+    with patch.object(sys, "argv", testargs):
+        assert orchestrate.check(command_arguments) == 0
+        assert orchestrate.check(command_arguments) == 0
+        assert constants.results.Summary in report.get_result()
+        assert orchestrate.check(file_arguments) == 0
+    assert constants.results.Summary not in report.get_result()
+    run.reset_usages()
+
+
+def test_check_lists_directory_once_for_every_check_in_run(tmpdir, monkeypatch):
+    """Ensure that the checks in a run share the listing of an unchanged directory."""
+    tmpdir.join("README.md").write("Read me.\n")
+    listed_directories = []
+    scan_directory = walk.scan_directory
+
+    def record_scan_directory(directory):
+        """Record each directory that is listed."""
+        listed_directories.append(directory)
+        return scan_directory(directory)
+
+    monkeypatch.setattr(walk, "scan_directory", record_scan_directory)
+    commandline_arguments = [
+        "--nowelcome",
+        "ConfirmFileExists",
+        "--file",
+        "README.md",
+        "--directory",
+        str(tmpdir),
+    ]
+    testargs = [os.getcwd()]
+    with patch.object(sys, "argv", testargs):
+        assert orchestrate.check(commandline_arguments) == 0
+        assert orchestrate.check(commandline_arguments) == 0
+    assert listed_directories == [os.path.abspath(str(tmpdir))]
+
+
+def test_check_scans_each_file_once_for_every_check_in_run(tmpdir, monkeypatch):
+    """Ensure that the checks for each type of comment in a run share one scan."""
+    tmpdir.join("First.java").write("// one\n/* two */\n")
+    tmpdir.join("Second.java").write("// one\n// two\n/* three */\n")
+    scanned_contents = []
+    scan_comments = comments.scan_comments
+
+    def record_scan_comments(contents, syntax):
+        """Record the contents of each file that is scanned."""
+        scanned_contents.append(contents)
+        return scan_comments(contents, syntax)
+
+    monkeypatch.setattr(comments, "scan_comments", record_scan_comments)
+    testargs = [os.getcwd()]
+    with patch.object(sys, "argv", testargs):
+        for check_name in ["CountSingleLineComments", "CountMultipleLineComments"]:
+            commandline_arguments = [
+                "--nowelcome",
+                check_name,
+                "--file",
+                "*.java",
+                "--directory",
+                str(tmpdir),
+                "--count",
+                "1",
+                "--language",
+                "Java",
+            ]
+            assert orchestrate.check(commandline_arguments) == 0
+    assert len(scanned_contents) == 2
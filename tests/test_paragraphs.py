@@ -0,0 +1,227 @@
+"""Test cases for the paragraphs module."""
+
+import glob
+import os
+import random
+import timeit
+
+import pytest
+
+from gator import fragments
+from gator import paragraphs
+
+# define the words of the paragraphs, including those with inline content
+WORDS = [
+    "word",
+    "text",
+    "GatorGrader",
+    "it's",
+    '"quoted"',
+    "*emphasis*",
+    "**strong**",
+    "`code`",
+    "[link](https://example.com)",
+    "![image](image.png)",
+    "snake_case",
+    "&amp;",
+    "<b>",
+    "\\*",
+    "1.",
+    "-",
+    "#",
+    ">",
+    "```",
+    "===",
+    "!",
+    "break  ",
+    "form\x0bfeed",
+    "tab\there",
+    "\xa0",
+]
+
+# define the starts of the lines, which open many of the blocks of Markdown
+PREFIXES = [
+    "",
+    "",
+    "",
+    " ",
+    "   ",
+    "    ",
+    "> ",
+    ">",
+    "- ",
+    "* ",
+    "+ ",
+    "1. ",
+    "2) ",
+    "10. ",
+    "  - ",
+    "    - ",
+    "-   ",
+    "# ",
+    "###### ",
+    "####### ",
+    "```",
+    "~~~",
+    "````",
+    "   ```",
+    "  > ",
+    "- > ",
+    "> - ",
+]
+
+# define the lines that are not text, like breaks, underlines, and code
+LINES = [
+    "",
+    "",
+    "",
+    "---",
+    "***",
+    "* * *",
+    "___",
+    "===",
+    "- - -",
+    "  ---",
+    "-",
+    "```",
+    "~~~",
+    "    code",
+    "      code",
+    "  ",
+    "\x0c",
+    "#",
+    ">",
+]
+
+# define the lines that make the extractor fall back to commonmark
+UNSUPPORTED_LINES = ["\tcode", "-\titem", ">\tquote", "[label]: https://example.com"]
+
+
+def create_markdown(generator, block_count=30):
+    """Create Markdown writing from a random sequence of lines that open blocks."""
+    lines = []
+    for _ in range(block_count):
+        for _ in range(generator.randint(1, 4)):
+            if generator.random() < 0.25:
+                lines.append(generator.choice(LINES))
+            else:
+                lines.append(
+                    generator.choice(PREFIXES)
+                    + " ".join(
+                        generator.choice(WORDS) for _ in range(generator.randint(1, 6))
+                    )
+                )
+        if generator.random() < 0.002:
+            lines.append(generator.choice(UNSUPPORTED_LINES))
+    return "\n".join(lines) + "\n"
+
+
+@pytest.mark.parametrize("seed", range(500))
+def test_extract_paragraphs_matches_commonmark(seed):
+    """Check that the extracted paragraphs are the same as those from commonmark."""
+    contents = create_markdown(random.Random(seed))
+    extracted_paragraphs = paragraphs.extract_paragraphs(contents)
+    if extracted_paragraphs is not None:
+        assert extracted_paragraphs == fragments.get_paragraphs_with_commonmark(
+            contents
+        )
+    assert fragments.get_paragraphs(
+        contents
+    ) == fragments.get_paragraphs_with_commonmark(contents)
+
+
+def test_extract_paragraphs_handles_most_of_corpus():
+    """Check that the extractor only falls back to commonmark for some writing."""
+    extracted_count = sum(
+        paragraphs.extract_paragraphs(create_markdown(random.Random(seed))) is not None
+        for seed in range(500)
+    )
+    assert extracted_count > 250
+
+
+def test_extract_paragraphs_matches_commonmark_for_documentation():
+    """Check that the paragraphs of the Markdown in the repository are extracted correctly."""
+    repository_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for markdown_file in glob.glob(os.path.join(repository_directory, "*.md")):
+        with open(markdown_file, encoding="utf-8") as markdown:
+            contents = markdown.read()
+        assert fragments.get_paragraphs(
+            contents
+        ) == fragments.get_paragraphs_with_commonmark(contents)
+
+
+@pytest.mark.parametrize(
+    "contents, expected_paragraphs",
+    [
+        ("", []),
+        ("One.\n\nTwo\nlines.\n", ["One.", "Two\nlines."]),
+        ("Hard  \nbreak.\n", ["Hardbreak."]),
+        ("Heading\n===\n\nText.\n", ["Text."]),
+        ("Text.\n- item\n", ["Text."]),
+        ("Text.\n2. continued\n", ["Text.\n2. continued"]),
+        ("- item\nlazy\n\nText.\n", ["Text."]),
+        ("> quote\nlazy\n\nText.\n", ["Text."]),
+        ("```\n\nCode.\n```\nText.\n", ["Text."]),
+        ("    Code.\n\nText *emphasis* `code`.\n", ["Text emphasis code."]),
+        ("<div>\nText.\n\nAfter.\n", ["After."]),
+        ("<!--\n\nText.\n-->\nAfter.\n", ["After."]),
+        ("Text.\n<span>\n", ["Text.\n<span>"]),
+        ("-\n\nText.\n", ["Text."]),
+    ],
+)
+def test_extract_paragraphs(contents, expected_paragraphs):
+    """Check that only the paragraphs outside of other blocks are extracted."""
+    assert paragraphs.extract_paragraphs(contents) == expected_paragraphs
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        "Text.\r\nMore text.\n",
+        "\tCode.\n",
+        "[label]: https://example.com\n\nSee [label].\n",
+        "- <div>\n  Text.\n",
+        "> - \n",
+        "- > ```\n  > Code.\n",
+        "- > q\n  ===\nfoo\n",
+        "text\n- - x\n  ===\nbar",
+        "- > q\n  ===\n===\n",
+    ],
+)
+def test_extract_paragraphs_falls_back(contents):
+    """Check that writing the extractor cannot handle is left for commonmark."""
+    assert paragraphs.extract_paragraphs(contents) is None
+    assert fragments.get_paragraphs(
+        contents
+    ) == fragments.get_paragraphs_with_commonmark(contents)
+
+
+def create_book():
+    """Create a book with many chapters of plain paragraphs."""
+    return "\n\n".join(
+        "## Chapter " + str(chapter) + "\n\n" + "A sentence of plain words.\n" * 5
+        for chapter in range(500)
+    )
+
+
+def test_extract_paragraphs_of_book_matches_commonmark():
+    """Check that extracting the paragraphs of a book matches commonmark."""
+    book = create_book()
+    assert paragraphs.extract_paragraphs(
+        book
+    ) == fragments.get_paragraphs_with_commonmark(book)
+
+
+@pytest.mark.benchmark
+def test_benchmark_extract_paragraphs_faster_than_commonmark():
+    """Benchmark extracting the paragraphs of a book with the extractor and commonmark."""
+    book = create_book()
+    extractor_time = min(
+        timeit.repeat(lambda: paragraphs.extract_paragraphs(book), number=2, repeat=3)
+    )
+    commonmark_time = min(
+        timeit.repeat(
+            lambda: fragments.get_paragraphs_with_commonmark(book), number=2, repeat=3
+        )
+    )
+    assert extractor_time < commonmark_time
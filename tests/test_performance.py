@@ -0,0 +1,142 @@
+"""Test cases for the performance module."""
+
+import os
+
+import pytest
+
+from gator import constants
+from gator import performance
+from gator import run
+
+
+@pytest.mark.parametrize(
+    "values, percentile, expected_percentile",
+    [
+        ([], 50, None),
+        ([3.0], 95, 3.0),
+        ([3.0, 1.0, 2.0], 50, 2.0),
+        ([1.0, 2.0, 3.0, 4.0], 50, 2.5),
+        ([1.0, 2.0, 3.0, 4.0, 5.0], 0, 1.0),
+        ([1.0, 2.0, 3.0, 4.0, 5.0], 100, 5.0),
+        ([1.0, 2.0, 3.0, 4.0, 5.0], 75, 4.0),
+    ],
+)
+def test_get_percentile(values, percentile, expected_percentile):
+    """Check that the percentile interpolates between the closest values."""
+    assert performance.get_percentile(values, percentile) == expected_percentile
+
+
+@pytest.mark.parametrize(
+    "number, expected_ordinal",
+    [(1, "1st"), (2, "2nd"), (3, "3rd"), (11, "11th"), (50, "50th"), (95, "95th")],
+)
+def test_get_ordinal(number, expected_ordinal):
+    """Check that the ordinal of a number has the correct suffix."""
+    assert performance.get_ordinal(number) == expected_ordinal
+
+
+def create_measurement(wall, cpu, memory):
+    """Create a measurement with the wall time, CPU time, and memory."""
+    return {
+        constants.usages.Wall: wall,
+        constants.usages.Cpu: cpu,
+        constants.usages.Memory: memory,
+    }
+
+
+def test_get_exceeded_thresholds():
+    """Check that only the measures above their thresholds are exceeded."""
+    measurements = [
+        create_measurement(1.0, 0.5, 100.0),
+        create_measurement(3.0, 0.5, 100.0),
+        create_measurement(2.0, 0.5, 300.0),
+    ]
+    thresholds = performance.create_thresholds(wall=1.5, cpu=1.0, memory=256)
+    assert performance.get_exceeded_thresholds(measurements, thresholds, 50) == [
+        constants.usages.Wall
+    ]
+    assert performance.get_exceeded_thresholds(measurements, thresholds, 100) == [
+        constants.usages.Wall,
+        constants.usages.Memory,
+    ]
+    assert performance.get_exceeded_thresholds(measurements, {}, 50) == []
+
+
+def test_get_exceeded_thresholds_without_reported_measure():
+    """Check that a measure that was not reported exceeds its threshold."""
+    measurements = [create_measurement(1.0, None, None)]
+    thresholds = performance.create_thresholds(cpu=1.0)
+    assert performance.get_exceeded_thresholds(measurements, thresholds, 50) == [
+        constants.usages.Cpu
+    ]
+
+
+def test_describe_thresholds_and_distribution():
+    """Check that the descriptions include the thresholds and the distribution."""
+    thresholds = performance.create_thresholds(wall=2.0, memory=256)
+    assert performance.describe_thresholds(thresholds) == (
+        "2.0s wall time, 256 MB peak memory"
+    )
+    measurements = [
+        create_measurement(1.0, None, None),
+        create_measurement(3.0, None, None),
+    ]
+    description = performance.describe_distribution(measurements, 50)
+    assert "wall time of 2.000s at the 50th percentile" in description
+    assert "minimum 1.000s" in description
+    assert "maximum 3.000s" in description
+    assert "over 2 run(s)" in description
+    assert "CPU time" not in description
+
+
+def test_measure_command_ignores_warmup_runs():
+    """Check that only the measured runs of a command are returned."""
+    run.reset_usages()
+    measurements, code = performance.measure_command('echo "Hello!"', 3, 2)
+    assert code == 0
+    assert len(measurements) == 3
+    assert len(run.get_usages()) == 5
+    assert all(measurement[constants.usages.Wall] > 0 for measurement in measurements)
+    run.reset_usages()
+
+
+@pytest.mark.skipif(not hasattr(os, "wait4"), reason="requires os.wait4")
+def test_measure_command_reports_cpu_time_and_memory():
+    """Check that the CPU time and memory of a command are measured."""
+    measurements, code = performance.measure_command(
+        "python3 -c 'data = bytearray(64 * 1024 * 1024)'", 1, 0
+    )
+    assert code == 0
+    assert measurements[0][constants.usages.Cpu] > 0
+    assert measurements[0][constants.usages.Memory] > 64
+    run.reset_usages()
+
+
+@pytest.mark.skipif(not hasattr(os, "posix_spawn"), reason="requires os.posix_spawn")
+def test_measure_command_excludes_memory_of_gatorgrader():
+    """Check that the memory of a command does not include the memory of GatorGrader."""
+    # use much more memory than the command, writing every page so that it is resident
+    ballast = b"x" * (128 * 1024 * 1024)
+    measurements, code = performance.measure_command("true", 1, 0)
+    assert code == 0
+    assert measurements[0][constants.usages.Memory] < 16
+    assert len(ballast) > 0
+    run.reset_usages()
+
+
+def test_measure_command_reports_failing_run():
+    """Check that a failing command returns its error code."""
+    _, code = performance.measure_command("willnotwork", 1, 0)
+    assert code != 0
+    run.reset_usages()
+
+
+def test_measure_command_uses_new_processes():
+    """Check that the measurements do not use the long-lived shells."""
+    previous_backend = run.set_backend(constants.backends.Shell)
+    try:
+        performance.measure_command('echo "Hello!"', 1, 0)
+        assert run.BACKEND == constants.backends.Shell
+    finally:
+        run.set_backend(previous_backend)
+    run.reset_usages()
@@ -74,3 +74,53 @@ def test_output_json(reset_results_dictionary):
     assert f'"{constants.results.Description}":' in output
     assert f'"{constants.results.Outcome}":' in output
     assert f'"{constants.results.Diagnostic}":' in output
+
+
+# pylint: disable=unused-argument
+# pylint: disable=redefined-outer-name
+def test_set_usage_attaches_to_result(reset_results_dictionary):
+    """Set the usage of a command and check that it is in the JSON output."""
+    assert report.set_usage({constants.usages.Wall: 1.5}) is None
+    report.set_result("Command executes", True, "")
+    report.set_usage({constants.usages.Wall: 1.5})
+    output = report.output(report.get_result(), report.JSON)
+    assert '"usage": {"wall": 1.5}' in output
+    # the textual output does not contain the usage of a single command
+    output = report.output(report.get_result(), report.TEXT)
+    assert "\n" not in output
+
+
+# pylint: disable=unused-argument
+# pylint: disable=redefined-outer-name
+def test_set_summary_adds_text_output(reset_results_dictionary):
+    """Set the summary of many commands and check that it is in the textual output."""
+    summary = {
+        constants.usages.Commands: 3,
+        constants.usages.Wall: 2.0,
+        constants.usages.User: 1.25,
+        constants.usages.System: 0.5,
+        constants.usages.Memory: 2048,
+        constants.usages.Slowest: "gradle build",
+    }
+    report.set_result("Command executes", False, "Found an error")
+    report.set_summary(summary)
+    output = report.output(report.get_result(), report.TEXT)
+    assert output.count("\n") == 2
+    assert "Ran 3 command(s) in 2.000s" in output
+    assert "2048 KB" in output
+    assert "'gradle build'" in output
+
+
+def test_output_summary_without_memory():
+    """Check that the summary leaves out the memory when it is not known."""
+    summary = {
+        constants.usages.Commands: 2,
+        constants.usages.Wall: 1.0,
+        constants.usages.User: 0.5,
+        constants.usages.System: 0.25,
+        constants.usages.Memory: None,
+        constants.usages.Slowest: "true",
+    }
+    output = report.output_summary(summary)
+    assert "(0.500s user, 0.250s system);" in output
+    assert "memory" not in output
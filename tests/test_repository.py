@@ -2,11 +2,25 @@
 
 import sys
 
+import pytest
+
 from git import Repo
 
+from gator import constants
 from gator import repository
 
 
+@pytest.fixture(
+    autouse=True,
+    params=[constants.gitbackends.Cli, constants.gitbackends.GitPython],
+)
+def git_backend(request):
+    """Run each test case with each of the backends that inspect Git repositories."""
+    previous_backend = repository.set_backend(request.param)
+    yield request.param
+    repository.set_backend(previous_backend)
+
+
 def test_repository_not_zero_commits():
     """Check to ensure that GatorGrader's repository registers."""
     commits = repository.get_commits(".")
@@ -98,3 +112,98 @@ def test_one_commit_in_new_repository(tmpdir):
     # since an empty file was committed, the count should be 1
     commits = repository.get_commits(str(tmpdir))
     assert len(commits) == 1
+
+
+def test_get_repository_not_git_repository(tmpdir):
+    """Ensure that there is no repository for a directory that is not one."""
+    assert repository.get_repository(str(tmpdir)) is None
+    assert repository.get_repository(str(tmpdir.join("missing"))) is None
+
+
+def test_commit_count_matches_commits():
+    """Ensure that counting the commits agrees with the list of commits."""
+    commits = repository.get_commits(".")
+    assert repository.get_commit_count(".") == len(commits)
+
+
+def test_commit_count_not_repository_or_no_commits(tmpdir):
+    """Ensure that there are no commits to count without a repository or commits."""
+    assert repository.get_commit_count(str(tmpdir)) == 0
+    _ = Repo.init(str(tmpdir))
+    assert repository.get_commit_count(str(tmpdir)) == 0
+
+
+def test_commit_count_in_new_repository(tmpdir):
+    """Ensure that counting detects the commits in a new Git repository."""
+    create_repository_with_commits(tmpdir, 3)
+    assert repository.get_commit_count(str(tmpdir)) == 3
+    valid, count = repository.commits_greater_than_count(str(tmpdir), 3, True)
+    assert valid is True
+    assert count == 3
+
+
+def create_repository_with_commits(tmpdir, number_commits):
+    """Create a Git repository in the directory with the number of commits."""
+    temp_file = tmpdir.join("hello.txt")
+    testing_repository = Repo.init(tmpdir)
+    for number in range(number_commits):
+        temp_file.write("content " + str(number))
+        testing_repository.index.add([str(temp_file)])
+        testing_repository.index.commit("Change the hello.txt file.")
+    return testing_repository
+
+
+def test_backends_return_identical_results(tmpdir):
+    """Ensure that the backends agree about repositories and their commits."""
+    testing_repository = create_repository_with_commits(tmpdir, 4)
+    subdirectory = str(tmpdir.mkdir("sub"))
+    results = {}
+    for backend in [constants.gitbackends.Cli, constants.gitbackends.GitPython]:
+        repository.set_backend(backend)
+        results[backend] = (
+            repository.is_git_repository(str(tmpdir)),
+            repository.is_git_repository(subdirectory),
+            repository.get_commits(str(tmpdir)),
+            repository.get_commit_count(str(tmpdir)),
+            repository.get_commit_count("."),
+        )
+    assert (
+        results[constants.gitbackends.Cli] == results[constants.gitbackends.GitPython]
+    )
+    assert results[constants.gitbackends.Cli][1] is False
+    assert (
+        results[constants.gitbackends.Cli][2][0]
+        == testing_repository.head.commit.hexsha
+    )
+
+
+def test_choose_backend_uses_environment_variable(monkeypatch):
+    """Ensure that the environment variable chooses the backend."""
+    monkeypatch.setenv(
+        constants.environmentvariables.Git_Backend, constants.gitbackends.GitPython
+    )
+    assert repository.choose_backend() == constants.gitbackends.GitPython
+    monkeypatch.delenv(constants.environmentvariables.Git_Backend)
+    assert repository.choose_backend() == constants.gitbackends.Cli
+
+
+def test_run_git_without_repository(tmpdir):
+    """Ensure that running git fails outside of a repository or directory."""
+    assert repository.run_git(str(tmpdir), "rev-parse", "--git-dir") is None
+    assert repository.run_git(str(tmpdir.join("missing")), "status") is None
+
+
+def test_commit_counts_for_many_repositories(tmpdir):
+    """Ensure that the commits of many repositories are counted concurrently."""
+    repository_paths = []
+    for number_commits in range(5):
+        repository_directory = tmpdir.mkdir("repository" + str(number_commits))
+        create_repository_with_commits(repository_directory, number_commits)
+        repository_paths.append(str(repository_directory))
+    repository_paths.append(str(tmpdir.join("missing")))
+    commit_counts = repository.get_commit_counts(repository_paths, limit=2)
+    assert list(commit_counts) == repository_paths
+    assert list(commit_counts.values()) == [0, 1, 2, 3, 4, 0]
+    # the counts agree with counting each repository on its own
+    for repository_path, commit_count in commit_counts.items():
+        assert repository.get_commit_count(repository_path) == commit_count
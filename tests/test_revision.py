@@ -0,0 +1,190 @@
+"""Test cases for the revision module."""
+
+import os
+
+import pytest
+
+from git import Repo
+
+from gator import files
+from gator import fragments
+from gator import revision
+
+
+@pytest.fixture
+def revision_repository(tmpdir):
+    """Create a Git repository with a commit and then change its working tree."""
+    testing_repository = Repo.init(str(tmpdir))
+    tmpdir.join("README.md").write("First paragraph.\n\nSecond paragraph.\n")
+    tmpdir.join(".hidden.md").write("Hidden.\n")
+    source_directory = tmpdir.mkdir("src")
+    source_directory.join("hello.py").write("print('hello')\nprint('world')\n")
+    source_directory.mkdir("nested").join("deep.py").write("pass\n")
+    testing_repository.index.add(
+        ["README.md", ".hidden.md", "src/hello.py", "src/nested/deep.py"]
+    )
+    first_commit = testing_repository.index.commit("Add the first files")
+    # the working tree no longer has the files of the first commit
+    tmpdir.join("README.md").write("Only one paragraph.\n")
+    source_directory.join("hello.py").remove()
+    source_directory.join("added.py").write("pass\n")
+    return tmpdir, first_commit.hexsha
+
+
+@pytest.fixture
+def revision_tree(revision_repository):
+    """Check the files of the first commit and stop afterward."""
+    directory, commit = revision_repository
+    tree = revision.create_tree(commit, str(directory))
+    previous_tree = files.set_revision_tree(tree)
+    yield directory, tree
+    files.set_revision_tree(previous_tree)
+
+
+# pylint: disable=redefined-outer-name
+def test_create_tree_resolves_revisions(revision_repository):
+    """Check that a revision resolves to its commit in the repository."""
+    directory, commit = revision_repository
+    tree = revision.create_tree("HEAD", str(directory.join("src")))
+    assert tree.commit == commit
+    assert tree.toplevel == os.path.realpath(str(directory))
+    assert revision.create_tree("not-a-revision", str(directory)) is None
+
+
+def test_create_tree_without_repository(tmpdir):
+    """Check that there is no tree outside of a repository."""
+    assert revision.get_toplevel(str(tmpdir)) is None
+    assert revision.create_tree("HEAD", str(tmpdir)) is None
+
+
+@pytest.mark.parametrize(
+    "file, home, expected_names",
+    [
+        ("README.md", "", ["README.md"]),
+        ("*.md", "", ["README.md"]),
+        (".*.md", "", [".hidden.md"]),
+        ("*.py", "src", ["hello.py"]),
+        ("*", "src", ["hello.py", "nested"]),
+        ("*.py", "src/nested", ["deep.py"]),
+        ("**/*.py", "", ["deep.py", "hello.py"]),
+        ("**/*.py", "src", ["deep.py", "hello.py"]),
+        ("**", "src", ["deep.py", "hello.py", "nested"]),
+        ("added.py", "src", []),
+        ("*.py", "missing", []),
+    ],
+)
+def test_create_paths_matches_commit(revision_tree, file, home, expected_names):
+    """Check that globs are matched against the files in the commit."""
+    directory, _ = revision_tree
+    paths = files.create_paths(file=file, home=str(directory.join(home)))
+    assert sorted(path.name for path in paths) == expected_names
+
+
+def test_create_paths_outside_repository(revision_tree, tmpdir_factory):
+    """Check that a path outside of the repository is not in the tree."""
+    outside_directory = tmpdir_factory.mktemp("outside")
+    outside_directory.join("README.md").write("Outside.\n")
+    assert files.create_paths(file="README.md", home=str(outside_directory)) == []
+
+
+def test_read_text_from_commit(revision_tree):
+    """Check that the contents of a file are read from the commit."""
+    directory, tree = revision_tree
+    (readme_path,) = files.create_paths(file="README.md", home=str(directory))
+    assert readme_path.is_file() is True
+    assert readme_path.read_text() == "First paragraph.\n\nSecond paragraph.\n"
+    assert readme_path.read_bytes() == readme_path.read_text().encode()
+    assert str(readme_path) == "README.md"
+    assert tree.commit in repr(readme_path)
+    (nested_path,) = files.create_paths(file="nested", home=str(directory.join("src")))
+    assert nested_path.is_dir() is True
+    assert nested_path.is_file() is False
+
+
+def test_paths_in_commit_are_sorted_by_name(revision_tree):
+    """Check that the paths in a commit can be sorted like a Path."""
+    directory, _ = revision_tree
+    paths = files.create_paths(file="**", home=str(directory.join("src")))
+    assert [str(path) for path in sorted(paths)] == [
+        "src/hello.py",
+        "src/nested",
+        "src/nested/deep.py",
+    ]
+
+
+def test_file_checks_use_commit(revision_tree):
+    """Check that the file checks see the files of the commit."""
+    directory, _ = revision_tree
+    assert (
+        files.check_file_in_directory(file="hello.py", home=str(directory.join("src")))
+        is True
+    )
+    assert (
+        files.check_file_in_directory(file="added.py", home=str(directory.join("src")))
+        is False
+    )
+    line_count, _ = fragments.count_lines("hello.py", str(directory.join("src")))
+    assert line_count == 2
+
+
+def test_find_missing_files_in_commit(revision_tree):
+    """Check that the required files in sub-directories of the commit are found."""
+    directory, _ = revision_tree
+    required_files = [
+        "README.md",
+        "src/hello.py",
+        "src/nested/deep.py",
+        "src/added.py",
+        "src",
+        "readme.md",
+    ]
+    missing_files = files.find_missing_files(
+        required_files=required_files, home=str(directory)
+    )
+    assert missing_files == ["src/added.py", "src", "readme.md"]
+
+
+def test_use_revision_sets_tree(revision_repository, monkeypatch):
+    """Check that using a revision makes the file checks read its tree."""
+    directory, commit = revision_repository
+    monkeypatch.chdir(directory)
+    try:
+        tree = revision.use_revision(commit)
+        assert files.revision_tree is tree
+        assert tree.commit == commit
+    finally:
+        files.set_revision_tree(None)
+
+
+def test_read_blobs_with_one_process(revision_repository, monkeypatch):
+    """Check that every blob of a repository is read by the same process."""
+    directory, commit = revision_repository
+    started_readers = []
+    blob_reader = revision.BlobReader
+
+    def record_blob_reader(toplevel):
+        """Record the start of a process that reads blobs."""
+        started_readers.append(toplevel)
+        return blob_reader(toplevel)
+
+    monkeypatch.setattr(revision, "BlobReader", record_blob_reader)
+    revision.close_blob_readers()
+    tree = revision.create_tree(commit, str(directory))
+    contents = [path.read_bytes() for path in tree.paths.values() if path.is_file()]
+    assert len(contents) == 4
+    assert b"print('hello')\nprint('world')\n" in contents
+    assert started_readers == [tree.toplevel]
+    revision.close_blob_readers()
+
+
+def test_read_bytes_of_binary_file(tmpdir):
+    """Check that the contents of a binary file are read without changing them."""
+    testing_repository = Repo.init(str(tmpdir))
+    binary_contents = bytes(range(256)) + b"\r\n\xff\xfe"
+    tmpdir.join("image.png").write_binary(binary_contents)
+    testing_repository.index.add(["image.png"])
+    commit = testing_repository.index.commit("Add a binary file")
+    tree = revision.create_tree(commit.hexsha, str(tmpdir))
+    assert tree.paths["image.png"].read_bytes() == binary_contents
+    with pytest.raises(UnicodeDecodeError):
+        tree.paths["image.png"].read_text()
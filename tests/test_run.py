@@ -1,7 +1,14 @@
 """Test cases for the run module."""
 
+import asyncio
+import os
 import platform
+import statistics
+import time
 
+import pytest
+
+from gator import constants
 from gator import run
 
 # define the operating systems on which to run processes
@@ -72,3 +79,234 @@ def test_run_invalid_output_str():
     randomString = "Hello"
     output = run.get_actual_output(randomString)
     assert randomString in output
+
+
+@pytest.mark.skipif(os.name != run.POSIX, reason="requires a POSIX system")
+@pytest.mark.parametrize(
+    "command, expected_program, expected_arguments",
+    [
+        ('echo "Hello!"', "echo", ["Hello!"]),
+        ("ls -l --color=never", "ls", ["-l", "--color=never"]),
+        ("echo 'single quoted'", "echo", ["single quoted"]),
+    ],
+)
+def test_direct_arguments_for_simple_commands(
+    command, expected_program, expected_arguments
+):
+    """Check that a command without shell features is split into its arguments."""
+    arguments = run.get_direct_arguments(command)
+    assert arguments is not None
+    assert os.path.isabs(arguments[0])
+    assert os.path.basename(arguments[0]) == expected_program
+    assert arguments[1:] == expected_arguments
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        "ls | wc -l",
+        "echo $HOME",
+        "echo hello > output.txt",
+        "ls *.py",
+        "true && false",
+        "cd /tmp",
+        "export NAME=value",
+        "NAME=value env",
+        "echo `date`",
+        "ls ~",
+        'echo "unterminated',
+        "willnotwork",
+        "",
+    ],
+)
+def test_direct_arguments_not_created_for_shell_commands(command):
+    """Check that a command that needs the shell is not split into arguments."""
+    assert run.get_direct_arguments(command) is None
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        'echo "Hello!"',
+        "echo 'a   b' c",
+        "ls /nonexistent-gatorgrader-directory",
+        "willnotwork",
+        "echo first | tr a-z A-Z",
+    ],
+)
+def test_run_process_matches_shell(command):
+    """Check that running a command directly produces the same result as the shell."""
+    direct_output, direct_error, direct_code = run.run_process(command)
+    shell_output, shell_error, shell_code = run.run_shell_process(command)
+    assert direct_output == shell_output
+    assert direct_code == shell_code
+    assert (direct_error == b"") == (shell_error == b"")
+
+
+def median_spawn_latency(function, argument, repetitions=25):
+    """Return the median time taken to call the function with the argument."""
+    timings = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        function(argument)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(os.name != run.POSIX, reason="requires a POSIX system")
+def test_benchmark_direct_spawn_latency_below_shell():
+    """Benchmark the latency of spawning a command directly and through the shell."""
+    arguments = run.get_direct_arguments("cat /dev/null")
+    assert arguments is not None
+    # warm up the file system caches for both the shell and the program
+    run.run_direct_process(arguments)
+    run.run_shell_process("cat /dev/null")
+    direct_latency = median_spawn_latency(run.run_direct_process, arguments)
+    shell_latency = median_spawn_latency(run.run_shell_process, "cat /dev/null")
+    # the shell must start before it launches the program, so a direct spawn
+    # should not be slower, allowing for some noise in the timings
+    latency_ratio = direct_latency / shell_latency
+    assert latency_ratio <= 1.25, "direct spawn takes %.2fx the time" % latency_ratio
+
+
+def test_gather_with_limit_respects_limit():
+    """Check that no more than the limit of awaitables run at the same time."""
+    running = []
+    most_running = []
+
+    async def record_running():
+        """Record how many of the awaitables are running at once."""
+        running.append(1)
+        most_running.append(len(running))
+        await asyncio.sleep(0.01)
+        running.pop()
+        return len(most_running)
+
+    results = asyncio.run(
+        run.gather_with_limit([record_running() for _ in range(9)], 3)
+    )
+    assert len(results) == 9
+    assert max(most_running) == 3
+
+
+def test_run_command_records_usage():
+    """Check that running a command records the resources that it used."""
+    run.reset_usages()
+    run.run_command("echo first")
+    run.run_command("willnotwork")
+    usages = run.get_usages()
+    assert len(usages) == 2
+    assert run.get_last_usage() is usages[-1]
+    assert usages[0][constants.usages.Command] == "echo first"
+    assert usages[1][constants.usages.Command] == "willnotwork"
+    for usage in usages:
+        assert usage[constants.usages.Wall] > 0
+        assert usage[constants.usages.Cached] is False
+        if hasattr(os, "wait4"):
+            assert usage[constants.usages.User] >= 0
+            assert usage[constants.usages.System] >= 0
+            # the memory is only known when it is more than GatorGrader used
+            assert (
+                usage[constants.usages.Memory] is None
+                or usage[constants.usages.Memory] > 0
+            )
+    run.reset_usages()
+    assert run.get_last_usage() is None
+
+
+@pytest.mark.skipif(not hasattr(os, "wait4"), reason="requires os.wait4")
+def test_run_command_does_not_record_inherited_memory():
+    """Check that the memory of a command does not include the memory of GatorGrader."""
+    # use much more memory than the command, writing every page so that it is resident
+    ballast = b"x" * (128 * 1024 * 1024)
+    run.reset_usages()
+    run.run_command("true")
+    assert run.get_last_usage()[constants.usages.Memory] is None
+    assert len(ballast) > 0
+    run.reset_usages()
+
+
+@pytest.mark.skipif(not hasattr(os, "wait4"), reason="requires os.wait4")
+def test_run_command_records_cpu_time_of_shell_children():
+    """Check that the CPU time includes the programs started by the shell."""
+    run.reset_usages()
+    command = "python3 -c 'sum(range(3000000))' | cat"
+    output, error, code = run.run_command(command)
+    assert code == 0
+    usage = run.get_last_usage()
+    assert usage[constants.usages.User] + usage[constants.usages.System] > 0.01
+    run.reset_usages()
+
+
+def test_summarize_usages():
+    """Check that the summary adds the times and finds the slowest command."""
+    run.reset_usages()
+    run.record_usage("fast", 0.5)
+    run.record_usage("slow", 2.0)
+    summary = run.summarize_usages()
+    assert summary[constants.usages.Commands] == 2
+    assert summary[constants.usages.Wall] == 2.5
+    assert summary[constants.usages.User] == 0
+    assert summary[constants.usages.Memory] is None
+    assert summary[constants.usages.Slowest] == "slow"
+    run.reset_usages()
+    summary = run.summarize_usages()
+    assert summary[constants.usages.Commands] == 0
+    assert summary[constants.usages.Slowest] is None
+
+
+def test_create_limits_omits_missing_limits():
+    """Check that only the limits that were given are created."""
+    assert run.create_limits() == {}
+    limits = run.create_limits(cpu=1, files=16)
+    assert limits == {constants.limits.Cpu: 1, constants.limits.Files: 16}
+    assert run.create_limiter({}) is None
+
+
+LOOP_FOREVER = "python3 -c 'while True: pass'"
+
+
+@pytest.mark.skipif(os.name != run.POSIX, reason="requires a POSIX system")
+@pytest.mark.parametrize("command", [LOOP_FOREVER, LOOP_FOREVER + " && echo done"])
+def test_run_command_with_cpu_limit_stops_command(command):
+    """Check that a command that never finishes is stopped by its CPU limit."""
+    limits = run.create_limits(cpu=1)
+    output, error, code = run.run_command(command, limits=limits)
+    assert output == b""
+    assert code != 0
+    assert run.get_limit_violation(limits, error, code) == constants.limits.Cpu
+
+
+@pytest.mark.skipif(os.name != run.POSIX, reason="requires a POSIX system")
+def test_run_command_with_files_limit_reports_violation():
+    """Check that a command that opens too many files violates its limit."""
+    limits = run.create_limits(files=16)
+    command = "python3 -c \"files = [open('/dev/null') for _ in range(64)]\""
+    _, error, code = run.run_command(command, limits=limits)
+    assert code != 0
+    assert run.get_limit_violation(limits, error, code) == constants.limits.Files
+    # the same command works without the limit
+    _, error, code = run.run_command(command)
+    assert code == 0
+    assert run.get_limit_violation({}, error, code) is None
+
+
+@pytest.mark.skipif(os.name != run.POSIX, reason="requires a POSIX system")
+def test_run_command_with_memory_limit_reports_violation():
+    """Check that a command that allocates too much memory violates its limit."""
+    limits = run.create_limits(memory=256)
+    command = "python3 -c 'data = bytearray(1024 * 1024 * 1024)'"
+    _, error, code = run.run_command(command, limits=limits)
+    assert code != 0
+    assert run.get_limit_violation(limits, error, code) == constants.limits.Memory
+
+
+@pytest.mark.skipif(os.name != run.POSIX, reason="requires a POSIX system")
+def test_run_command_within_limits_works():
+    """Check that a command that stays within its limits is not affected by them."""
+    limits = run.create_limits(cpu=5, memory=512, files=64)
+    output, error, code = run.run_command('echo "Hello!"', limits=limits)
+    assert output == b"Hello!\n"
+    assert code == 0
+    assert run.get_limit_violation(limits, error, code) is None
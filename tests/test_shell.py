@@ -0,0 +1,114 @@
+"""Test cases for the shell module."""
+
+import os
+
+import pytest
+
+from gator import constants
+from gator import run
+from gator import shell
+
+pytestmark = pytest.mark.skipif(os.name != run.POSIX, reason="requires a POSIX system")
+
+
+@pytest.fixture
+def stop_all_shells():
+    """Stop all of the long-lived shells after a test case."""
+    yield
+    shell.stop_shells()
+
+
+# pylint: disable=unused-argument
+# pylint: disable=redefined-outer-name
+def test_run_command_returns_output_error_and_code(stop_all_shells):
+    """Check that the output, error, and return code of a command are separated."""
+    output, error, code = shell.run_command("echo out; echo err >&2; exit 3")
+    assert output == b"out\n"
+    assert error == b"err\n"
+    assert code == 3
+
+
+def test_run_command_without_trailing_newline(stop_all_shells):
+    """Check that output without a trailing newline is returned exactly."""
+    output, error, code = shell.run_command("printf hello")
+    assert output == b"hello"
+    assert error == b""
+    assert code == 0
+
+
+def test_run_command_matches_new_process(stop_all_shells, tmpdir):
+    """Check that the shell produces the same results as a new process."""
+    tmpdir.join("hello.txt").write("hello\nworld\n")
+    for command in ["cat hello.txt", "grep -c o hello.txt", "ls", "willnotwork"]:
+        shell_output, shell_error, shell_code = shell.run_command(command, str(tmpdir))
+        process_output, process_error, process_code = run.run_shell_process(
+            "cd " + str(tmpdir) + " && " + command
+        )
+        assert shell_output == process_output
+        assert shell_code == process_code
+        assert (shell_error == b"") == (process_error == b"")
+
+
+def test_run_command_reuses_shell(stop_all_shells, tmpdir):
+    """Check that the commands for a directory run in the same shell."""
+    first_output, _, _ = shell.run_command("echo $PPID", str(tmpdir))
+    second_output, _, _ = shell.run_command("echo $PPID", str(tmpdir))
+    assert first_output == second_output
+    assert len(shell.shells) == 1
+
+
+def test_run_command_cannot_change_shell_state(stop_all_shells, tmpdir):
+    """Check that a command cannot change the directory or stop its shell."""
+    shell.run_command("cd /", str(tmpdir))
+    output, _, _ = shell.run_command("pwd", str(tmpdir))
+    assert output.decode().strip() == os.path.realpath(str(tmpdir))
+    _, _, code = shell.run_command("exit 5", str(tmpdir))
+    assert code == 5
+    output, _, code = shell.run_command("echo alive", str(tmpdir))
+    assert output == b"alive\n"
+    assert code == 0
+
+
+def test_run_command_with_syntax_error(stop_all_shells):
+    """Check that a command with a syntax error does not stop its shell."""
+    _, error, code = shell.run_command('echo "unterminated')
+    assert error != b""
+    assert code != 0
+    output, _, _ = shell.run_command("echo fine")
+    assert output == b"fine\n"
+
+
+def test_run_command_with_sentinel_like_output(stop_all_shells):
+    """Check that output that looks like framing does not end the results early."""
+    output, _, code = shell.run_command("echo '0 1'; echo done")
+    assert output == b"0 1\ndone\n"
+    assert code == 0
+
+
+def test_hung_command_restarts_shell(stop_all_shells, tmpdir):
+    """Check that a hung command is stopped and its shell is restarted."""
+    _, error, code = shell.run_command("sleep 30", str(tmpdir), timeout=0.5)
+    assert code == constants.codes.Timeout
+    assert error != b""
+    assert str(tmpdir) not in shell.shells
+    output, _, code = shell.run_command("echo restarted", str(tmpdir))
+    assert output == b"restarted\n"
+    assert code == 0
+
+
+def test_stop_shell_without_shell():
+    """Check that stopping a shell that was never started does nothing."""
+    assert shell.stop_shell("/not/a/started/shell") is False
+
+
+def test_run_command_with_shell_backend(stop_all_shells):
+    """Check that the shell backend is used by the run module when it is chosen."""
+    previous_backend = run.set_backend(constants.backends.Shell)
+    try:
+        output, error, code = run.run_command('echo "Hello!"')
+        assert len(shell.shells) == 1
+    finally:
+        run.set_backend(previous_backend)
+    assert output == b"Hello!\n"
+    assert error == b""
+    assert code == 0
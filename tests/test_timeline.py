@@ -0,0 +1,137 @@
+"""Test cases for the timeline module."""
+
+import os
+import sys
+
+import pytest
+
+from git import Repo
+
+from gator import files
+from gator import timeline
+
+README_CHECK = [
+    "CountFileParagraphs",
+    "--file",
+    "README.md",
+    "--directory",
+    ".",
+    "--count",
+    "3",
+]
+
+PROGRAM_CHECK = [
+    "ConfirmFileExists",
+    "--file",
+    "hello.py",
+    "--directory",
+    "src",
+]
+
+
+@pytest.fixture
+def history_directory(tmpdir, monkeypatch):
+    """Load the internal checks from GatorGrader and check files in a new directory."""
+    monkeypatch.setattr(sys, "argv", [os.getcwd()])
+    monkeypatch.chdir(tmpdir)
+    return tmpdir
+
+
+def create_repository_with_history(directory):
+    """Create a Git repository whose README gains one paragraph in every other commit."""
+    testing_repository = Repo.init(str(directory))
+    source_directory = directory.mkdir("src")
+    paragraphs = []
+    changes = [
+        ("README.md", "First paragraph."),
+        ("notes.txt", "notes"),
+        ("README.md", "Second paragraph."),
+        ("src/hello.py", "print('hello')"),
+        ("README.md", "Third paragraph."),
+        ("notes.txt", "more notes"),
+    ]
+    for file_name, contents in changes:
+        if file_name == "README.md":
+            paragraphs.append(contents)
+            contents = "\n\n".join(paragraphs)
+        directory.join(file_name).write(contents + "\n")
+        testing_repository.index.add([file_name])
+        testing_repository.index.commit("Change " + file_name)
+    assert source_directory.isdir()
+    return testing_repository
+
+
+def test_history_commits_with_step(tmpdir):
+    """Check that every step-th commit is chosen, always ending at HEAD."""
+    testing_repository = create_repository_with_history(tmpdir)
+    head = testing_repository.head.commit.hexsha
+    all_commits = timeline.get_history_commits(str(tmpdir))
+    assert len(all_commits) == 6
+    assert all_commits[-1] == head
+    chosen_commits = timeline.get_history_commits(str(tmpdir), 4)
+    assert chosen_commits == [all_commits[0], all_commits[4], head]
+
+
+# pylint: disable=redefined-outer-name
+def test_check_history_produces_matrix(history_directory):
+    """Check that the outcome of each check is found at every commit."""
+    create_repository_with_history(history_directory)
+    history_results = timeline.check_history([README_CHECK, PROGRAM_CHECK])
+    outcomes = [history_result[timeline.OUTCOMES] for history_result in history_results]
+    assert outcomes == [
+        [False, False],
+        [False, False],
+        [False, False],
+        [False, True],
+        [True, True],
+        [True, True],
+    ]
+    # the working tree is checked again after the history is checked
+    assert files.revision_tree is None
+
+
+def test_check_history_reuses_unchanged_results(history_directory, monkeypatch):
+    """Check that a check is not performed again when its files did not change."""
+    create_repository_with_history(history_directory)
+    performed_checks = []
+    perform_check = timeline.perform_check
+
+    def count_performed_checks(loaded_check):
+        """Record each check that is performed."""
+        performed_checks.append(loaded_check)
+        return perform_check(loaded_check)
+
+    monkeypatch.setattr(timeline, "perform_check", count_performed_checks)
+    history_results = timeline.check_history([README_CHECK])
+    # the README only changed in the first, third, and fifth commits
+    assert len(performed_checks) == 3
+    assert [history_result[timeline.REUSED] for history_result in history_results] == [
+        0,
+        1,
+        0,
+        1,
+        0,
+        1,
+    ]
+
+
+def test_output_matrix_reports_first_passing_commits(history_directory):
+    """Check that the matrix has a row for each commit and a summary for each check."""
+    testing_repository = create_repository_with_history(history_directory)
+    checks = [
+        README_CHECK,
+        ["ConfirmFileExists", "--file", "missing.py", "--directory", "."],
+    ]
+    history_results = timeline.check_history(checks, step=2)
+    matrix = timeline.output_matrix(history_results, checks)
+    lines = matrix.split("\n")
+    assert len(lines) == len(history_results) + len(checks)
+    assert lines[-3].startswith(testing_repository.head.commit.hexsha[:7] + " ✔ ✘")
+    fifth_commit = history_results[2][timeline.COMMIT]
+    assert lines[-2].endswith(": first passed at " + fifth_commit[:7])
+    assert lines[-1].endswith(": never passed")
+
+
+def test_check_history_without_repository(tmpdir):
+    """Check that there is no history to check outside of a repository."""
+    assert timeline.check_history([README_CHECK], home=str(tmpdir)) == []
@@ -199,6 +199,21 @@ def test_relational_operator_exacted_false_exacted():
     assert relation_value == 100
 
 
+def test_count_limit_only_when_stopping_early_and_not_exact():
+    """Check that counting only stops early for a minimum number."""
+    assert util.get_count_limit(10) is None
+    assert util.get_count_limit(10, False, True) == 10
+    assert util.get_count_limit(10, True, True) is None
+    assert util.get_count_limit(10, True, False) is None
+
+
+def test_describe_count_that_stopped_at_the_limit():
+    """Check that a count that stopped at the limit is described as a minimum."""
+    assert util.describe_count(5) == "5"
+    assert util.describe_count(5, 10) == "5"
+    assert util.describe_count(10, 10) == "at least 10"
+
+
 def test_number_to_words_ordinal_and_cardinal():
     """Check to see if numbers can be converted to ordinal or cardinal words."""
     # note that ordinal is the default
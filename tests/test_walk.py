@@ -0,0 +1,213 @@
+"""Test cases for the walk module."""
+
+import glob
+import os
+
+import pytest
+
+from gator import files
+from gator import fragments
+from gator import walk
+
+
+@pytest.fixture
+def walk_directory(tmpdir, monkeypatch):
+    """Create a project with sources, hidden files, and directories to prune."""
+    tmpdir.join("README.md").write("Read me.\n")
+    tmpdir.join(".hidden.md").write("Hidden.\n")
+    source_directory = tmpdir.mkdir("src")
+    source_directory.join("Main.java").write("class Main {}\n")
+    source_directory.join("Helper.java").write("class Helper {}\n")
+    source_directory.mkdir("nested").join("Deep.java").write("class Deep {}\n")
+    source_directory.mkdir(".cache").join("Cached.java").write("class Cached {}\n")
+    tmpdir.mkdir("build").join("Built.java").write("class Built {}\n")
+    tmpdir.mkdir("node_modules").mkdir("package").join("Module.java").write("x\n")
+    tmpdir.mkdir("generated").join("Generated.java").write("class Generated {}\n")
+    monkeypatch.chdir(tmpdir)
+    return tmpdir
+
+
+def get_names(paths):
+    """Return the sorted names of the paths."""
+    return sorted(str(path) for path in paths)
+
+
+# pylint: disable=redefined-outer-name
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "*",
+        "*.md",
+        ".*",
+        "README.md",
+        "missing.md",
+        "src/*.java",
+        "src/*/*.java",
+        "*/*.java",
+        "src/[MH]*.java",
+        "src/?ain.java",
+        "src/nested",
+        "build/*.java",
+    ],
+)
+def test_iterate_glob_matches_like_glob(walk_directory, pattern):
+    """Check that a glob without "**" matches the same paths as glob."""
+    expected_paths = sorted(glob.glob(pattern))
+    assert get_names(walk.iterate_glob(pattern)) == expected_paths
+    absolute_pattern = os.path.join(str(walk_directory), pattern)
+    assert get_names(walk.iterate_glob(absolute_pattern)) == sorted(
+        glob.glob(absolute_pattern)
+    )
+
+
+@pytest.mark.parametrize(
+    "pattern", ["**/*.java", "src/**/*.java", "**/Deep.java", "src/**"]
+)
+def test_iterate_glob_matches_recursive_like_glob(walk_directory, pattern):
+    """Check that a glob with "**" matches the same paths as a recursive glob."""
+    expected_paths = sorted(
+        path.rstrip(os.sep)
+        for path in glob.glob(pattern, recursive=True)
+        if path.rstrip(os.sep) != "src"
+    )
+    assert get_names(walk.iterate_glob(pattern, excludes=())) == expected_paths
+
+
+def test_iterate_glob_prunes_excluded_directories(walk_directory, monkeypatch):
+    """Check that the excluded directories are never listed."""
+    scanned_directories = []
+    scan_directory = walk.scan_directory
+
+    def record_scan_directory(directory):
+        """Record each directory that is listed."""
+        scanned_directories.append(os.path.basename(directory))
+        return scan_directory(directory)
+
+    monkeypatch.setattr(walk, "scan_directory", record_scan_directory)
+    assert get_names(walk.iterate_glob("**/*.java")) == [
+        os.path.join("generated", "Generated.java"),
+        os.path.join("src", "Helper.java"),
+        os.path.join("src", "Main.java"),
+        os.path.join("src", "nested", "Deep.java"),
+    ]
+    assert "build" not in scanned_directories
+    assert "node_modules" not in scanned_directories
+    assert "package" not in scanned_directories
+    assert get_names(walk.iterate_glob("**/*.java", excludes=["src", "gen*"])) == [
+        os.path.join("build", "Built.java"),
+        os.path.join("node_modules", "package", "Module.java"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "*",
+        ".*",
+        "src/*.java",
+        "src/.cache/*.java",
+        "build/*.java",
+        "**/*.java",
+        "**/Deep.java",
+        "src/**/*.java",
+        "src/**",
+        "**/package/*.java",
+        "**",
+    ],
+)
+def test_match_paths_matches_like_walk(walk_directory, pattern):
+    """Check that matching a listing of paths matches the same paths as a walk."""
+    paths = {}
+    for directory, directory_names, file_names in os.walk(str(walk_directory)):
+        for name in directory_names + file_names:
+            path = os.path.relpath(os.path.join(directory, name), str(walk_directory))
+            paths[path.replace(os.sep, "/")] = path
+    pattern_parts = pattern.split("/")
+    assert sorted(walk.match_paths(paths, pattern_parts)) == get_names(
+        walk.iterate_glob(pattern)
+    )
+    assert sorted(walk.match_paths(paths, pattern_parts, excludes=())) == get_names(
+        walk.iterate_glob(pattern, excludes=())
+    )
+
+
+def test_iterate_glob_follows_gitignore(walk_directory):
+    """Check that the files and directories ignored by a .gitignore are pruned."""
+    walk_directory.join(".gitignore").write("# generated code\ngenerated/\n")
+    walk_directory.join("src", ".gitignore").write("Help*.java\n/nested\n")
+    assert get_names(walk.iterate_glob("**/*.java", gitignore=True)) == [
+        os.path.join("src", "Main.java")
+    ]
+    walk_directory.join("src", ".gitignore").write("*.java\n!Main.java\n")
+    assert get_names(walk.iterate_glob("**/*.java", gitignore=True)) == [
+        os.path.join("src", "Main.java")
+    ]
+    # the .gitignore is only used when it is requested
+    assert len(list(walk.iterate_glob("**/*.java"))) == 4
+
+
+def test_iterate_paths_is_lazy(walk_directory, monkeypatch):
+    """Check that the first path is yielded before the walk finishes."""
+    scanned_directories = []
+    scan_directory = walk.scan_directory
+
+    def record_scan_directory(directory):
+        """Record each directory that is listed."""
+        scanned_directories.append(directory)
+        return scan_directory(directory)
+
+    monkeypatch.setattr(walk, "scan_directory", record_scan_directory)
+    paths = files.iterate_paths(file="**/*.java", home=".")
+    next(paths)
+    assert len(scanned_directories) < 4
+    assert len(files.create_paths(file="**/*.java", home=".")) == 4
+
+
+def test_counting_does_not_list_paths(walk_directory, monkeypatch):
+    """Check that counting in the matched files iterates over the paths."""
+
+    def fail_create_paths(*args, file="", home):
+        """Fail when the paths are collected in a list."""
+        raise AssertionError("the paths were collected in a list")
+
+    monkeypatch.setattr(files, "create_paths", fail_create_paths)
+    line_count, _ = fragments.count_lines("**/*.java", ".")
+    assert line_count == 1
+    fragment_count, _ = fragments.count_entities(
+        "class", fragments.count_specified_fragment, "**/*.java", "."
+    )
+    assert fragment_count == 1
+    assert files.check_file_in_directory(file="README.md", home=".")
+
+
+def test_create_paths_uses_glob_options(walk_directory):
+    """Check that the options of the check change the files that a glob matches."""
+    walk_directory.join(".gitignore").write("generated/\n")
+    try:
+        files.set_glob_options(["nested"], True)
+        assert get_names(files.create_paths(file="**/*.java", home=".")) == [
+            os.path.join("src", "Helper.java"),
+            os.path.join("src", "Main.java"),
+        ]
+    finally:
+        files.set_glob_options()
+    assert len(files.create_paths(file="**/*.java", home=".")) == 4
+
+
+@pytest.mark.parametrize(
+    "rule, candidate, expected_match",
+    [
+        ("*.java", "Main.java", True),
+        ("*.java", "src/Main.java", False),
+        ("src/*.java", "src/Main.java", True),
+        ("src/**", "src/nested/Deep.java", True),
+        ("**/Deep.java", "Deep.java", True),
+        ("**/Deep.java", "src/nested/Deep.java", True),
+        ("[!M]*.java", "Main.java", False),
+        ("[!M]*.java", "Helper.java", True),
+        ("?ain.java", "Main.java", True),
+    ],
+)
+def test_translate_rule(rule, candidate, expected_match):
+    """Check that the rules of a .gitignore match like they do in Git."""
+    assert (walk.translate_rule(rule).match(candidate) is not None) is expected_match